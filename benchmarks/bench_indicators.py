@@ -0,0 +1,147 @@
+"""
+Benchmark the NumPy indicator engine against an equivalent pandas pipeline.
+
+The pandas reference reproduces what the app computed before the engine
+(rolling/ewm based SMA20, Wilder RSI and MACD/signal), so the numbers show
+the speedup on realistic history sizes.
+
+Usage:
+    python benchmarks/bench_indicators.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.indicator_sweeps import ma_crossover_grid, rsi_grid  # noqa: E402
+from utils.indicators import (  # noqa: E402
+    add_all_indicators,
+    add_panel_indicators,
+    macd,
+    rolling_argmax,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_quantile,
+    rolling_std,
+    rsi_wilder,
+    sma,
+)
+
+SIZES = {
+    "1y daily": 252,
+    "10y daily": 2520,
+    "30d of 1m bars": 30 * 390,
+    "1y of 1m bars": 252 * 390,
+}
+
+
+def pandas_indicators(close: pd.Series) -> pd.DataFrame:
+    diff = close.diff()
+    gains = diff.where(diff > 0, 0.0).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    losses = (-diff.where(diff < 0, 0.0)).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    fast = close.ewm(span=12, min_periods=12, adjust=False).mean()
+    slow = close.ewm(span=26, min_periods=26, adjust=False).mean()
+    line = fast - slow
+    return pd.DataFrame(
+        {
+            "MA20": close.rolling(20).mean(),
+            "RSI": 100 - 100 / (1 + gains / losses),
+            "MACD": line,
+            "Signal": line.ewm(span=9, min_periods=9, adjust=False).mean(),
+        }
+    )
+
+
+def numpy_indicators(close: np.ndarray) -> tuple:
+    return sma(close, 20), rsi_wilder(close, 14), macd(close)
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    print(f"{'history':<18}{'bars':>9}{'pandas (ms)':>14}{'numpy (ms)':>13}{'speedup':>10}")
+    for label, size in SIZES.items():
+        close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, size))))
+        values = close.to_numpy()
+        runs = max(5, 20000 // size)
+        pandas_ms = min(timeit.repeat(lambda: pandas_indicators(close), number=runs, repeat=3)) / runs * 1e3
+        numpy_ms = min(timeit.repeat(lambda: numpy_indicators(values), number=runs, repeat=3)) / runs * 1e3
+        print(f"{label:<18}{size:>9}{pandas_ms:>14.3f}{numpy_ms:>13.3f}{pandas_ms / numpy_ms:>9.1f}x")
+
+    # Panel mode: one pass over a (dates x tickers) matrix vs one pipeline per ticker
+    tickers = 500
+    print(f"\n{'panel':<18}{'tickers':>9}{'per-ticker (ms)':>18}{'panel (ms)':>13}{'speedup':>10}")
+    for label, size in (("1y daily", 252), ("10y daily", 2520)):
+        closes = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (size, tickers)), axis=0)),
+            index=pd.date_range("2015-01-01", periods=size, freq="B", name="Date"),
+        )
+        sample = closes.columns[:25]
+        loop_ms = min(
+            timeit.repeat(
+                lambda: [add_all_indicators(pd.DataFrame({"Close": closes[c]})) for c in sample],
+                number=1,
+                repeat=3,
+            )
+        ) * 1e3 * tickers / len(sample)
+        panel_ms = min(timeit.repeat(lambda: add_panel_indicators(closes), number=1, repeat=3)) * 1e3
+        print(f"{label:<18}{tickers:>9}{loop_ms:>18.1f}{panel_ms:>13.1f}{loop_ms / panel_ms:>9.1f}x")
+
+    # Parameter sweeps: one batched call vs one pandas pipeline per setting
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 2520))))
+    values = close.to_numpy()
+    short, long = [5, 7, 10, 15, 20], [20, 30, 50, 100, 200]
+    sweeps = {
+        "RSI 5..30": (
+            lambda: [
+                close.diff().clip(lower=0).ewm(alpha=1 / p, min_periods=p, adjust=False).mean()
+                / (-close.diff().clip(upper=0)).ewm(alpha=1 / p, min_periods=p, adjust=False).mean()
+                for p in range(5, 31)
+            ],
+            lambda: rsi_grid(values, range(5, 31)),
+        ),
+        "MA crossovers": (
+            lambda: [close.rolling(s).mean() - close.rolling(w).mean() for s in short for w in long if s < w],
+            lambda: ma_crossover_grid(values, short, long),
+        ),
+    }
+    print(f"\n{'sweep (10y daily)':<18}{'':>9}{'pandas (ms)':>14}{'batched (ms)':>13}{'speedup':>10}")
+    for label, (loop, batched) in sweeps.items():
+        loop_ms = min(timeit.repeat(loop, number=5, repeat=3)) / 5 * 1e3
+        batched_ms = min(timeit.repeat(batched, number=5, repeat=3)) / 5 * 1e3
+        print(f"{label:<18}{'':>9}{loop_ms:>14.2f}{batched_ms:>13.2f}{loop_ms / batched_ms:>9.1f}x")
+
+    # Rolling kernels vs pandas .rolling() (20-bar window, 5% missing values)
+    print(f"\n{'rolling (20 bars)':<18}{'bars':>9}{'pandas (ms)':>14}{'kernel (ms)':>13}{'speedup':>10}")
+    for size in (252, 252 * 390):
+        close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, size))))
+        close[rng.random(size) < 0.05] = np.nan
+        values = close.to_numpy()
+        rolling = close.rolling(20)
+        head = close.iloc[:10000]
+        kernels = {
+            "mean": (rolling.mean, lambda: rolling_mean(values, 20)),
+            "std": (rolling.std, lambda: rolling_std(values, 20)),
+            "min": (rolling.min, lambda: rolling_min(values, 20)),
+            "max": (rolling.max, lambda: rolling_max(values, 20)),
+            "median": (lambda: rolling.quantile(0.5), lambda: rolling_quantile(values, 20, 0.5)),
+            # rolling().apply is a Python call per window, so time at most 10k bars
+            "argmax": (
+                lambda: head.rolling(20).apply(np.nanargmax, raw=True),
+                lambda: rolling_argmax(head.to_numpy(), 20),
+            ),
+        }
+        runs = max(3, 20000 // size)
+        for label, (reference, kernel) in kernels.items():
+            pandas_ms = min(timeit.repeat(reference, number=runs, repeat=3)) / runs * 1e3
+            kernel_ms = min(timeit.repeat(kernel, number=runs, repeat=3)) / runs * 1e3
+            print(f"{label:<18}{min(size, 10000) if label == 'argmax' else size:>9}"
+                  f"{pandas_ms:>14.3f}{kernel_ms:>13.3f}{pandas_ms / kernel_ms:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
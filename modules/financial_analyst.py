@@ -7,7 +7,7 @@ import streamlit as st
 from plotly.subplots import make_subplots
 
 import utils.ui as ui
-from utils.data_loader import get_company_info, get_financials
+from utils.data_loader import get_fundamentals
 from utils.exceptions import DataFetchError
 from utils.logger import get_logger
 
@@ -61,8 +61,9 @@ def render() -> None:
 
 def _fetch_and_display_data(symbol: str):
     """Fetch all required data and render the display components."""
-    info = get_company_info(symbol)
-    financials = get_financials(symbol)
+    fundamentals = get_fundamentals(symbol) or {}
+    info = fundamentals.get("info")
+    financials = fundamentals.get("financials")
 
     if not info or not financials:
         raise DataFetchError(
@@ -5,15 +5,24 @@ Provides interactive stock data visualization with technical indicators
 including price charts, RSI, MACD, and volume analysis.
 """
 
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
 import utils.ui as ui
-from utils.data_loader import calculate_indicators, get_stock_data
+from utils.config import CHART_CONFIG, STREAMING
+from utils.data_loader import calculate_indicators, get_intraday_bars, get_stock_data
+from utils.downsampling import aggregate_ohlcv, downsample_line
 from utils.exceptions import DataFetchError, DataProcessingError, InvalidTickerError
 from utils.logger import get_logger
+from utils.support_resistance import find_levels, nearest_levels
+from utils.ticker_universe import get_ticker_universe, validate_ticker
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -24,9 +33,10 @@ def render() -> None:
     Render the Market Pulse module interface.
 
     Displays an interactive stock analysis dashboard with:
-    - Ticker selection and time period controls
+    - Ticker selection and time period controls (1m/5m stream live bars)
     - Current price metrics
-    - 4-panel technical analysis chart (Price/MA, RSI, MACD, Volume)
+    - 4-panel technical analysis chart (Price/MA, RSI, MACD, Volume), with a
+      range selector once the history exceeds CHART_CONFIG["MAX_POINTS"] bars
     """
     ui.section_header("Market Pulse", "Real-Time Technical Analysis Dashboard")
 
@@ -35,7 +45,9 @@ def render() -> None:
     with col1:
         ticker = st.text_input("Ticker Symbol", value="SPY").upper()
         period = st.selectbox("Period", ["1mo", "3mo", "6mo", "1y", "2y", "5y"], index=3)
-        interval = st.selectbox("Interval", ["1d", "1wk", "1mo"], index=0)
+        interval = st.selectbox(
+            "Interval", ["1d", "1wk", "1mo"] + STREAMING["INTERVALS"], index=0
+        )
 
     if not ticker:
         st.warning("⚠️ Please enter a ticker symbol")
@@ -43,11 +55,21 @@ def render() -> None:
 
     # Fetch and display data
     try:
+        # Reject malformed or known-bad symbols before any network request
+        ticker = validate_ticker(ticker)
+        listing = get_ticker_universe().get(ticker)
+        if listing is not None:
+            st.caption(f"{listing.name} · {listing.exchange} · {listing.sector}")
+
         with st.spinner(f"Fetching data for {ticker}..."):
             logger.info(f"User requested data for {ticker}")
 
-            # Get stock data
-            df = get_stock_data(ticker, period=period, interval=interval)
+            # Get stock data (intraday intervals read the live streaming buffer)
+            if interval in STREAMING["INTERVALS"]:
+                df = get_intraday_bars(ticker, interval, bars=STREAMING["DISPLAY_BARS"])
+                st.caption(f"📡 Live {interval} stream · last bar {df.index[-1]:%Y-%m-%d %H:%M}")
+            else:
+                df = get_stock_data(ticker, period=period, interval=interval)
 
             if df is None or df.empty:
                 st.error(f"❌ No data found for {ticker}. Please verify the ticker symbol.")
@@ -62,8 +84,8 @@ def render() -> None:
             # Display predictive indicators
             _display_predictive_indicators(df, ticker)
 
-            # Create and display chart
-            fig = _create_technical_chart(df, ticker)
+            # Create and display chart (long ranges are downsampled; zoom for full detail)
+            fig = _technical_chart(_select_visible_range(df, interval), ticker, interval)
             st.plotly_chart(fig, use_container_width=True)
 
             logger.info(f"Successfully displayed chart for {ticker}")
@@ -132,8 +154,11 @@ def _display_predictive_indicators(df: pd.DataFrame, ticker: str) -> None:
         # Calculate trend prediction
         trend, confidence, reasoning = _predict_trend(rsi, macd, signal)
 
-        # Calculate support/resistance levels
-        support, resistance = _calculate_support_resistance(df)
+        # Nearest pivot levels around the last close, else the recent range
+        support, resistance = nearest_levels(find_levels(df), latest["Close"])
+        recent_support, recent_resistance = _calculate_support_resistance(df)
+        support = recent_support if np.isnan(support) else support
+        resistance = recent_resistance if np.isnan(resistance) else resistance
 
         # Display in a compact format
         st.markdown("---")
@@ -272,19 +297,68 @@ def _calculate_support_resistance(df: pd.DataFrame, lookback: int = 20) -> tuple
         return current_price * 0.95, current_price * 1.05
 
 
-def _create_technical_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
+def _select_visible_range(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Let the user narrow a long history to the range shown in the chart.
+
+    Indicators are computed on the full history first, so zooming never
+    changes their values. Ranges longer than CHART_CONFIG["MAX_POINTS"] are
+    downsampled by the chart; narrower ones are drawn bar for bar.
+
+    Args:
+        df: DataFrame with stock data and technical indicators
+        interval: Bar interval, used to format the range labels
+
+    Returns:
+        The selected rows of ``df``
+    """
+    max_points = CHART_CONFIG["MAX_POINTS"]
+    if len(df) <= max_points:
+        return df
+
+    label = "%Y-%m-%d %H:%M" if interval in STREAMING["INTERVALS"] else "%Y-%m-%d"
+    first, last = st.select_slider(
+        "Visible range",
+        options=range(len(df)),
+        value=(0, len(df) - 1),
+        format_func=lambda i: df.index[i].strftime(label),
+    )
+    visible = df.iloc[first:last + 1]
+    if len(visible) > max_points:
+        st.caption(
+            f"Showing {len(visible):,} bars as {max_points:,} points · "
+            "narrow the range for full resolution"
+        )
+    return visible
+
+
+def _create_technical_chart(
+    df: pd.DataFrame,
+    ticker: str,
+    max_points: Optional[int] = None,
+    use_webgl: Optional[bool] = None,
+) -> go.Figure:
     """
     Create a 4-panel technical analysis chart.
 
     Panels:
-    1. Candlestick price chart with 20-day MA, support/resistance
+    1. Candlestick price chart with 20-day MA, recent support/resistance and
+       the strongest pivot levels of the range (SUPPORT_RESISTANCE["TOP_K"])
     2. RSI (Relative Strength Index)
     3. MACD with signal line
     4. Volume bars
 
+    Every trace is capped at ``max_points`` points: candles and volume are
+    aggregated into OHLC buckets and lines are downsampled with LTTB, so
+    the payload does not grow with the history. Per-bar arrays (including
+    volume colors) are derived with NumPy, never row by row.
+
     Args:
         df: DataFrame with OHLCV data and indicators
         ticker: Stock ticker symbol
+        max_points: Points per trace (default CHART_CONFIG["MAX_POINTS"])
+        use_webgl: Draw lines with WebGL (Scattergl); by default only when
+            a trace has more than CHART_CONFIG["WEBGL_MIN_POINTS"] points
 
     Returns:
         Plotly Figure object with 4 subplots
@@ -292,6 +366,16 @@ def _create_technical_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
     # Calculate support/resistance for visual indicators
     support, resistance = _calculate_support_resistance(df)
 
+    max_points = max_points or CHART_CONFIG["MAX_POINTS"]
+    bars = aggregate_ohlcv(df, max_points)
+    if use_webgl is None:
+        use_webgl = len(bars) > CHART_CONFIG["WEBGL_MIN_POINTS"]
+    scatter = go.Scattergl if use_webgl else go.Scatter
+
+    def line(column: str, name: str, **style) -> Union[go.Scatter, go.Scattergl]:
+        values = downsample_line(df[column], max_points)
+        return scatter(x=values.index, y=values.to_numpy(), name=name, line=style)
+
     # Create 4-panel chart
     fig = make_subplots(
         rows=4,
@@ -302,25 +386,46 @@ def _create_technical_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
         subplot_titles=(f"{ticker} Price & MA", "RSI", "MACD", "Volume"),
     )
 
-    # Panel 1: Price and MA
-    fig.add_trace(
+    # Volume colors as one numeric array on a two-color scale (1 = green,
+    # 0 = red); a list of color strings is validated element by element
+    with np.errstate(invalid="ignore"):
+        volume_colors = ((bars["Open"].to_numpy() - bars["Close"].to_numpy()) >= 0).astype(np.int8)
+
+    # Panel 1: Price and MA; 2: RSI; 3: MACD; 4: Volume; added in one batch
+    traces = [
         go.Candlestick(
-            x=df.index,
-            open=df["Open"],
-            high=df["High"],
-            low=df["Low"],
-            close=df["Close"],
+            x=bars.index,
+            open=bars["Open"].to_numpy(),
+            high=bars["High"].to_numpy(),
+            low=bars["Low"].to_numpy(),
+            close=bars["Close"].to_numpy(),
             name="Price",
         ),
-        row=1,
-        col=1,
-    )
-
-    fig.add_trace(
-        go.Scatter(x=df.index, y=df["MA20"], line=dict(color="orange", width=1), name="MA 20"),
-        row=1,
-        col=1,
-    )
+        line("MA20", "MA 20", color="orange", width=1),
+        line("RSI", "RSI", color="purple"),
+        line("MACD", "MACD", color="blue"),
+        line("Signal", "Signal", color="orange"),
+        go.Bar(
+            x=bars.index,
+            y=bars["Volume"].to_numpy(),
+            name="Volume",
+            marker=dict(
+                color=volume_colors,
+                colorscale=[[0, "red"], [1, "green"]],
+                cmin=0,
+                cmax=1,
+            ),
+        ),
+    ]
+    # Strongest pivot levels as one dotted trace per side (one add_hline each
+    # would re-validate the whole layout)
+    levels = find_levels(df)
+    for kind, color in (("support", "green"), ("resistance", "red")):
+        side = levels[levels["kind"] == kind]
+        if not side.empty:
+            traces.append(_level_trace(side, df.index[0], df.index[-1], kind, color))
+    rows = [1, 1, 2, 3, 3, 4] + [1] * (len(traces) - 6)
+    fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
 
     # Add support/resistance lines
     fig.add_hline(
@@ -343,35 +448,10 @@ def _create_technical_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
         col=1,
     )
 
-    # Panel 2: RSI
-    fig.add_trace(
-        go.Scatter(x=df.index, y=df["RSI"], name="RSI", line=dict(color="purple")),
-        row=2,
-        col=1,
-    )
+    # RSI overbought/oversold bands
     fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
     fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
 
-    # Panel 3: MACD
-    fig.add_trace(
-        go.Scatter(x=df.index, y=df["MACD"], name="MACD", line=dict(color="blue")),
-        row=3,
-        col=1,
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=df["Signal"], name="Signal", line=dict(color="orange")),
-        row=3,
-        col=1,
-    )
-
-    # Panel 4: Volume
-    colors = ["green" if row["Open"] - row["Close"] >= 0 else "red" for index, row in df.iterrows()]
-    fig.add_trace(
-        go.Bar(x=df.index, y=df["Volume"], name="Volume", marker_color=colors),
-        row=4,
-        col=1,
-    )
-
     # Update layout for Editorial Style
     fig.update_layout(
         template=ui.get_plotly_template(),
@@ -382,3 +462,66 @@ def _create_technical_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
     )
 
     return fig
+
+
+def _level_trace(
+    levels: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp, name: str, color: str
+) -> go.Scatter:
+    """Horizontal segments across [start, end] for each level, labelled with its touches."""
+    count = len(levels)
+    x = np.tile(np.array([start, end, None], dtype=object), count)
+    y = np.repeat(levels["level"].to_numpy(), 3).astype(object)
+    y[2::3] = None
+    text = np.full(3 * count, "", dtype=object)
+    text[0::3] = [f"{level:.2f} ×{touches}" for level, touches in zip(levels["level"], levels["touches"])]
+    return go.Scatter(
+        x=x,
+        y=y,
+        mode="lines+text",
+        text=text,
+        textposition="top right",
+        textfont=dict(color=color, size=10),
+        line=dict(color=color, width=1, dash="dot"),
+        opacity=0.6,
+        name=f"{name.title()} levels",
+        hoverinfo="skip",
+    )
+
+
+# Built figures keyed by (ticker, interval, range, last bar, theme), oldest first
+_figure_cache: "OrderedDict[tuple, go.Figure]" = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def _technical_chart(df: pd.DataFrame, ticker: str, interval: str) -> go.Figure:
+    """
+    Return the technical chart for the rows of ``df``, building it only once.
+
+    Figures are shared across reruns and sessions (they are never mutated
+    after creation), so a rerun that only changes an unrelated widget reuses
+    the figure without rebuilding or re-validating its traces. The last
+    close is part of the key because a live intraday bar is revised in place
+    before the next one starts.
+    """
+    key = (
+        ticker,
+        interval,
+        df.index[0],
+        df.index[-1],
+        len(df),
+        float(df["Close"].iloc[-1]),
+        tuple(sorted(ui.THEME.items())),
+        CHART_CONFIG["MAX_POINTS"],
+    )
+    with _figure_cache_lock:
+        fig = _figure_cache.get(key)
+        if fig is not None:
+            _figure_cache.move_to_end(key)
+            return fig
+
+    fig = _create_technical_chart(df, ticker)
+    with _figure_cache_lock:
+        _figure_cache[key] = fig
+        while len(_figure_cache) > CHART_CONFIG["CACHED_FIGURES"]:
+            _figure_cache.popitem(last=False)
+    return fig
@@ -8,12 +8,19 @@ This module acts as the central command center, coordinating specialized 'agents
 import streamlit as st
 import time
 import utils.ui as ui
-from utils.data_loader import get_stock_data, calculate_indicators, get_company_info, get_news
+from utils.data_loader import get_stock_data, calculate_indicators, get_fundamentals, get_news
+from utils.config import SCREENER
+from utils.exceptions import DataFetchError, InvalidTickerError
 from utils.sentiment_analyzer import process_news_sentiment
 from utils.logger import get_logger
+from utils.screener import scan_universe
+from utils.ticker_universe import get_ticker_universe, validate_ticker
 
 logger = get_logger(__name__)
 
+# TechBot only reads the latest RSI and MACD crossover
+TECHBOT_INDICATORS = ["RSI", "MACD", "Signal"]
+
 
 def render() -> None:
     """Render the Multi-Agent Orchestrator interface."""
@@ -24,13 +31,15 @@ def render() -> None:
         "Select Workflow",
         [
             "💰 Stock Deep Dive (3 Agents)",
-            "📊 Market Scanner (Coming Soon)",
+            "📊 Market Scanner",
             "📢 Content Generator (Coming Soon)",
         ],
     )
 
     if workflow == "💰 Stock Deep Dive (3 Agents)":
         _render_stock_deep_dive()
+    elif workflow == "📊 Market Scanner":
+        _render_market_scanner()
     else:
         st.info("This workflow is currently under development.")
 
@@ -54,9 +63,85 @@ def _render_stock_deep_dive():
     start_btn = st.button("🚀 Launch Workflow", type="primary")
 
     if start_btn and ticker:
+        # Reject typos locally before the agents spend any upstream requests
+        try:
+            ticker = validate_ticker(ticker)
+        except InvalidTickerError as e:
+            st.error(f"❌ {str(e)}")
+            return
         _run_deep_dive_logic(ticker)
 
 
+def _render_market_scanner():
+    """Screen a watchlist or the listed universe with the Market Pulse trend rules."""
+    st.markdown("""
+    **Mission:** Rank a whole watchlist by technical trend.
+
+    **ScannerBot** loads every symbol in one batch, runs RSI and MACD across the
+    universe at once and scores each ticker with the Market Pulse trend rules.
+    """)
+
+    universe = get_ticker_universe()
+    sectors = sorted({universe.get(s).sector for s in universe.symbols(SCREENER["EXCHANGES"])})
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        scope = st.selectbox("Universe", ["All listed stocks & ETFs", "Sector", "Custom watchlist"])
+        period = st.selectbox("History", ["3mo", "6mo", "1y"], index=1)
+    with col2:
+        if scope == "Sector":
+            sector = st.selectbox("Sector", sectors)
+            tickers = universe.symbols(SCREENER["EXCHANGES"], sector=sector)
+        elif scope == "Custom watchlist":
+            raw = st.text_area("Tickers (comma or space separated)", value="AAPL, MSFT, NVDA, AMD, TSLA")
+            tickers = [t for t in raw.replace(",", " ").upper().split() if t]
+        else:
+            tickers = universe.symbols(SCREENER["EXCHANGES"])
+        st.caption(f"{len(tickers)} symbols selected")
+
+    if not st.button("🔎 Run Scan", type="primary") or not tickers:
+        return
+
+    try:
+        with st.spinner(f"📊 ScannerBot: Screening {len(tickers)} symbols..."):
+            table = scan_universe(tickers, period=period)
+    except DataFetchError as e:
+        logger.error(f"Market scan failed: {e}")
+        st.error(f"❌ ScannerBot: Scan failed. {str(e)}")
+        return
+
+    if table.empty:
+        st.warning("⚠️ ScannerBot: No symbols had enough history to score.")
+        return
+
+    counts = table["Trend"].value_counts()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        ui.card_metric("Bullish", str(counts.get("Bullish", 0)))
+    with col2:
+        ui.card_metric("Neutral", str(counts.get("Neutral", 0)))
+    with col3:
+        ui.card_metric("Bearish", str(counts.get("Bearish", 0)))
+
+    fresh = table[table["MACD Cross"].str.endswith("cross")]
+    if not fresh.empty:
+        crosses = ", ".join(
+            f"{ticker} ({status.split()[0]})" for ticker, status in fresh["MACD Cross"].items()
+        )
+        st.markdown(f"**🚨 Fresh MACD crosses:** {crosses}")
+
+    formats = {
+        "Close": "${:.2f}",
+        "Change %": "{:+.2f}%",
+        "RSI": "{:.1f}",
+        "MACD": "{:.2f}",
+        "Signal": "{:.2f}",
+        "Confidence": "{:.0f}%",
+        "Score": "{:+.2f}",
+    }
+    st.dataframe(table.style.format(formats), use_container_width=True)
+
+
 def _run_deep_dive_logic(ticker: str):
     """Orchestrate the deep dive agents."""
 
@@ -71,7 +156,8 @@ def _run_deep_dive_logic(ticker: str):
             with st.spinner("🕵️ DataBot: Infiltrating exchanges..."):
                 time.sleep(0.5)  # UX pause
                 df = get_stock_data(ticker, period="1y", interval="1d")
-                info = get_company_info(ticker)
+                # Loads info, statements and news concurrently; NewsBot reuses the news
+                info = get_fundamentals(ticker).get("info", {})
 
                 if df is None or df.empty:
                     st.error(f"❌ DataBot: Mission Failed. No data for {ticker}.")
@@ -87,12 +173,12 @@ def _run_deep_dive_logic(ticker: str):
         with status_container:
             with st.spinner("📈 TechBot: Crunching numbers..."):
                 time.sleep(0.5)
-                df = calculate_indicators(df)
+                df = calculate_indicators(df, indicators=TECHBOT_INDICATORS)
 
                 last_row = df.iloc[-1]
                 rsi = last_row["RSI"]
                 macd = last_row["MACD"]
-                signal = last_row["Signal_Line"]
+                signal = last_row["Signal"]
 
                 results["rsi"] = rsi
                 results["macd_signal"] = "BULLISH" if macd > signal else "BEARISH"
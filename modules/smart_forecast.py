@@ -19,6 +19,10 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Indicators computed for the model, and the feature names they train under
+FORECAST_INDICATORS = ["RSI", "MACD", "Signal", "MA20", "MA50"]
+FEATURE_NAMES = {"Signal": "Signal_Line", "MA20": "SMA_20", "MA50": "SMA_50"}
+
 
 def render() -> None:
     """Render the Smart Forecast Engine interface."""
@@ -40,8 +44,8 @@ def render() -> None:
                     return
 
                 # 2. Prepare Data (Feature Engineering)
-                df = calculate_indicators(df)
-                df = _prepare_features(df)
+                df = calculate_indicators(df, indicators=FORECAST_INDICATORS)
+                df = _prepare_features(df.rename(columns=FEATURE_NAMES))
 
                 # 3. Train Model
                 model, metrics, prediction_df = _train_and_predict(df, days_to_predict)
@@ -11,6 +11,35 @@ except ImportError:
     PANDAS_AVAILABLE = False
 
 
+@pytest.fixture(autouse=True)
+def isolated_price_cache(tmp_path, monkeypatch):
+    """Point the persistent price cache at a per-test temporary directory."""
+    from utils import config
+
+    monkeypatch.setitem(config.PRICE_CACHE, "DIR", str(tmp_path / "prices"))
+    return tmp_path / "prices"
+
+
+@pytest.fixture(autouse=True)
+def reset_rejected_tickers():
+    """Forget tickers remembered as invalid by earlier tests."""
+    from utils.ticker_universe import clear_rejected
+
+    clear_rejected()
+    yield
+    clear_rejected()
+
+
+@pytest.fixture(autouse=True)
+def reset_indicator_cache():
+    """Start every test with an empty process-wide indicator cache."""
+    from utils.indicator_cache import get_indicator_cache
+
+    get_indicator_cache().clear()
+    yield
+    get_indicator_cache().clear()
+
+
 @pytest.fixture
 def sample_stock_data():
     """Create sample OHLCV data for testing."""
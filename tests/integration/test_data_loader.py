@@ -1,11 +1,31 @@
 """Tests for data_loader module."""
 
+import time
+
 import pytest
+import numpy as np
 import pandas as pd
-from unittest.mock import patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
-from utils.data_loader import get_stock_data, calculate_indicators
+from utils import data_loader
+from utils.data_loader import (
+    calculate_indicators,
+    compact_ohlcv,
+    compute_indicators,
+    compute_panel_indicators,
+    get_company_info,
+    get_fundamentals,
+    get_intraday_bars,
+    get_news,
+    get_stock_data,
+    get_stock_data_batch,
+    price_fingerprint,
+)
 from utils.exceptions import InvalidTickerError, DataFetchError, DataProcessingError
+from utils.indicator_cache import get_indicator_cache
+from utils.price_cache import get_price_cache
+from utils.ticker_universe import is_valid_ticker
+from utils import streaming
 
 
 class TestGetStockData:
@@ -16,9 +36,40 @@ class TestGetStockData:
         with pytest.raises(InvalidTickerError):
             get_stock_data("")
 
+    def test_get_stock_data_rejects_malformed_ticker_without_network(self):
+        """Test that malformed tickers never reach the provider."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            with pytest.raises(InvalidTickerError):
+                get_stock_data("AA PL$")
+
+        mock_download.assert_not_called()
+
+    def test_get_stock_data_remembers_tickers_without_data(self):
+        """Test that a ticker returning no data is rejected locally afterwards."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = pd.DataFrame()
+            with pytest.raises(InvalidTickerError):
+                get_stock_data("QWERTY", period="1mo")
+            with pytest.raises(InvalidTickerError):
+                get_stock_data("QWERTY", period="3mo")
+
+        # The empty answer is confirmed once, then the ticker is rejected locally
+        assert mock_download.call_count == 2
+
+    def test_get_stock_data_does_not_remember_transient_empty_responses(self, sample_stock_data):
+        """Test that an empty response that a retry contradicts is not negative-cached."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.side_effect = [pd.DataFrame(), sample_stock_data, sample_stock_data]
+            with pytest.raises(InvalidTickerError):
+                get_stock_data("QWERTY", period="1mo")
+            result = get_stock_data("QWERTY", period="3mo")
+
+        assert not result.empty
+        assert mock_download.call_count == 3
+
     def test_get_stock_data_strips_whitespace(self, sample_stock_data):
         """Test that ticker whitespace is stripped."""
-        with patch("utils.data_loader.yf.download") as mock_download:
+        with patch("utils.market_data.yf.download") as mock_download:
             mock_download.return_value = sample_stock_data
 
             # Should work with whitespace
@@ -32,7 +83,7 @@ class TestGetStockData:
 
     def test_get_stock_data_raises_on_empty_dataframe(self):
         """Test that empty DataFrame raises InvalidTickerError."""
-        with patch("utils.data_loader.yf.download") as mock_download:
+        with patch("utils.market_data.yf.download") as mock_download:
             mock_download.return_value = pd.DataFrame()
 
             with pytest.raises(InvalidTickerError):
@@ -40,7 +91,7 @@ class TestGetStockData:
 
     def test_get_stock_data_handles_api_error(self):
         """Test that API errors are caught and wrapped."""
-        with patch("utils.data_loader.yf.download") as mock_download:
+        with patch("utils.market_data.yf.download") as mock_download:
             mock_download.side_effect = Exception("API Error")
 
             with pytest.raises(DataFetchError):
@@ -48,13 +99,139 @@ class TestGetStockData:
 
     def test_get_stock_data_success(self, sample_stock_data):
         """Test successful data fetch."""
-        with patch("utils.data_loader.yf.download") as mock_download:
+        with patch("utils.market_data.yf.download") as mock_download:
             mock_download.return_value = sample_stock_data
 
             result = get_stock_data("AAPL")
             assert result is not None
             assert len(result) == 30
             assert "Close" in result.columns
+            assert result.attrs == {"ticker": "AAPL", "interval": "1d"}
+
+    def test_get_stock_data_reads_disk_cache_after_restart(self):
+        """Test that a fresh disk cache is served without a network call."""
+        dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=30, freq="D")
+        df = pd.DataFrame(
+            {
+                "Open": range(30),
+                "High": range(30),
+                "Low": range(30),
+                "Close": range(30),
+                "Volume": range(30),
+            },
+            index=dates,
+            dtype=float,
+        )
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = df
+            get_stock_data("MSFT", period="1mo")
+
+            # Simulate a process restart by dropping the in-memory cache
+            get_stock_data.clear()
+            result = get_stock_data("MSFT", period="1mo")
+
+            assert mock_download.call_count == 1
+            assert len(result) == 30
+
+
+def _daily_frame(start, periods, close=100.0):
+    """Build a simple daily OHLCV frame."""
+    dates = pd.date_range(start=start, periods=periods, freq="D")
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": 1000.0,
+        },
+        index=dates,
+    )
+
+
+class TestIncrementalRefresh:
+    """Test suite for incremental refresh of the disk cache."""
+
+    @staticmethod
+    def _seed_cache(df, covered_start, age_seconds):
+        get_price_cache().write(
+            "MSFT", "1d", df, covered_start, fetched_at=time.time() - age_seconds
+        )
+        get_stock_data.clear()
+
+    def test_stale_cache_fetches_only_tail(self):
+        """Test that a stale cache downloads bars after the last stored one."""
+        today = pd.Timestamp.now().normalize()
+        cached = _daily_frame(today - pd.Timedelta(days=20), 19)
+        self._seed_cache(cached, today - pd.DateOffset(months=1), age_seconds=3600)
+
+        tail = _daily_frame(cached.index[-1], 2, close=200.0)
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = tail
+            result = get_stock_data("MSFT", period="1mo")
+
+        mock_download.assert_called_once()
+        kwargs = mock_download.call_args.kwargs
+        assert kwargs["start"] == cached.index[-1]
+        assert "period" not in kwargs
+        assert len(result) == 20
+        assert result.index.is_unique
+        assert result["Close"].iloc[-2:].tolist() == [200.0, 200.0]
+
+    def test_longer_period_backfills_head(self):
+        """Test that asking for a longer period backfills only missing history."""
+        today = pd.Timestamp.now().normalize()
+        cached = _daily_frame(today - pd.Timedelta(days=10), 11)
+        self._seed_cache(cached, today - pd.Timedelta(days=10), age_seconds=0)
+
+        start = today - pd.DateOffset(months=3)
+        head = _daily_frame(start, (cached.index[0] - start).days)
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = head
+            result = get_stock_data("MSFT", period="3mo")
+
+        mock_download.assert_called_once()
+        kwargs = mock_download.call_args.kwargs
+        assert kwargs["start"] == start
+        assert kwargs["end"] == cached.index[0]
+        assert len(result) == len(head) + len(cached)
+
+    def test_failed_tail_refresh_serves_stale_cache(self):
+        """Test that a network failure during a tail refresh serves cached rows."""
+        today = pd.Timestamp.now().normalize()
+        cached = _daily_frame(today - pd.Timedelta(days=20), 21)
+        self._seed_cache(cached, today - pd.DateOffset(months=1), age_seconds=3600)
+
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.side_effect = Exception("API Error")
+            result = get_stock_data("MSFT", period="1mo")
+
+        assert len(result) == 21
+
+    def test_stale_while_revalidate_serves_cache_and_refreshes(self, monkeypatch):
+        """Test that stale data is served at once and refreshed in the background."""
+        from utils import config
+
+        monkeypatch.setitem(config.PRICE_CACHE, "STALE_WHILE_REVALIDATE", True)
+        today = pd.Timestamp.now().normalize()
+        cached = _daily_frame(today - pd.Timedelta(days=20), 19)
+        self._seed_cache(cached, today - pd.DateOffset(months=1), age_seconds=3600)
+
+        tail = _daily_frame(cached.index[-1], 2, close=200.0)
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = tail
+            result = get_stock_data("MSFT", period="1mo")
+            assert len(result) == 19
+
+            key = ("refresh", "MSFT", "1d")
+            deadline = time.time() + 5
+            while data_loader._inflight.in_flight(key) and time.time() < deadline:
+                time.sleep(0.01)
+
+        mock_download.assert_called_once()
+        entry = get_price_cache().read("MSFT", "1d")
+        assert len(entry.frame) == 20
+        assert entry.is_fresh(60)
 
 
 class TestCalculateIndicators:
@@ -125,3 +302,318 @@ class TestCalculateIndicators:
 
         with pytest.raises(DataProcessingError):
             calculate_indicators(df)
+
+    def test_calculate_indicators_does_not_mutate_input(self, sample_stock_data):
+        """Test that the input frame keeps its original columns."""
+        original_columns = list(sample_stock_data.columns)
+        result = calculate_indicators(sample_stock_data)
+
+        assert list(sample_stock_data.columns) == original_columns
+        assert "RSI" in result.columns
+
+
+class TestComputeIndicators:
+    """Test suite for compute_indicators function."""
+
+    def test_returns_only_indicator_columns(self, sample_stock_data):
+        """Test that only the indicator columns are returned."""
+        result = compute_indicators(sample_stock_data)
+
+        assert list(result.columns) == ["MA20", "RSI", "MACD", "Signal"]
+        assert result.index.equals(sample_stock_data.index)
+
+    def test_cache_key_is_fingerprint_not_frame(self, sample_stock_data):
+        """Test that the cached computation is keyed by the cheap fingerprint."""
+        with patch("utils.data_loader._cached_indicator_frame") as mock_cached:
+            compute_indicators(sample_stock_data)
+
+        fingerprint, names, prices = mock_cached.call_args.args
+        assert fingerprint == price_fingerprint(sample_stock_data)
+        assert names == ("MA20", "RSI", "MACD", "Signal")
+        assert prices is sample_stock_data
+
+    def test_computes_only_requested_indicators(self, sample_stock_data):
+        """Test that an indicator selection returns just those columns."""
+        result = compute_indicators(sample_stock_data, indicators=["RSI", "MA7"])
+
+        assert list(result.columns) == ["RSI", "MA7"]
+        expected = sample_stock_data["Close"].rolling(7).mean()
+        np.testing.assert_allclose(result["MA7"], expected, rtol=1e-10)
+
+    def test_unknown_indicator_raises_processing_error(self, sample_stock_data):
+        """Test that an unregistered indicator name is reported."""
+        with pytest.raises(DataProcessingError, match="Unknown indicator"):
+            compute_indicators(sample_stock_data, indicators=["NOPE"])
+
+    def test_tagged_frames_share_the_indicator_cache(self, sample_stock_data):
+        """Test that frames tagged with a ticker reuse one cached computation."""
+        sample_stock_data.attrs.update(ticker="AAPL", interval="1d")
+
+        with patch("utils.data_loader._cached_indicator_frame") as mock_cached:
+            rsi = compute_indicators(sample_stock_data, indicators=["RSI"])
+            joined = calculate_indicators(sample_stock_data.copy(), indicators=["RSI", "MACD"])
+
+        mock_cached.assert_not_called()
+        assert len(get_indicator_cache()) == 1
+        pd.testing.assert_series_equal(joined["RSI"], rsi["RSI"])
+        assert list(joined.columns[-2:]) == ["RSI", "MACD"]
+
+    def test_new_bar_changes_fingerprint(self, sample_stock_data):
+        """Test that appending a bar produces a different cache key."""
+        extended = pd.concat([sample_stock_data, sample_stock_data.iloc[[-1]]])
+        extended.index = pd.date_range("2023-01-01", periods=len(extended), freq="D")
+        assert price_fingerprint(sample_stock_data) != price_fingerprint(extended)
+
+
+class TestComputePanelIndicators:
+    """Test suite for multi-ticker indicator computation."""
+
+    def test_dict_and_panel_inputs_agree(self):
+        """Test that batch dicts and stacked panels give the same result."""
+        frames = {
+            "AAPL": _daily_frame("2024-01-01", 60, close=100.0),
+            "MSFT": _daily_frame("2024-01-15", 50, close=300.0),
+        }
+        panel = pd.concat(frames, names=["Ticker"])
+
+        from_dict = compute_panel_indicators(frames)
+        from_panel = compute_panel_indicators(panel)
+
+        pd.testing.assert_frame_equal(from_dict, from_panel, check_names=False)
+        assert len(from_dict.xs("MSFT")) == 50
+
+    def test_matches_single_ticker_indicators(self):
+        """Test that panel values match compute_indicators per ticker."""
+        frames = {"AAPL": _daily_frame("2024-01-01", 80, close=100.0)}
+        frames["AAPL"]["Close"] = frames["AAPL"]["Close"] + pd.Series(
+            range(80), index=frames["AAPL"].index
+        ) % 7
+
+        panel = compute_panel_indicators(frames).xs("AAPL")
+        single = compute_indicators(frames["AAPL"])
+
+        pd.testing.assert_series_equal(panel["RSI"], single["RSI"], check_names=False)
+        pd.testing.assert_series_equal(panel["MA20"], single["MA20"], check_names=False)
+
+    def test_missing_close_raises(self):
+        """Test that frames without Close raise DataProcessingError."""
+        with pytest.raises(DataProcessingError):
+            compute_panel_indicators({"AAPL": pd.DataFrame({"Open": [1.0]})})
+
+
+class TestGetStockDataBatch:
+    """Test suite for get_stock_data_batch function."""
+
+    @staticmethod
+    def _grouped_frame(tickers, periods=10):
+        today = pd.Timestamp.now().normalize()
+        frames = {
+            ticker: _daily_frame(today - pd.Timedelta(days=periods - 1), periods, close=i + 1.0)
+            for i, ticker in enumerate(tickers)
+        }
+        return pd.concat(frames, axis=1)
+
+    def test_batch_uses_one_grouped_request(self):
+        """Test that all uncached tickers are fetched in a single request."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = self._grouped_frame(["AAPL", "MSFT", "NVDA"])
+            result = get_stock_data_batch(["aapl", " MSFT", "NVDA", "AAPL"], period="1mo")
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == ["AAPL", "MSFT", "NVDA"]
+        assert list(result) == ["AAPL", "MSFT", "NVDA"]
+        assert result["MSFT"]["Close"].iloc[-1] == 2.0
+
+    def test_batch_fills_per_ticker_cache(self):
+        """Test that batch results are served to get_stock_data from disk."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = self._grouped_frame(["AAPL", "MSFT"])
+            get_stock_data_batch(["AAPL", "MSFT"], period="1mo")
+            get_stock_data.clear()
+            df = get_stock_data("MSFT", period="1mo")
+
+        assert mock_download.call_count == 1
+        assert len(df) == 10
+
+    def test_batch_omits_tickers_without_data(self):
+        """Test that tickers missing from the response are dropped."""
+        grouped = self._grouped_frame(["AAPL", "BAD"])
+        grouped.loc[:, "BAD"] = float("nan")
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = grouped
+            result = get_stock_data_batch(["AAPL", "BAD"], period="1mo")
+
+        assert list(result) == ["AAPL"]
+        # Missing from one grouped response is not proof the ticker is invalid
+        assert is_valid_ticker("BAD")
+
+    def test_batch_panel_layout(self):
+        """Test that as_panel returns a (Ticker, Date) MultiIndex frame."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = self._grouped_frame(["AAPL", "MSFT"])
+            panel = get_stock_data_batch(["AAPL", "MSFT"], period="1mo", as_panel=True)
+
+        assert panel.index.nlevels == 2
+        assert panel.index.names[0] == "Ticker"
+        assert len(panel.loc["AAPL"]) == 10
+
+    def test_batch_wraps_api_errors(self):
+        """Test that a failing grouped request raises DataFetchError."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.side_effect = Exception("API Error")
+            with pytest.raises(DataFetchError):
+                get_stock_data_batch(["AAPL", "MSFT"], period="5d")
+
+
+class TestGetFundamentals:
+    """Test suite for the combined get_fundamentals loader."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_store(self):
+        data_loader._fundamentals_store.clear()
+        yield
+        data_loader._fundamentals_store.clear()
+
+    @staticmethod
+    def _mock_ticker():
+        stock = MagicMock()
+        stock.info = {"sector": "Technology"}
+        stock.balance_sheet = pd.DataFrame({"2024": [1.0]})
+        stock.financials = pd.DataFrame({"2024": [2.0]})
+        stock.cashflow = pd.DataFrame({"2024": [3.0]})
+        stock.news = [{"title": "Headline"}]
+        return stock
+
+    def test_fundamentals_share_one_ticker_handle(self):
+        """Test that all requests go through a single yf.Ticker."""
+        with patch("utils.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value = self._mock_ticker()
+            result = get_fundamentals("nvda")
+
+        mock_ticker.assert_called_once()
+        assert mock_ticker.call_args.args[0] == "NVDA"
+        assert result["info"]["sector"] == "Technology"
+        assert set(result["financials"]) == {"balance_sheet", "income_stmt", "cashflow"}
+        assert result["news"] == [{"title": "Headline"}]
+
+    def test_fundamentals_prime_individual_getters(self):
+        """Test that a combined load serves later individual calls."""
+        with patch("utils.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value = self._mock_ticker()
+            get_fundamentals("AMD")
+            info = get_company_info("AMD")
+            news = get_news("AMD")
+
+        mock_ticker.assert_called_once()
+        assert info["sector"] == "Technology"
+        assert news == [{"title": "Headline"}]
+
+    def test_fundamentals_tolerate_news_failure(self):
+        """Test that a news failure degrades to an empty list."""
+        stock = self._mock_ticker()
+        type(stock).news = PropertyMock(side_effect=Exception("News down"))
+        with patch("utils.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value = stock
+            result = get_fundamentals("INTC")
+
+        assert result["news"] == []
+        assert result["info"]["sector"] == "Technology"
+
+    def test_fundamentals_raise_on_info_failure(self):
+        """Test that an info failure raises DataFetchError."""
+        stock = self._mock_ticker()
+        type(stock).info = PropertyMock(side_effect=Exception("Quote down"))
+        with patch("utils.market_data.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value = stock
+            with pytest.raises(DataFetchError):
+                get_fundamentals("QCOM")
+
+
+class TestCompactOhlcv:
+    """Test suite for the compact frame representation."""
+
+    @staticmethod
+    def _intraday_frame(rows=500):
+        index = pd.date_range("2024-01-02 09:30", periods=rows, freq="min", tz="America/New_York")
+        frame = pd.DataFrame(
+            {
+                "Open": 100.0,
+                "High": 101.0,
+                "Low": 99.0,
+                "Close": 100.5,
+                "Adj Close": 100.5,
+                "Volume": 12345,
+            },
+            index=index,
+        )
+        frame.columns = pd.MultiIndex.from_product([frame.columns, ["AAPL"]])
+        return frame
+
+    def test_compact_dtypes_and_index(self):
+        """Test that prices are float32, volume uint32 and the index tz-naive."""
+        df = compact_ohlcv(self._intraday_frame())
+
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+        assert all(df[col].dtype == "float32" for col in ["Open", "High", "Low", "Close"])
+        assert df["Volume"].dtype == "uint32"
+        assert df.index.tz is None
+        assert df.index[0] == pd.Timestamp("2024-01-02 09:30")
+
+    def test_compact_halves_memory(self):
+        """Test that the compact frame uses at most ~60% of the original memory."""
+        original = self._intraday_frame()
+        compact = compact_ohlcv(original)
+        assert compact.memory_usage(deep=True).sum() <= 0.6 * original.memory_usage(deep=True).sum()
+
+    def test_compact_keeps_large_volumes(self):
+        """Test that volumes beyond the uint32 range fall back to int64."""
+        original = self._intraday_frame(5)
+        original[("Volume", "AAPL")] = 5_000_000_000
+        assert compact_ohlcv(original)["Volume"].dtype == "int64"
+
+    def test_get_stock_data_compact(self, sample_stock_data):
+        """Test that get_stock_data returns a compact frame on request."""
+        with patch("utils.market_data.yf.download") as mock_download:
+            mock_download.return_value = sample_stock_data
+            df = get_stock_data("ORCL", compact=True)
+
+        assert df["Close"].dtype == "float32"
+        assert len(df) == 30
+
+
+class TestGetIntradayBars:
+    """Test suite for the streaming intraday loader."""
+
+    @pytest.fixture(autouse=True)
+    def clear_streams(self):
+        yield
+        for stream in list(streaming._streams.values()):
+            stream.stop()
+        streaming._streams.clear()
+
+    def test_seeds_stream_from_provider_and_limits_bars(self):
+        """Test that the first call seeds the buffer and returns the newest bars."""
+        bars = TestCompactOhlcv._intraday_frame(rows=50)
+        with patch("utils.market_data.yf.download", return_value=bars) as mock_download:
+            df = get_intraday_bars("aapl", "1m", bars=20)
+            again = get_intraday_bars("AAPL", "1m", bars=20)
+
+        assert len(df) == 20
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert df.index[-1] == pd.Timestamp("2024-01-02 10:19")
+        assert mock_download.call_count == 1
+        assert mock_download.call_args.kwargs["period"] == "5d"
+        assert again.index.equals(df.index)
+
+    def test_empty_stream_raises_invalid_ticker(self):
+        """Test that a ticker without intraday bars raises InvalidTickerError."""
+        with patch("utils.market_data.yf.download", return_value=pd.DataFrame()):
+            with pytest.raises(InvalidTickerError):
+                get_intraday_bars("NOPE", "1m")
+
+        assert ("NOPE", "1m") not in streaming._streams
+
+    def test_non_streaming_interval_raises_fetch_error(self):
+        """Test that daily intervals are rejected."""
+        with pytest.raises(DataFetchError):
+            get_intraday_bars("AAPL", "1d")
@@ -0,0 +1,115 @@
+"""Tests for the vectorized signal backtester."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.market_pulse import _predict_trend
+from utils.backtest import (
+    METRIC_COLUMNS,
+    BacktestParams,
+    backtest_positions,
+    parameter_grid,
+    rule_positions,
+    run_backtests,
+    summarize,
+)
+from utils.data_generator import generate_ohlcv_panel
+from utils.indicators import macd, rsi_wilder
+
+
+def _closes(tickers=6, days=400):
+    return generate_ohlcv_panel(tickers, days=days, seed=11)["Close"].unstack("Ticker")
+
+
+def test_market_pulse_positions_follow_predict_trend():
+    closes = _closes(2).to_numpy()
+    params = BacktestParams(allow_short=True)
+
+    positions = rule_positions(closes, params)
+
+    rsi = rsi_wilder(closes, params.rsi_period)
+    macd_line, signal_line = macd(closes)
+    mapping = {"Bullish": 1.0, "Bearish": -1.0, "Neutral": 0.0}
+    for t in range(40, 60):
+        for j in range(2):
+            trend, _, _ = _predict_trend(rsi[t, j], macd_line[t, j], signal_line[t, j])
+            assert positions[t, j] == mapping[trend]
+    assert not positions[:30].any()  # flat until MACD/signal exist
+    assert rule_positions(closes, BacktestParams()).min() >= 0  # long/flat by default
+
+
+def test_backtest_positions_hand_computed():
+    closes = np.array([[100.0], [110.0], [99.0], [99.0], [108.9]])
+    positions = np.array([[1.0], [1.0], [0.0], [1.0], [1.0]])
+
+    metrics = backtest_positions(closes, positions, cost_bps=0, bars_per_year=4)
+
+    # Long 100 -> 110 -> 99, flat 99 -> 99, long 99 -> 108.9
+    assert metrics["total_return"][0] == pytest.approx(1.1 * 0.9 * 1.1 - 1)
+    assert metrics["buy_hold_return"][0] == pytest.approx(0.089)
+    assert metrics["max_drawdown"][0] == pytest.approx(-0.1)
+    assert metrics["hit_rate"][0] == pytest.approx(2 / 3)
+    assert metrics["exposure"][0] == pytest.approx(0.75)
+    assert metrics["trades"][0] == 2
+    assert metrics["turnover"][0] == pytest.approx(3.0)  # 3 units traded in one year
+
+    costly = backtest_positions(closes, positions, cost_bps=100, bars_per_year=4)
+    assert costly["total_return"][0] < metrics["total_return"][0]
+
+
+def test_backtest_positions_skip_non_trading_rows():
+    closes = np.array([[100.0], [np.nan], [110.0], [np.nan], [99.0]])
+    positions = np.ones_like(closes)
+
+    metrics = backtest_positions(closes, positions, cost_bps=0, bars_per_year=4)
+
+    assert metrics["bars"][0] == 2
+    assert metrics["buy_hold_return"][0] == pytest.approx(-0.01)
+    assert metrics["total_return"][0] == pytest.approx(-0.01)
+
+
+def test_mixed_calendar_panel_matches_ticker_alone():
+    aapl = _closes(1, days=300)
+    days = pd.date_range(aapl.index[0], aapl.index[-1], freq="D")
+    btc = pd.Series(30000 * np.exp(np.cumsum(np.random.default_rng(5).normal(0, 0.02, len(days)))), index=days)
+    mixed = pd.concat({aapl.columns[0]: aapl.iloc[:, 0], "BTC-USD": btc}, axis=1)
+    assert mixed.iloc[:, 0].isna().any()  # weekends inside the stock's history
+    grid = parameter_grid(rules=["market_pulse", "chiefbot"], allow_short=[False, True])
+
+    alone = run_backtests(aapl, grid, workers=1)
+    together = run_backtests(mixed, grid, workers=1)
+
+    pd.testing.assert_frame_equal(
+        together[together["Ticker"] == aapl.columns[0]].reset_index(drop=True), alone
+    )
+    trading = mixed.iloc[:, 0].notna().to_numpy()
+    np.testing.assert_array_equal(
+        rule_positions(mixed.to_numpy(), grid[0])[trading, 0], rule_positions(aapl.to_numpy(), grid[0])[:, 0]
+    )
+
+
+def test_parameter_grid_and_unknown_rule():
+    grid = parameter_grid(rules=["market_pulse", "chiefbot"], rsi_periods=[9, 14])
+
+    assert len(grid) == 4
+    assert {p.rule for p in grid} == {"market_pulse", "chiefbot"}
+    with pytest.raises(ValueError, match="Unknown rule"):
+        parameter_grid(rules=["astrology"])
+
+
+def test_run_backtests_process_pool_matches_inline():
+    closes = _closes()
+    grid = parameter_grid(rules=["market_pulse", "chiefbot"], rsi_periods=[9, 14])
+
+    inline = run_backtests(closes, grid, workers=1, tickers_per_task=4)
+    pooled = run_backtests(closes, grid, workers=2, tickers_per_task=4)
+
+    assert len(inline) == len(grid) * closes.shape[1]
+    assert set(METRIC_COLUMNS) <= set(inline.columns)
+    pd.testing.assert_frame_equal(inline, pooled)
+
+    summary = summarize(inline)
+    assert len(summary) == len(grid)
+    assert (summary["tickers"] == closes.shape[1]).all()
+    assert summary["median_sharpe"].is_monotonic_decreasing
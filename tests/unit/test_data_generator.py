@@ -0,0 +1,60 @@
+"""Unit tests for synthetic market data generation."""
+
+import numpy as np
+import pytest
+
+from utils.data_generator import (
+    generate_market_data,
+    generate_ohlcv_panel,
+    simulate_ohlcv,
+    validate_market_data,
+)
+
+
+def test_generate_market_data_is_valid_and_reproducible():
+    first = generate_market_data("AAPL", days=90, seed=5)
+    second = generate_market_data("AAPL", days=90, seed=5)
+
+    assert validate_market_data(first)
+    assert len(first) == 90
+    assert {"RSI", "MACD", "MA7", "Volatility"} <= set(first.columns)
+    np.testing.assert_array_equal(first["Close"], second["Close"])
+    assert not first["Close"].equals(generate_market_data("AAPL", days=90, seed=6)["Close"])
+
+
+def test_seed_does_not_touch_global_random_state():
+    np.random.seed(0)
+    expected = np.random.random()
+    np.random.seed(0)
+
+    generate_market_data("BTC", days=30, seed=1)
+
+    assert np.random.random() == expected
+
+
+def test_generate_market_data_rejects_bad_input():
+    with pytest.raises(ValueError):
+        generate_market_data("DOGE")
+    with pytest.raises(ValueError):
+        generate_market_data("AAPL", days=10)
+
+
+def test_simulate_ohlcv_shapes_and_price_relationships():
+    arrays = simulate_ohlcv([100.0, 50.0, 10.0], [0.02, 0.03, 0.04], bars=500, seed=3)
+
+    assert all(values.shape == (500, 3) for values in arrays.values())
+    np.testing.assert_array_equal(arrays["Open"][1:], arrays["Close"][:-1])
+    np.testing.assert_array_equal(arrays["Open"][0], [100.0, 50.0, 10.0])
+    assert (arrays["High"] >= np.maximum(arrays["Open"], arrays["Close"])).all()
+    assert (arrays["Low"] <= np.minimum(arrays["Open"], arrays["Close"])).all()
+    assert (arrays["Volume"] > 0).all()
+
+
+def test_generate_ohlcv_panel_layout():
+    panel = generate_ohlcv_panel(["AAPL", "XYZ"], days=60, seed=2)
+
+    assert panel.index.names == ["Ticker", "Date"]
+    assert list(panel.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(panel.xs("XYZ")) == 60
+    assert panel.xs("AAPL")["Open"].iloc[0] == 185
+    assert len(generate_ohlcv_panel(3, days=5).index.get_level_values("Ticker").unique()) == 3
@@ -0,0 +1,53 @@
+"""Tests for chart downsampling (LTTB and OHLC buckets)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_generator import generate_ohlcv_panel
+from utils.downsampling import aggregate_ohlcv, downsample_line, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50.0)
+    y[437] = 5.0  # isolated spike
+
+    keep = lttb_indices(x, y, 100)
+
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+    assert 437 in keep
+
+
+def test_lttb_short_input_and_bad_size():
+    np.testing.assert_array_equal(lttb_indices([0, 1, 2], [1, 2, 3], 10), [0, 1, 2])
+    with pytest.raises(ValueError):
+        lttb_indices(np.arange(10), np.arange(10), 2)
+
+
+def test_downsample_line_skips_warmup_nans():
+    series = pd.Series(np.arange(500, dtype=float), index=pd.date_range("2020-01-01", periods=500))
+    series.iloc[:19] = np.nan
+
+    sampled = downsample_line(series, 50)
+
+    assert len(sampled) == 50
+    assert not sampled.isna().any()
+    assert sampled.index[0] == series.index[19]
+    assert sampled.index[-1] == series.index[-1]
+
+
+def test_aggregate_ohlcv_preserves_extremes_and_volume():
+    df = generate_ohlcv_panel(["AAPL"], days=1000, seed=2).xs("AAPL", level="Ticker")
+
+    bars = aggregate_ohlcv(df, 90)
+
+    assert len(bars) == 90
+    assert bars["High"].max() == df["High"].max()
+    assert bars["Low"].min() == df["Low"].min()
+    assert bars["Volume"].sum() == df["Volume"].sum()
+    assert bars["Open"].iloc[0] == df["Open"].iloc[0]
+    assert bars["Close"].iloc[-1] == df["Close"].iloc[-1]
+    assert len(aggregate_ohlcv(df.iloc[:50], 90)) == 50
@@ -122,28 +122,29 @@ class TestFinancialAnalystRender:
 class TestFetchAndDisplayData:
     """Test the _fetch_and_display_data function."""
 
-    @patch("modules.financial_analyst.get_financials")
-    @patch("modules.financial_analyst.get_company_info")
+    @patch("modules.financial_analyst.get_fundamentals")
     @patch("modules.financial_analyst._display_financial_tabs")
     @patch("modules.financial_analyst._display_performance_charts")
     @patch("modules.financial_analyst._display_key_metrics")
     @patch("modules.financial_analyst._display_header")
     def test_fetch_and_display_success(
-        self, mock_header, mock_metrics, mock_charts, mock_tabs, mock_info, mock_financials
+        self, mock_header, mock_metrics, mock_charts, mock_tabs, mock_fundamentals
     ):
         """Test successful data fetch and display."""
         from modules.financial_analyst import _fetch_and_display_data
 
         # Mock data
-        mock_info.return_value = MOCK_COMPANY_INFO
-        mock_financials.return_value = MOCK_FINANCIALS
+        mock_fundamentals.return_value = {
+            "info": MOCK_COMPANY_INFO,
+            "financials": MOCK_FINANCIALS,
+            "news": [],
+        }
 
         # Call function
         _fetch_and_display_data("AAPL")
 
-        # Verify data fetching
-        mock_info.assert_called_once_with("AAPL")
-        mock_financials.assert_called_once_with("AAPL")
+        # Verify data fetching happens in one combined load
+        mock_fundamentals.assert_called_once_with("AAPL")
 
         # Verify display functions called
         mock_header.assert_called_once_with(MOCK_COMPANY_INFO, "AAPL")
@@ -151,29 +152,25 @@ class TestFetchAndDisplayData:
         mock_charts.assert_called_once_with(MOCK_FINANCIALS)
         mock_tabs.assert_called_once_with(MOCK_FINANCIALS)
 
-    @patch("modules.financial_analyst.get_financials")
-    @patch("modules.financial_analyst.get_company_info")
-    def test_fetch_raises_error_on_no_info(self, mock_info, mock_financials):
+    @patch("modules.financial_analyst.get_fundamentals")
+    def test_fetch_raises_error_on_no_info(self, mock_fundamentals):
         """Test raises DataFetchError when no company info returned."""
         from modules.financial_analyst import _fetch_and_display_data
 
         # Mock no data
-        mock_info.return_value = None
-        mock_financials.return_value = MOCK_FINANCIALS
+        mock_fundamentals.return_value = {"info": None, "financials": MOCK_FINANCIALS}
 
         # Should raise error
         with pytest.raises(DataFetchError):
             _fetch_and_display_data("INVALID")
 
-    @patch("modules.financial_analyst.get_financials")
-    @patch("modules.financial_analyst.get_company_info")
-    def test_fetch_raises_error_on_no_financials(self, mock_info, mock_financials):
+    @patch("modules.financial_analyst.get_fundamentals")
+    def test_fetch_raises_error_on_no_financials(self, mock_fundamentals):
         """Test raises DataFetchError when no financials returned."""
         from modules.financial_analyst import _fetch_and_display_data
 
         # Mock no financials
-        mock_info.return_value = MOCK_COMPANY_INFO
-        mock_financials.return_value = None
+        mock_fundamentals.return_value = {"info": MOCK_COMPANY_INFO, "financials": None}
 
         # Should raise error
         with pytest.raises(DataFetchError):
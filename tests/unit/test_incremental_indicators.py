@@ -0,0 +1,105 @@
+"""Unit tests for incremental indicator state."""
+
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.incremental_indicators import (
+    IndicatorState,
+    RollingWindow,
+    RunningEMA,
+    RunningMACD,
+    WilderRSI,
+)
+from utils.indicators import add_all_indicators, ema, macd, rsi_wilder, sma
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(3)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+    values[[80, 81, 200]] = np.nan
+    return values
+
+
+def _replay(indicator, values, seed_bars):
+    indicator.seed(values[:seed_bars])
+    return np.array([indicator.update(x) for x in values[seed_bars:]], dtype=float)
+
+
+def test_running_ema_matches_vectorized_kernel(closes):
+    result = _replay(RunningEMA(span=12, min_periods=12), closes, seed_bars=5)
+
+    np.testing.assert_allclose(result, ema(closes, span=12, min_periods=12)[5:], rtol=1e-12)
+
+
+def test_rolling_window_matches_rolling_mean_and_std(closes):
+    window = RollingWindow(20)
+    window.seed(closes[:30])
+    means, stds = [], []
+    for x in closes[30:]:
+        window.update(x)
+        means.append(window.mean)
+        stds.append(window.std)
+
+    series = pd.Series(closes)
+    np.testing.assert_allclose(means, sma(closes, 20)[30:], rtol=1e-10)
+    np.testing.assert_allclose(stds, series.rolling(20).std()[30:], rtol=1e-8)
+
+
+def test_wilder_rsi_and_macd_match_kernels(closes):
+    rsi = _replay(WilderRSI(14), closes, seed_bars=40)
+    state = RunningMACD().seed(closes[:40])
+    lines = np.array([state.update(x) for x in closes[40:]])
+
+    np.testing.assert_allclose(rsi, rsi_wilder(closes, 14)[40:], rtol=1e-10)
+    expected_line, expected_signal = macd(closes)
+    np.testing.assert_allclose(lines[:, 0], expected_line[40:], rtol=1e-10)
+    np.testing.assert_allclose(lines[:, 1], expected_signal[40:], rtol=1e-10)
+
+
+def test_seeding_in_warm_up_still_converges(closes):
+    rsi = _replay(WilderRSI(14), closes, seed_bars=3)
+
+    np.testing.assert_allclose(rsi, rsi_wilder(closes, 14)[3:], rtol=1e-10)
+
+
+def test_indicator_state_matches_add_all_indicators(closes):
+    state = IndicatorState().seed(closes[:60])
+    latest = [state.update(x) for x in closes[60:]]
+
+    expected = add_all_indicators(pd.DataFrame({"Close": closes}))
+    for column in ["MA7", "MA30", "MACD", "Signal", "Volatility"]:
+        np.testing.assert_allclose(
+            [row[column] for row in latest], expected[column].iloc[60:], rtol=1e-8
+        )
+    assert latest[-1]["MA20"] == pytest.approx(sma(closes, 20)[-1])
+
+
+def test_revise_replaces_the_latest_bar(closes):
+    revised = IndicatorState().seed(closes[:100])
+    direct = copy.deepcopy(revised)
+
+    revised.update(999.0)
+    result = revised.revise(closes[100])
+    expected = direct.update(closes[100])
+
+    assert result == pytest.approx(expected, nan_ok=True)
+    assert revised.bars == direct.bars
+
+
+@pytest.mark.parametrize("seed_bars", [15, 150, 201])
+def test_revise_right_after_seed_matches_batch(closes, seed_bars):
+    history = closes[:seed_bars].copy()
+    state = IndicatorState().seed(history)
+
+    history[-1] = 105.0  # the newest seeded bar was still forming
+    latest = state.revise(history[-1])
+
+    expected = add_all_indicators(pd.DataFrame({"Close": history})).iloc[-1]
+    for column in ["MA7", "MA30", "MACD", "Signal", "Volatility"]:
+        assert latest[column] == pytest.approx(expected[column], rel=1e-8, nan_ok=True)
+    assert latest["RSI"] == pytest.approx(rsi_wilder(history, 14)[-1], rel=1e-10, nan_ok=True)
+    assert state.bars == seed_bars
@@ -0,0 +1,116 @@
+"""Unit tests for the process-wide indicator cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicator_cache import IndicatorCache
+from utils.indicators import evaluate_indicators
+
+NAMES = ["MA20", "RSI", "MACD", "Signal"]
+
+
+def _prices(n, seed=3):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-02", periods=n, freq="B")
+    return pd.DataFrame({"Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))}, index=index)
+
+
+def _expected(prices, names=NAMES):
+    return pd.DataFrame(evaluate_indicators({"Close": prices["Close"]}, names), index=prices.index)
+
+
+def test_same_history_is_served_from_cache():
+    cache = IndicatorCache()
+    prices = _prices(300)
+
+    first = cache.get("aapl", "1d", prices, NAMES)
+    second = cache.get("AAPL", "1d", prices.copy(), NAMES)
+
+    pd.testing.assert_frame_equal(second, first)
+    assert cache.stats == {"hits": 1, "extensions": 0, "misses": 1}
+
+
+def test_other_pages_add_columns_to_the_same_entry():
+    cache = IndicatorCache()
+    prices = _prices(300)
+    cache.get("AAPL", "1d", prices, ["RSI", "MACD", "Signal"])
+
+    result = cache.get("AAPL", "1d", prices, ["MA20", "RSI"])
+
+    pd.testing.assert_frame_equal(result, _expected(prices, ["MA20", "RSI"]))
+    assert len(cache) == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_new_bars_and_revised_last_bar_extend_incrementally():
+    cache = IndicatorCache()
+    full = _prices(320)
+    cache.get("AAPL", "1d", full.iloc[:300], NAMES)
+
+    grown = full.copy()
+    grown.iloc[299, 0] *= 1.01  # the cached last bar was still forming
+    result = cache.get("AAPL", "1d", grown, NAMES)
+
+    assert cache.stats["extensions"] == 1
+    pd.testing.assert_frame_equal(result, _expected(grown), rtol=1e-9)
+
+    # A second extension continues from the carried-over state
+    more = pd.concat([grown, _prices(330).iloc[320:]])
+    pd.testing.assert_frame_equal(cache.get("AAPL", "1d", more, NAMES), _expected(more), rtol=1e-9)
+    assert cache.stats["extensions"] == 2
+
+
+def test_extension_matches_full_recompute_with_missing_closes():
+    cache = IndicatorCache()
+    names = ["Volatility", "MA7", "RSI"]
+    full = _prices(320)
+    full.iloc[[150, 305], 0] = np.nan  # one gap in the cached part, one in the new bars
+    cache.get("AAPL", "1d", full.iloc[:300], names)
+
+    result = cache.get("AAPL", "1d", full, names)
+
+    assert cache.stats["extensions"] == 1
+    pd.testing.assert_frame_equal(result, _expected(full, names), rtol=1e-9)
+    expected_vol = full["Close"].ffill().pct_change().rolling(7).std() * np.sqrt(365) * 100
+    np.testing.assert_allclose(result["Volatility"], expected_vol, rtol=1e-9)
+
+
+def test_moved_history_start_is_recomputed():
+    cache = IndicatorCache()
+    prices = _prices(300)
+    cache.get("AAPL", "1d", prices.iloc[:250], NAMES)
+
+    result = cache.get("AAPL", "1d", prices.iloc[10:], NAMES)
+
+    assert cache.stats["misses"] == 2
+    pd.testing.assert_frame_equal(result, _expected(prices.iloc[10:]))
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = IndicatorCache(max_entries=2)
+    prices = _prices(50)
+    for ticker in ["AAA", "BBB"]:
+        cache.get(ticker, "1d", prices, NAMES)
+    cache.get("AAA", "1d", prices, NAMES)  # refresh AAA
+    cache.get("CCC", "1d", prices, NAMES)
+
+    cache.get("AAA", "1d", prices, NAMES)
+    assert cache.stats["hits"] == 2
+    cache.get("BBB", "1d", prices, NAMES)
+    assert cache.stats["misses"] == 4
+
+
+def test_byte_limit_bounds_cache_size():
+    prices = _prices(1000)
+    cache = IndicatorCache(max_bytes=100_000)
+    for ticker in ["AAA", "BBB", "CCC", "DDD"]:
+        cache.get(ticker, "1d", prices, NAMES)
+
+    assert cache.nbytes <= 100_000
+    assert 0 < len(cache) < 4
+
+
+def test_unknown_indicator_raises():
+    with pytest.raises(ValueError):
+        IndicatorCache().get("AAPL", "1d", _prices(30), ["NOPE"])
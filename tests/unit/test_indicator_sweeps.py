@@ -0,0 +1,61 @@
+"""Unit tests for batched indicator parameter sweeps."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicator_sweeps import ma_crossover_grid, rsi_grid, sma_grid
+from utils.indicators import rsi_wilder, sma
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(11)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))
+
+
+def test_sma_grid_matches_single_window_sma(close):
+    windows, grid = sma_grid(close, [3, 20, 50])
+
+    assert grid.shape == (3, len(close))
+    for i, window in enumerate(windows):
+        np.testing.assert_array_equal(grid[i], sma(close, window))
+
+
+def test_sma_grid_handles_padded_panel(close):
+    matrix = np.column_stack([close, close * 2])
+    matrix[:30, 1] = np.nan
+
+    _, grid = sma_grid(matrix, [5, 10], min_periods=1)
+
+    assert grid.shape == (2, len(close), 2)
+    np.testing.assert_allclose(grid[1], sma(matrix, 10, min_periods=1))
+    assert np.isnan(grid[:, :30, 1]).all()
+
+
+def test_rsi_grid_matches_rsi_wilder(close):
+    periods, grid = rsi_grid(close, range(5, 31))
+
+    assert grid.shape == (26, len(close))
+    for i, period in enumerate(periods):
+        np.testing.assert_array_equal(grid[i], rsi_wilder(close, period))
+
+
+def test_crossover_grid_spreads_and_crossings(close):
+    grid = ma_crossover_grid(close, [5, 20], [20, 50])
+
+    assert grid.spread.shape == (2, 2, len(close))
+    np.testing.assert_allclose(grid.spread[0, 1], sma(close, 5) - sma(close, 50))
+    assert np.isnan(grid.spread[1, 0]).all()  # 20 vs 20 is not a crossover
+
+    above = pd.Series(grid.spread[0, 0] > 0)
+    expected = above.astype(int).diff().fillna(0).to_numpy()
+    expected[:20] = 0  # no signal until both averages exist
+    np.testing.assert_array_equal(grid.crossings()[0, 0], expected)
+
+
+def test_invalid_grids_are_rejected(close):
+    with pytest.raises(ValueError):
+        sma_grid(close, [])
+    with pytest.raises(ValueError):
+        rsi_grid(close, [0, 14])
@@ -0,0 +1,225 @@
+"""Unit tests for the NumPy indicator engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import (
+    PANEL_COLUMNS,
+    add_all_indicators,
+    add_panel_indicators,
+    calculate_macd,
+    calculate_rsi,
+    available_indicators,
+    ema,
+    evaluate_indicators,
+    indicator_plan,
+    macd,
+    panel_indicators,
+    rolling_argmax,
+    rolling_argmin,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_quantile,
+    rolling_std,
+    rolling_windows,
+    rsi_wilder,
+    sma,
+)
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(7)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600))))
+
+
+def _pandas_rsi(close, period=14):
+    """Reference Wilder RSI written with pandas ewm."""
+    diff = close.diff()
+    gains = diff.where(diff > 0, 0.0)
+    losses = -diff.where(diff < 0, 0.0)
+    avg_gain = gains.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+    avg_loss = losses.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+    return pd.Series(
+        np.where(avg_loss == 0, 100, 100 - (100 / (1 + avg_gain / avg_loss))), index=close.index
+    )
+
+
+def test_sma_matches_pandas_rolling_mean(close):
+    with_gaps = close.copy()
+    with_gaps.iloc[[3, 40, 41]] = np.nan
+
+    np.testing.assert_allclose(sma(close, 20), close.rolling(20).mean(), rtol=1e-10)
+    np.testing.assert_allclose(
+        sma(with_gaps, 20, min_periods=5), with_gaps.rolling(20, min_periods=5).mean(), rtol=1e-10
+    )
+
+
+@pytest.mark.parametrize("gaps", [[], [0, 1, 2], [10, 11, 300]])
+def test_ema_matches_pandas_ewm(close, gaps):
+    series = close.copy()
+    series.iloc[gaps] = np.nan
+
+    expected = series.ewm(span=12, adjust=False, min_periods=12).mean()
+    np.testing.assert_allclose(ema(series, span=12, min_periods=12), expected, rtol=1e-12)
+
+
+def test_rsi_uses_wilder_smoothing(close):
+    np.testing.assert_allclose(rsi_wilder(close, 14), _pandas_rsi(close), rtol=1e-12)
+    assert np.isnan(rsi_wilder(close, 14)[:13]).all()
+
+
+def test_rsi_without_losses_is_100():
+    rising = np.arange(1, 40, dtype=float)
+
+    assert rsi_wilder(rising, 14)[-1] == 100
+
+
+def test_macd_matches_pandas_reference(close):
+    fast = close.ewm(span=12, adjust=False, min_periods=12).mean()
+    slow = close.ewm(span=26, adjust=False, min_periods=26).mean()
+    expected_line = fast - slow
+    expected_signal = expected_line.ewm(span=9, adjust=False, min_periods=9).mean()
+
+    line, signal = macd(close)
+
+    np.testing.assert_allclose(line, expected_line, rtol=1e-12)
+    np.testing.assert_allclose(signal, expected_signal, rtol=1e-12)
+    assert np.isnan(line[:25]).all() and not np.isnan(line[25])
+    assert np.isnan(signal[:33]).all() and not np.isnan(signal[33])
+
+
+def test_kernels_accept_time_by_ticker_matrices(close):
+    matrix = np.column_stack([close.to_numpy(), close.to_numpy()[::-1]])
+
+    np.testing.assert_allclose(rsi_wilder(matrix)[:, 1], rsi_wilder(close.to_numpy()[::-1]))
+    np.testing.assert_allclose(sma(matrix, 30)[:, 0], sma(close, 30))
+
+
+def test_series_helpers_use_the_engine(close):
+    rsi = calculate_rsi(close)
+    macd_line, signal_line = calculate_macd(close)
+
+    np.testing.assert_allclose(rsi[13:], _pandas_rsi(close)[13:], rtol=1e-12)
+    assert (rsi[:13] == 50).all()
+    np.testing.assert_allclose(macd_line, macd(close)[0])
+    assert signal_line.index.equals(close.index)
+
+
+def test_add_all_indicators_columns(close):
+    df = add_all_indicators(pd.DataFrame({"Close": close}))
+
+    assert {"RSI", "MACD", "Signal", "MA7", "MA30", "Returns", "Volatility"} <= set(df.columns)
+    np.testing.assert_allclose(df["MA7"], close.rolling(7).mean(), rtol=1e-10)
+
+
+def test_rolling_std_matches_pandas(close):
+    returns = close.pct_change()
+
+    np.testing.assert_allclose(rolling_std(returns, 7), returns.rolling(7).std(), rtol=1e-9)
+
+
+def test_panel_matches_single_ticker_pipeline(close):
+    wide = pd.DataFrame({"AAA": close, "BBB": close[::-1].to_numpy() * 2})
+    wide.iloc[:50, 1] = np.nan  # shorter history
+
+    arrays = panel_indicators(wide.to_numpy())
+    single = add_all_indicators(pd.DataFrame({"Close": wide["BBB"].iloc[50:]}))
+
+    assert set(arrays) == set(PANEL_COLUMNS)
+    for column in ["MA7", "MA30", "RSI", "MACD", "Signal", "Volatility"]:
+        # calculate_rsi fills its warm-up with 50, so compare once warmed up
+        np.testing.assert_allclose(arrays[column][90:, 1], single[column][40:], rtol=1e-9)
+    assert np.isnan(arrays["RSI"][:63, 1]).all()
+
+
+def test_add_panel_indicators_stacks_by_ticker_and_date(close):
+    dates = pd.date_range("2020-01-01", periods=len(close), freq="B", name="Date")
+    wide = pd.DataFrame({"AAA": close.to_numpy(), "BBB": close.to_numpy() + 1}, index=dates)
+    wide.iloc[:10, 1] = np.nan
+
+    panel = add_panel_indicators(wide)
+
+    assert panel.index.names == ["Ticker", "Date"]
+    assert list(panel.columns) == ["Close"] + PANEL_COLUMNS
+    assert len(panel.xs("AAA")) == len(close)
+    assert len(panel.xs("BBB")) == len(close) - 10
+    np.testing.assert_allclose(panel.xs("AAA")["RSI"], rsi_wilder(close))
+
+
+def test_evaluate_indicators_matches_kernels(close):
+    out = evaluate_indicators({"Close": close}, ["MA20", "RSI", "MACD", "Signal", "MA50"])
+    macd_line, signal_line = macd(close)
+
+    assert list(out) == ["MA20", "RSI", "MACD", "Signal", "MA50"]
+    np.testing.assert_allclose(out["MA20"], sma(close, 20))
+    np.testing.assert_allclose(out["MA50"], close.rolling(50).mean(), rtol=1e-10)
+    np.testing.assert_array_equal(out["RSI"], rsi_wilder(close))
+    np.testing.assert_array_equal(out["MACD"], macd_line)
+    np.testing.assert_array_equal(out["Signal"], signal_line)
+
+
+def test_plan_shares_intermediates_and_skips_unrequested():
+    plan = indicator_plan(["MA7", "MA30", "MACD", "Signal"])
+
+    assert plan.count("close_prefix") == 1
+    assert plan.count("ema_fast") == 1 and plan.count("ema_slow") == 1
+    assert plan.index("MACD") < plan.index("Signal")
+    assert "avg_gain_loss" not in plan and "RSI" not in plan
+    assert indicator_plan(["RSI"]) == ["close_diff", "avg_gain_loss", "RSI"]
+
+
+def test_unknown_indicator_is_rejected():
+    assert "ema_fast" not in available_indicators()
+    with pytest.raises(ValueError, match="Unknown indicator"):
+        evaluate_indicators({"Close": np.arange(5.0)}, ["MA7", "NOPE"])
+
+
+@pytest.fixture
+def gappy(close):
+    series = close.copy()
+    series.iloc[[0, 1, 60, 200]] = np.nan
+    series.iloc[100:130] = np.nan
+    return series
+
+
+@pytest.mark.parametrize("window,min_periods", [(1, None), (20, None), (20, 5), (900, 1)])
+def test_rolling_kernels_match_pandas_with_gaps(gappy, window, min_periods):
+    rolling = gappy.rolling(window, min_periods=min_periods)
+
+    np.testing.assert_allclose(rolling_mean(gappy, window, min_periods), rolling.mean(), rtol=1e-9)
+    np.testing.assert_array_equal(rolling_max(gappy, window, min_periods), rolling.max())
+    np.testing.assert_array_equal(rolling_min(gappy, window, min_periods), rolling.min())
+    for q in (0.0, 0.25, 0.5, 1.0):
+        np.testing.assert_allclose(
+            rolling_quantile(gappy, window, q, min_periods), rolling.quantile(q), rtol=1e-12
+        )
+    np.testing.assert_array_equal(
+        rolling_argmax(gappy, window, min_periods), rolling.apply(np.nanargmax, raw=True)
+    )
+    np.testing.assert_array_equal(
+        rolling_argmin(gappy, window, min_periods), rolling.apply(np.nanargmin, raw=True)
+    )
+
+
+def test_rolling_kernels_work_column_wise(gappy):
+    matrix = np.column_stack([gappy, gappy[::-1].to_numpy()])
+    frame = pd.DataFrame(matrix).rolling(10)
+
+    np.testing.assert_array_equal(rolling_max(matrix, 10), frame.max())
+    np.testing.assert_allclose(rolling_quantile(matrix, 10, 0.3), frame.quantile(0.3))
+
+
+def test_rolling_windows_is_a_padded_trailing_view(close):
+    windows = rolling_windows(close, 3)
+
+    assert windows.shape == (len(close), 3)
+    assert np.isnan(windows[0, :2]).all()
+    np.testing.assert_array_equal(windows[10], close.to_numpy()[8:11])
+
+
+def test_rolling_quantile_rejects_out_of_range_q(close):
+    with pytest.raises(ValueError):
+        rolling_quantile(close, 5, 1.5)
@@ -0,0 +1,108 @@
+"""Unit tests for market data providers."""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import config
+from utils.data_loader import get_fundamentals, get_stock_data
+from utils.exceptions import ConfigurationError
+from utils.market_data import (
+    ReplayProvider,
+    YFinanceProvider,
+    get_provider,
+    record_fixtures,
+    set_provider,
+)
+
+
+def _prices(periods=400):
+    dates = pd.date_range(end="2024-06-28", periods=periods, freq="B")
+    close = np.linspace(100, 200, periods)
+    return pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1000.0},
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+
+
+@pytest.fixture
+def fixture_dir(tmp_path):
+    """Record a small fixture set from a fake live provider."""
+    source = MagicMock()
+    source.download.return_value = _prices()
+    handle = source.ticker.return_value
+    handle.info = {"sector": "Technology", "longName": "Apple Inc."}
+    handle.news = [{"title": "Apple ships"}]
+    handle.balance_sheet = pd.DataFrame({pd.Timestamp("2023-09-30"): [1.0]}, index=["Assets"])
+    handle.financials = pd.DataFrame({pd.Timestamp("2023-09-30"): [2.0]}, index=["Revenue"])
+    handle.cashflow = pd.DataFrame({pd.Timestamp("2023-09-30"): [3.0]}, index=["FCF"])
+
+    root = tmp_path / "fixtures"
+    record_fixtures(["AAPL"], str(root), period="2y", source=source)
+    return root
+
+
+@pytest.fixture
+def replay(fixture_dir):
+    provider = ReplayProvider(str(fixture_dir))
+    set_provider(provider)
+    yield provider
+    set_provider(None)
+
+
+class TestReplayProvider:
+    def test_period_is_relative_to_last_recorded_bar(self, replay):
+        df = replay.download("AAPL", period="1mo")
+        assert df.index[-1] == pd.Timestamp("2024-06-28")
+        assert df.index[0] >= pd.Timestamp("2024-05-28")
+
+    def test_start_end_range(self, replay):
+        df = replay.download("AAPL", start=pd.Timestamp("2024-06-01"), end=pd.Timestamp("2024-06-10"))
+        assert df.index.min() >= pd.Timestamp("2024-06-01")
+        assert df.index.max() < pd.Timestamp("2024-06-10")
+
+    def test_grouped_download_and_unknown_ticker(self, replay):
+        panel = replay.download(["AAPL", "NOPE"], period="1y", group_by="ticker")
+        assert list(panel.columns.get_level_values(0).unique()) == ["AAPL"]
+        assert replay.download("NOPE", period="1y").empty
+
+    def test_ticker_handle_serves_fundamentals(self, replay):
+        stock = replay.ticker("aapl")
+        assert stock.info["sector"] == "Technology"
+        assert stock.news == [{"title": "Apple ships"}]
+        assert stock.financials.iloc[0, 0] == 2.0
+        assert replay.ticker("NOPE").info == {}
+
+    def test_latency_is_applied(self, fixture_dir):
+        provider = ReplayProvider(str(fixture_dir), latency_ms=30)
+        started = time.perf_counter()
+        provider.download("AAPL", period="1mo")
+        assert time.perf_counter() - started >= 0.03
+
+    def test_data_loader_runs_offline(self, replay):
+        df = get_stock_data("AAPL", period="max", interval="1d")
+        assert len(df) == 400
+
+        fundamentals = get_fundamentals("AAPL")
+        assert fundamentals["info"]["longName"] == "Apple Inc."
+        assert fundamentals["news"][0]["title"] == "Apple ships"
+
+
+class TestGetProvider:
+    def test_default_provider_is_yfinance(self):
+        assert isinstance(get_provider(), YFinanceProvider)
+
+    def test_configured_replay_provider(self, monkeypatch, tmp_path):
+        monkeypatch.setitem(config.MARKET_DATA, "PROVIDER", "replay")
+        monkeypatch.setitem(config.MARKET_DATA, "REPLAY_DIR", str(tmp_path))
+        provider = get_provider()
+        assert isinstance(provider, ReplayProvider)
+        assert provider.root == str(tmp_path)
+
+    def test_unknown_provider_raises(self, monkeypatch):
+        monkeypatch.setitem(config.MARKET_DATA, "PROVIDER", "bloomberg")
+        with pytest.raises(ConfigurationError):
+            get_provider()
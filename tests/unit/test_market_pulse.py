@@ -249,6 +249,72 @@ class TestCreateTechnicalChart:
         bar_traces = [t for t in fig.data if isinstance(t, go.Bar)]
         assert len(bar_traces) > 0
 
+    def test_chart_caps_points_per_trace(self):
+        """Test long histories are downsampled to max_points per trace."""
+        from modules.market_pulse import _create_technical_chart
+
+        df = create_mock_stock_data(days=2000)
+
+        fig = _create_technical_chart(df, "SPY", max_points=300)
+
+        assert all(len(trace.x) <= 300 for trace in fig.data)
+        assert fig.data[0].high.max() == df["High"].max()
+
+    def test_volume_colors_follow_open_close(self):
+        """Test volume colors are green when Open >= Close, red otherwise."""
+        from modules.market_pulse import _create_technical_chart
+        import plotly.graph_objects as go
+
+        df = create_mock_stock_data()
+        fig = _create_technical_chart(df, "SPY")
+
+        volume = next(t for t in fig.data if isinstance(t, go.Bar))
+        expected = (df["Open"] >= df["Close"]).astype(int).tolist()
+        assert list(volume.marker.color) == expected
+
+    def test_webgl_option_switches_line_traces(self):
+        """Test use_webgl draws the indicator lines with Scattergl."""
+        from modules.market_pulse import _create_technical_chart
+        import plotly.graph_objects as go
+
+        df = create_mock_stock_data()
+
+        fig = _create_technical_chart(df, "SPY", use_webgl=True)
+
+        assert sum(isinstance(t, go.Scattergl) for t in fig.data) == 4
+        assert not any(isinstance(t, go.Scattergl) for t in _create_technical_chart(df, "SPY").data)
+
+    def test_chart_draws_pivot_levels(self):
+        """Test the strongest pivot levels are drawn on the price panel."""
+        from modules.market_pulse import _create_technical_chart
+        from utils.support_resistance import find_levels
+
+        df = create_mock_stock_data(days=120)
+
+        fig = _create_technical_chart(df, "SPY")
+
+        level_traces = [t for t in fig.data if t.name in ("Support levels", "Resistance levels")]
+        drawn = sorted(y for t in level_traces for y in t.y[0::3])
+        assert drawn == sorted(find_levels(df)["level"])
+
+    @patch("modules.market_pulse._create_technical_chart")
+    def test_cached_chart_reused_until_new_bar(self, mock_create_chart):
+        """Test the figure is built once per range/last bar and reused on reruns."""
+        from modules.market_pulse import _technical_chart
+
+        df = create_mock_stock_data()
+        mock_create_chart.side_effect = lambda frame, ticker: MagicMock()
+
+        first = _technical_chart(df, "CACHE", "1d")
+        again = _technical_chart(df.copy(), "CACHE", "1d")
+        updated = df.copy()
+        updated.iloc[-1, updated.columns.get_loc("Close")] += 1.0
+        revised = _technical_chart(updated, "CACHE", "1d")
+
+        assert first is again
+        assert revised is not first
+        assert mock_create_chart.call_count == 2
+
 
 class TestPredictiveIndicators:
     """Test predictive indicator functionality."""
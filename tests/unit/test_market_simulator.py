@@ -0,0 +1,78 @@
+"""Unit tests for the correlated multi-asset market simulator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.market_simulator import MarketSimulator, read_simulated_panel
+
+
+def test_factor_model_returns_are_correlated_as_modelled():
+    sim = MarketSimulator(40, seed=1)
+    closes = sim.next_chunk(4000)["Close"].astype(np.float64)
+
+    returns = np.diff(np.log(closes), axis=0)
+    empirical = np.corrcoef(returns.T)
+    assert np.abs(empirical - sim.correlation()).max() < 0.1
+    assert empirical[np.triu_indices(40, 1)].mean() > 0.1  # shared market factor
+
+
+def test_covariance_input_uses_cholesky():
+    cov = np.array([[0.04, 0.036], [0.036, 0.09]])  # correlation 0.6
+    sim = MarketSimulator(2, seed=2, covariance=cov)
+
+    closes = sim.next_chunk(5000)["Close"].astype(np.float64)
+    returns = np.diff(np.log(closes), axis=0)
+    assert np.corrcoef(returns.T)[0, 1] == pytest.approx(0.6, abs=0.05)
+    np.testing.assert_allclose(sim.annual_vol, [0.2, 0.3])
+
+
+def test_chunks_continue_prices_and_dates():
+    sim = MarketSimulator(3, seed=3)
+    first, second = list(sim.chunks(20, chunk_bars=10))
+
+    assert len(first) == 30 and list(first["Ticker"][:3]) == sim.symbols
+    last_close = first.groupby("Ticker", observed=True)["Close"].last()
+    next_open = second.groupby("Ticker", observed=True)["Open"].first()
+    np.testing.assert_allclose(next_open, last_close, rtol=0.01)
+    assert second["Date"].min() > first["Date"].max()
+    assert ((first["High"] >= first[["Open", "Close"]].max(axis=1)) &
+            (first["Low"] <= first[["Open", "Close"]].min(axis=1))).all()
+
+
+def test_chunk_dates_follow_business_days():
+    sim = MarketSimulator(1, seed=6, start="2015-01-03")  # a Saturday
+    dates = np.concatenate([sim.next_chunk(n)["Date"] for n in (7, 300, 50)])
+
+    pd.testing.assert_index_equal(
+        pd.DatetimeIndex(dates), pd.bdate_range("2015-01-03", periods=357), check_exact=True
+    )
+
+
+def test_intraday_bars_stay_inside_the_session():
+    sim = MarketSimulator(2, interval="5m", seed=4)
+    dates = pd.DatetimeIndex(sim.next_chunk(100)["Date"])
+
+    assert dates[0] == pd.Timestamp("2015-01-02 09:30")
+    assert dates[77] == pd.Timestamp("2015-01-02 15:55")
+    assert dates[78] == pd.Timestamp("2015-01-05 09:30")
+
+
+def test_parquet_round_trip(tmp_path):
+    path = str(tmp_path / "sim.parquet")
+    sim = MarketSimulator(5, seed=5)
+
+    rows = sim.to_parquet(path, bars=25, chunk_bars=10)
+    panel = read_simulated_panel(path, tickers=["SIM00001", "SIM00003"])
+
+    assert rows == 125
+    assert panel.index.names == ["Ticker", "Date"]
+    assert sorted(panel.index.get_level_values("Ticker").unique()) == ["SIM00001", "SIM00003"]
+    assert len(panel.xs("SIM00001")) == 25
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        MarketSimulator(2, interval="2h")
+    with pytest.raises(ValueError):
+        MarketSimulator(2, covariance=np.array([[1.0, 2.0], [2.0, 1.0]]))
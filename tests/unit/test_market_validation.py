@@ -0,0 +1,121 @@
+"""Tests for the vectorized OHLCV validator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_generator import generate_market_data, validate_market_data
+from utils.market_simulator import MarketSimulator
+from utils.market_validation import (
+    RULES,
+    StreamingValidator,
+    ValidationReport,
+    validate_ohlcv,
+)
+
+
+def _bars(n=50):
+    close = np.linspace(100.0, 120.0, n)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": np.full(n, 1_000_000),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="D"),
+    )
+
+
+def test_clean_data_passes():
+    report = validate_ohlcv(_bars())
+
+    assert report.ok
+    assert report.rows == 50
+    assert all(count == 0 for count in report.counts.values())
+
+
+def test_report_counts_every_rule_and_row():
+    df = _bars()
+    df.iloc[3, df.columns.get_loc("High")] = 90.0    # below every other price
+    df.iloc[7, df.columns.get_loc("Low")] = 130.0     # above every other price
+    df.iloc[10, df.columns.get_loc("Open")] = -1.0
+    df.iloc[12, df.columns.get_loc("Volume")] = -5
+    df.iloc[20, df.columns.get_loc("Close")] = np.nan
+    df.index = df.index[:30].append(df.index[29:49])  # duplicate timestamp at row 30
+
+    report = validate_ohlcv(df)
+
+    assert not report.ok
+    assert report.violations["high_below_other"].tolist() == [3, 7]
+    assert report.violations["low_above_other"].tolist() == [3, 7, 10]
+    assert report.violations["non_positive_price"].tolist() == [10]
+    assert report.violations["negative_volume"].tolist() == [12]
+    assert report.violations["missing_price"].tolist() == [20]
+    assert report.violations["unordered_timestamp"].tolist() == [30]
+    assert report.summary().loc["low_above_other", "failures"] == 3
+
+
+def test_validate_market_data_raises_first_legacy_message():
+    df = generate_market_data("AAPL", days=60, seed=1)
+    assert validate_market_data(df)
+
+    df.loc[5, "Volume"] = -1
+    with pytest.raises(ValueError, match=RULES["negative_volume"]):
+        validate_market_data(df)
+    df.loc[9, "High"] = 0.0
+    with pytest.raises(ValueError, match="High price must be >= all other prices"):
+        validate_market_data(df)
+
+
+def test_validate_market_data_keeps_its_original_rules():
+    df = generate_market_data("AAPL", days=60, seed=1)
+    df.loc[3, "Close"] = np.nan
+    long_format = pd.concat([df, df.assign(Symbol="MSFT")], ignore_index=True)
+
+    assert validate_market_data(df)
+    assert validate_market_data(long_format)  # repeated dates across tickers
+    assert not validate_ohlcv(df).ok  # the full validator still reports the gap
+
+
+def test_streaming_matches_whole_frame_with_global_rows():
+    df = _bars(100)
+    df.iloc[[5, 55, 99], df.columns.get_loc("Low")] = 500.0
+    validator = StreamingValidator()
+
+    report = validator.validate(df.iloc[i:i + 30] for i in range(0, 100, 30))
+
+    whole = validate_ohlcv(df)
+    assert report.rows == 100
+    assert report.counts == whole.counts
+    np.testing.assert_array_equal(
+        report.violations["low_above_other"], whole.violations["low_above_other"]
+    )
+
+
+def test_streaming_detects_order_across_chunks_and_caps_rows():
+    df = _bars(40)
+    validator = StreamingValidator(max_rows=2)
+    validator.update(df.iloc[20:])
+    validator.update(df.iloc[:20])  # starts before the previous chunk ended
+
+    assert validator.report.violations["unordered_timestamp"].tolist() == [20]
+
+    bad = _bars(10)
+    bad["Volume"] = -1
+    capped = validator.update(bad)
+    assert capped.counts["negative_volume"] == 10
+    assert len(validator.report.violations["negative_volume"]) == 2
+    assert validator.report.counts["negative_volume"] == 10
+
+
+def test_simulated_chunks_are_valid():
+    sim = MarketSimulator(n_assets=20, seed=3)
+    validator = StreamingValidator(check_order=False)
+
+    report = validator.validate(sim.chunks(bars=60, chunk_bars=25))
+
+    assert report.ok
+    assert report.rows == 20 * 60
+    assert isinstance(ValidationReport().merge(report), ValidationReport)
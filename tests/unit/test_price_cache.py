@@ -0,0 +1,126 @@
+"""Unit tests for the persistent price cache."""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.price_cache import PriceCache, get_price_cache, period_start
+
+
+def _frame(start="2024-01-01", periods=10):
+    dates = pd.date_range(start=start, periods=periods, freq="D")
+    return pd.DataFrame(
+        {
+            "Open": np.arange(periods, dtype=float) + 100,
+            "High": np.arange(periods, dtype=float) + 101,
+            "Low": np.arange(periods, dtype=float) + 99,
+            "Close": np.arange(periods, dtype=float) + 100.5,
+            "Volume": np.arange(periods, dtype=np.int64) + 1000,
+        },
+        index=dates,
+    )
+
+
+class TestPeriodStart:
+    def test_period_start_years(self):
+        now = pd.Timestamp("2025-06-15 13:45")
+        assert period_start("1y", now) == pd.Timestamp("2024-06-15")
+
+    def test_period_start_ytd_and_max(self):
+        now = pd.Timestamp("2025-06-15")
+        assert period_start("ytd", now) == pd.Timestamp("2025-01-01")
+        assert period_start("max", now) is None
+
+    def test_period_start_rejects_unknown(self):
+        with pytest.raises(ValueError):
+            period_start("7y")
+
+
+class TestPriceCache:
+    def test_read_missing_returns_none(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        assert cache.read("AAPL", "1d") is None
+
+    def test_write_then_read_round_trip(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        df = _frame()
+        cache.write("AAPL", "1d", df, covered_start=pd.Timestamp("2024-01-01"))
+
+        entry = cache.read("aapl", "1d")
+        assert entry is not None
+        pd.testing.assert_frame_equal(entry.frame, df, check_freq=False)
+        assert entry.covered_start == pd.Timestamp("2024-01-01")
+        assert entry.is_fresh(60)
+
+    def test_covers_and_slice(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        cache.write("AAPL", "1d", _frame(), covered_start=pd.Timestamp("2024-01-01"))
+        entry = cache.read("AAPL", "1d")
+
+        assert entry.covers(pd.Timestamp("2024-01-05"))
+        assert not entry.covers(pd.Timestamp("2023-12-01"))
+        assert not entry.covers(None)
+        assert len(entry.slice(pd.Timestamp("2024-01-05"))) == 6
+
+    def test_stale_entry_is_not_fresh(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        cache.write("AAPL", "1d", _frame(), None, fetched_at=time.time() - 3600)
+        assert not cache.read("AAPL", "1d").is_fresh(300)
+
+    def test_merge_deduplicates_and_widens_coverage(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        cache.write("AAPL", "1d", _frame("2024-01-05", 5), pd.Timestamp("2024-01-05"))
+
+        update = _frame("2024-01-01", 7)
+        update["Close"] = 1.0
+        merged = cache.merge("AAPL", "1d", update, pd.Timestamp("2024-01-01"))
+
+        assert merged.index.is_unique
+        assert len(merged) == 9
+        # Newer rows win on overlapping timestamps
+        assert merged.loc["2024-01-06", "Close"] == 1.0
+        assert cache.read("AAPL", "1d").covered_start == pd.Timestamp("2024-01-01")
+
+    def test_metadata_lives_in_the_parquet_file(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        cache.write("AAPL", "1d", _frame(), covered_start=pd.Timestamp("2024-01-01"))
+
+        data_path, _ = cache._paths("AAPL", "1d")
+        assert os.listdir(os.path.dirname(data_path)) == ["AAPL.parquet"]
+        # A Parquet file without the coverage metadata is not trusted
+        _frame().to_parquet(data_path)
+        assert cache.read("AAPL", "1d") is None
+
+    def test_concurrent_merges_keep_every_row(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        days = _frame("2024-01-01", 16)
+        threads = [
+            threading.Thread(target=cache.merge, args=("AAPL", "1d", days.iloc[[i]], None))
+            for i in range(len(days))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entry = cache.read("AAPL", "1d")
+        pd.testing.assert_frame_equal(entry.frame, days, check_freq=False)
+
+    def test_corrupt_file_is_treated_as_miss(self, tmp_path):
+        cache = PriceCache(str(tmp_path))
+        cache.write("AAPL", "1d", _frame(), None)
+        data_path, _ = cache._paths("AAPL", "1d")
+        with open(data_path, "wb") as f:
+            f.write(b"not parquet")
+
+        assert cache.read("AAPL", "1d") is None
+
+    def test_get_price_cache_respects_config(self, monkeypatch):
+        from utils import config
+
+        monkeypatch.setitem(config.PRICE_CACHE, "ENABLED", False)
+        assert get_price_cache() is None
@@ -0,0 +1,112 @@
+"""Tests for the universe technical screener."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from modules.market_pulse import _predict_trend
+from utils.data_generator import generate_ohlcv_panel
+from utils.data_loader import compute_indicators
+from utils.screener import (
+    SCAN_COLUMNS,
+    macd_cross_status,
+    rsi_regimes,
+    scan_universe,
+    score_panel,
+    trend_scores,
+)
+
+
+def _panel(symbols=("AAPL", "MSFT", "NVDA", "TSLA"), days=200):
+    return generate_ohlcv_panel(list(symbols), days=days, seed=8)
+
+
+def _closes():
+    return _panel()["Close"].unstack("Ticker")
+
+
+def test_trend_scores_match_predict_trend():
+    rng = np.random.default_rng(0)
+    rsi = np.r_[rng.uniform(0, 100, 500), 70, 30, 50, np.nan]
+    macd = np.r_[rng.normal(0, 2, 500), 1, -1, 0, 0.5]
+    signal = np.r_[rng.normal(0, 2, 500), 0, 0, 1, 0]
+
+    trend, confidence, _ = trend_scores(rsi, macd, signal)
+
+    expected = [_predict_trend(r, m, s)[:2] for r, m, s in zip(rsi, macd, signal)]
+    assert list(trend) == [t for t, _ in expected]
+    np.testing.assert_allclose(confidence, [c for _, c in expected])
+
+
+def test_rsi_regimes_and_macd_cross_status():
+    assert list(rsi_regimes([75, 25, 60, 40])) == ["Overbought", "Oversold", "Bullish", "Bearish"]
+
+    macd = np.array([[np.nan, -1.0, 1.0, 1.0], [np.nan, 1.0, 1.0, -1.0], [1.0, 2.0, 1.0, -1.0]])
+    signal = np.zeros_like(macd)
+
+    status = macd_cross_status(macd, signal, lookback=2)
+
+    assert list(status) == ["Above signal", "Bullish cross", "Above signal", "Bearish cross"]
+
+
+def test_score_panel_matches_single_ticker_rules():
+    panel = _panel()
+    closes = panel["Close"].unstack("Ticker")
+
+    table = score_panel(closes)
+
+    assert list(table.columns) == SCAN_COLUMNS
+    assert set(table.index) == set(closes.columns)
+    assert table["Score"].is_monotonic_decreasing
+    for ticker in closes.columns:
+        latest = compute_indicators(panel.xs(ticker, level="Ticker")).iloc[-1]
+        trend, confidence, _ = _predict_trend(latest["RSI"], latest["MACD"], latest["Signal"])
+        assert table.loc[ticker, "Trend"] == trend
+        assert table.loc[ticker, "Confidence"] == confidence
+    assert table.loc["AAPL", "Name"] == "Apple Inc."
+
+
+def test_score_panel_handles_ragged_histories():
+    closes = _closes()
+    closes.loc[closes.index[-5:], "MSFT"] = np.nan  # stopped trading
+    closes.loc[closes.index[::7], "NVDA"] = np.nan  # gaps
+    closes["NEWCO"] = np.nan
+    closes.loc[closes.index[-10:], "NEWCO"] = 50.0  # too short for MACD/Signal
+
+    table = score_panel(closes)
+
+    assert "NEWCO" not in table.index
+    assert table.loc["MSFT", "Close"] == closes["MSFT"].dropna().iloc[-1]
+    assert not table[["Close", "Change %", "RSI"]].isna().any().any()
+    assert score_panel(pd.DataFrame()).empty
+
+
+def test_mixed_calendar_watchlist_scores_each_ticker_on_its_own_bars():
+    panel = _panel(("AAPL",))
+    aapl = panel.xs("AAPL", level="Ticker")
+    days = pd.date_range(aapl.index[0], aapl.index[-1], freq="D")
+    btc = pd.Series(30000 * np.exp(np.cumsum(np.random.default_rng(2).normal(0, 0.02, len(days)))), index=days)
+
+    closes = pd.concat({"AAPL": aapl["Close"], "BTC-USD": btc}, axis=1)
+    assert closes["AAPL"].isna().any()  # weekends inside AAPL's history
+
+    alone = score_panel(aapl[["Close"]].rename(columns={"Close": "AAPL"}))
+    mixed = score_panel(closes)
+
+    pd.testing.assert_series_equal(mixed.loc["AAPL"], alone.loc["AAPL"])
+    latest = compute_indicators(aapl).iloc[-1]
+    assert mixed.loc["AAPL", "RSI"] == latest["RSI"]
+    assert mixed.loc["AAPL", "Trend"] == _predict_trend(latest["RSI"], latest["MACD"], latest["Signal"])[0]
+    assert mixed.loc["AAPL", "Change %"] == (aapl["Close"].iloc[-1] / aapl["Close"].iloc[-2] - 1) * 100
+
+
+@patch("utils.screener.get_stock_data_batch")
+def test_scan_universe_uses_one_batch(mock_batch):
+    closes = _closes()
+    mock_batch.return_value = {ticker: closes[[ticker]].set_axis(["Close"], axis=1) for ticker in closes}
+
+    table = scan_universe(["AAPL", "MSFT", "NVDA", "TSLA"], period="1y")
+
+    mock_batch.assert_called_once_with(["AAPL", "MSFT", "NVDA", "TSLA"], period="1y", interval="1d")
+    assert len(table) == 4
@@ -0,0 +1,79 @@
+"""Unit tests for request coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=2)
+        return {"rows": 252}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("AAPL", fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    # Give every thread time to join the in-flight call before releasing it
+    deadline = time.time() + 2
+    while flight._calls.get("AAPL") is None or flight._calls["AAPL"].waiters < 7:
+        if time.time() > deadline:
+            break
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_errors_are_shared_and_key_is_released():
+    flight = SingleFlight()
+
+    def failing():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("MSFT", failing)
+
+    assert not flight.in_flight("MSFT")
+    assert flight.do("MSFT", lambda: 42) == 42
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do("A", lambda: 1) == 1
+    assert flight.do("B", lambda: 2) == 2
+
+
+def test_submit_deduplicates_pending_background_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        release.wait(timeout=2)
+        return "done"
+
+    first = flight.submit("refresh", refresh)
+    second = flight.submit("refresh", refresh)
+    assert first is second
+    assert flight.in_flight("refresh")
+
+    release.set()
+    assert first.result(timeout=2) == "done"
+    assert len(calls) == 1
@@ -0,0 +1,167 @@
+"""Unit tests for intraday streaming bar buffers."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import streaming
+from utils.indicators import add_all_indicators, rsi_wilder
+from utils.streaming import BarRingBuffer, BarStream, ReplayBarSource, get_bar_stream
+
+
+def _minute_bars(n, start="2024-01-02 09:30"):
+    index = pd.date_range(start, periods=n, freq="1min", tz="America/New_York")
+    close = 100 + np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": np.full(n, 1000.0),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_streams():
+    yield
+    for stream in list(streaming._streams.values()):
+        stream.stop()
+    streaming._streams.clear()
+
+
+def test_latest_returns_newest_bars_after_wraparound():
+    buffer = BarRingBuffer(capacity=5)
+    bars = _minute_bars(12)
+    buffer.extend(bars)
+
+    times, values = buffer.latest(3)
+
+    assert len(buffer) == 5
+    assert list(values[:, 3]) == [109.0, 110.0, 111.0]
+    assert pd.Timestamp(times[-1]) == bars.index[-1].tz_localize(None)
+
+
+def test_latest_is_a_read_only_view_of_the_buffer():
+    buffer = BarRingBuffer(capacity=4)
+    buffer.extend(_minute_bars(6))
+
+    _, values = buffer.latest(3)
+
+    assert np.shares_memory(values, buffer._values)
+    assert not values.flags.writeable
+    assert np.shares_memory(buffer.frame(3)["Close"].to_numpy(), buffer._values)
+
+
+def test_full_window_read_is_not_overwritten_by_next_append():
+    buffer = BarRingBuffer(capacity=4)
+    bars = _minute_bars(6)
+    buffer.extend(bars.iloc[:5])
+
+    frame = buffer.frame()
+    _, partial = buffer.latest(3)
+    buffer.append(bars.index[5], [1, 2, 3, 4, 5])
+
+    assert list(frame["Close"]) == [101.0, 102.0, 103.0, 104.0]
+    assert not frame.to_numpy().flags.writeable
+    assert list(partial[:, 3]) == [102.0, 103.0, 104.0]
+
+
+def test_same_timestamp_updates_forming_bar_and_older_bars_are_ignored():
+    buffer = BarRingBuffer(capacity=4)
+    bars = _minute_bars(3)
+    buffer.extend(bars)
+
+    assert buffer.append(bars.index[-1], [1, 2, 3, 4, 5]) is True
+    assert buffer.append(bars.index[0], [9, 9, 9, 9, 9]) is False
+
+    frame = buffer.frame()
+    assert len(frame) == 3
+    assert frame["Close"].iloc[-1] == 4
+
+
+def test_stream_polls_new_bars_from_replay_source():
+    bars = _minute_bars(10)
+    stream = BarStream("AAPL", "1m", ReplayBarSource(bars, bars_per_poll=2, seed_bars=4), capacity=8)
+
+    stream.poll_once()
+    assert len(stream.frame()) == 4
+
+    stream.poll_once()
+    frame = stream.frame()
+    assert len(frame) == 6
+    assert frame["Close"].iloc[-1] == bars["Close"].iloc[5]
+
+
+def test_get_bar_stream_shares_one_stream_per_ticker_and_interval():
+    source = ReplayBarSource(_minute_bars(10), seed_bars=5)
+
+    first = get_bar_stream("aapl", "1m", source=source)
+    second = get_bar_stream("AAPL", "1m")
+
+    assert first is second
+    assert first.running
+    assert len(first.frame()) == 5
+
+
+def test_slow_seed_load_does_not_block_other_streams():
+    release = threading.Event()
+
+    class SlowSource(ReplayBarSource):
+        def poll(self, since):
+            release.wait(timeout=5)
+            return super().poll(since)
+
+    slow = threading.Thread(
+        target=get_bar_stream, args=("MSFT", "1m", SlowSource(_minute_bars(10), seed_bars=5))
+    )
+    slow.start()
+    try:
+        fast = get_bar_stream("AAPL", "1m", source=ReplayBarSource(_minute_bars(10), seed_bars=5))
+        assert fast.running and not release.is_set()
+    finally:
+        release.set()
+        slow.join()
+    assert get_bar_stream("MSFT", "1m").running
+
+
+def test_get_bar_stream_rejects_non_intraday_interval():
+    with pytest.raises(ValueError):
+        get_bar_stream("AAPL", "1d")
+
+
+def test_stream_keeps_indicators_in_step_with_new_and_revised_bars():
+    bars = _minute_bars(60)
+    stream = BarStream("AAPL", "1m", ReplayBarSource(bars, bars_per_poll=5, seed_bars=40))
+    stream.poll_once()
+    stream.poll_once()
+
+    # The feed revises the newest (still forming) bar
+    revised = bars.iloc[[44]].copy()
+    revised["Close"] = 150.0
+    stream.source = ReplayBarSource(revised, seed_bars=1)
+    stream.poll_once()
+
+    closes = np.concatenate([bars["Close"].to_numpy()[:44], [150.0]])
+    latest = stream.latest_indicators()
+    assert len(stream.frame()) == 45
+    assert stream.indicators.bars == 45
+    assert latest["MA7"] == pytest.approx(closes[-7:].mean())
+
+
+def test_first_poll_repeating_the_seeded_bar_keeps_indicators_exact():
+    bars = _minute_bars(60)
+    bars["Close"] = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.01, 60)))
+    stream = BarStream("AAPL", "1m", ReplayBarSource(bars, bars_per_poll=5, seed_bars=40))
+    stream.poll_once()  # seeds 40 bars
+    stream.poll_once()  # starts at the newest seeded bar (inclusive)
+
+    latest = stream.latest_indicators()
+    expected = add_all_indicators(bars.iloc[:45][["Close"]].reset_index(drop=True)).iloc[-1]
+    for column in ["MACD", "Signal", "Volatility"]:
+        assert latest[column] == pytest.approx(expected[column], rel=1e-8)
+    assert latest["RSI"] == pytest.approx(rsi_wilder(bars["Close"].to_numpy()[:45], 14)[-1], rel=1e-10)
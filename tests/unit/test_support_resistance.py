@@ -0,0 +1,86 @@
+"""Tests for pivot-based support/resistance levels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_generator import generate_ohlcv_panel
+from utils.support_resistance import (
+    LEVEL_COLUMNS,
+    cluster_levels,
+    find_levels,
+    find_pivots,
+    nearest_levels,
+)
+
+
+def _history(days=800, seed=4):
+    return generate_ohlcv_panel(["AAPL"], days=days, seed=seed).xs("AAPL", level="Ticker")
+
+
+def test_pivots_match_centred_argmax():
+    df = _history(400)
+    width = 3
+
+    pivots = find_pivots(df["High"], df["Low"], width)
+
+    span = 2 * width + 1
+    # Reference: the centred window's (oldest) argmax/argmin lands on the middle bar
+    highs = df["High"].rolling(span, center=True).apply(np.argmax, raw=True) == width
+    lows = df["Low"].rolling(span, center=True).apply(np.argmin, raw=True) == width
+    np.testing.assert_array_equal(pivots.highs, highs.to_numpy())
+    np.testing.assert_array_equal(pivots.lows, lows.to_numpy())
+    assert not pivots.highs[-width:].any()
+
+
+def test_pivots_reject_bad_width_and_short_input():
+    with pytest.raises(ValueError):
+        find_pivots([1.0, 2.0], [1.0, 2.0], width=0)
+    assert not find_pivots([1.0, 3.0, 2.0], [1.0, 0.5, 2.0], width=2).highs.any()
+
+
+def test_cluster_levels_groups_within_tolerance():
+    prices = [100.0, 100.5, 101.0, 110.0, 110.2, 130.0]
+    volumes = [1, 1, 1, 1, 1, 4]
+
+    level, touches, volume, strength, first, last = cluster_levels(
+        prices, volumes, positions=[0, 5, 9, 2, 7, 4], tolerance=0.015
+    )
+
+    np.testing.assert_array_equal(touches, [3, 2, 1])
+    np.testing.assert_allclose(level[:2], [100.5, 110.1])
+    np.testing.assert_array_equal(volume, [3, 2, 4])
+    assert strength[2] == pytest.approx(4 / np.mean(volumes))
+    np.testing.assert_array_equal(first, [0, 2, 4])
+    np.testing.assert_array_equal(last, [9, 7, 4])
+
+
+def test_cluster_levels_do_not_chain():
+    # Evenly spaced pivots each within tolerance of the next
+    prices = 100.0 * 1.01 ** np.arange(50)
+
+    _, touches, *_ = cluster_levels(prices, np.ones(50), np.arange(50), tolerance=0.015)
+
+    assert touches.max() <= 2
+
+
+def test_find_levels_ranked_and_classified():
+    df = _history()
+
+    levels = find_levels(df, top_k=5)
+
+    assert list(levels.columns) == LEVEL_COLUMNS
+    assert len(levels) == 5
+    assert levels["strength"].is_monotonic_decreasing
+    close = df["Close"].iloc[-1]
+    assert ((levels["level"] < close) == (levels["kind"] == "support")).all()
+    assert levels["level"].between(df["Low"].min(), df["High"].max()).all()
+    assert len(find_levels(df, top_k=0)) >= 5
+
+
+def test_nearest_levels():
+    levels = pd.DataFrame({"level": [90.0, 95.0, 105.0, 120.0]})
+
+    assert nearest_levels(levels, 100.0) == (95.0, 105.0)
+    support, resistance = nearest_levels(levels, 130.0)
+    assert support == 120.0 and np.isnan(resistance)
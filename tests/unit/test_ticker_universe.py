@@ -0,0 +1,73 @@
+"""Unit tests for the local ticker universe."""
+
+import pytest
+
+from utils import config
+from utils.exceptions import InvalidTickerError
+from utils.ticker_universe import (
+    TickerInfo,
+    TickerUniverse,
+    get_ticker_universe,
+    is_valid_ticker,
+    mark_invalid,
+    validate_ticker,
+)
+
+
+@pytest.fixture
+def universe():
+    return TickerUniverse(
+        [
+            TickerInfo("AAPL", "Apple Inc.", "NASDAQ", "Technology"),
+            TickerInfo("AMD", "Advanced Micro Devices Inc.", "NASDAQ", "Technology"),
+            TickerInfo("AMZN", "Amazon.com Inc.", "NASDAQ", "Consumer Cyclical"),
+            TickerInfo("MSFT", "Microsoft Corporation", "NASDAQ", "Technology"),
+        ]
+    )
+
+
+def test_membership_is_case_insensitive(universe):
+    assert "aapl" in universe
+    assert "TSLA" not in universe
+    assert universe.get("msft").name == "Microsoft Corporation"
+
+
+def test_search_orders_prefix_then_name_then_fuzzy(universe):
+    assert [info.symbol for info in universe.search("am")] == ["AMD", "AMZN"]
+    assert [info.symbol for info in universe.search("micro")] == ["AMD", "MSFT"]
+    assert universe.search("APPL", limit=1)[0].symbol == "AAPL"
+
+
+def test_bundled_universe_loads():
+    universe = get_ticker_universe()
+
+    assert len(universe) > 100
+    assert "SPY" in universe
+    assert "^GSPC" in universe
+
+
+@pytest.mark.parametrize("symbol", ["", "   ", "AA PL", "$AAPL", "INVALID_TICKER_XYZ123"])
+def test_malformed_symbols_are_rejected(symbol):
+    with pytest.raises(InvalidTickerError):
+        validate_ticker(symbol)
+
+
+def test_validate_normalizes_and_accepts_unknown_symbols_by_default():
+    assert validate_ticker(" brk-b ") == "BRK-B"
+    assert validate_ticker("vod.l") == "VOD.L"
+
+
+def test_recently_rejected_symbols_fail_fast_with_suggestions():
+    mark_invalid("APPL")
+
+    with pytest.raises(InvalidTickerError, match="Did you mean"):
+        validate_ticker("appl")
+    assert is_valid_ticker("AAPL")
+
+
+def test_strict_mode_rejects_symbols_outside_universe(monkeypatch):
+    monkeypatch.setitem(config.TICKER_UNIVERSE, "STRICT", True)
+
+    assert validate_ticker("NVDA") == "NVDA"
+    with pytest.raises(InvalidTickerError):
+        validate_ticker("ZZZZ")
@@ -0,0 +1,343 @@
+"""
+Vectorized backtests of the Market Pulse and ChiefBot signal rules.
+
+The Bullish/Bearish/Neutral output of market_pulse._predict_trend and the
+technical part of the Multi-Agent ChiefBot score are turned into position
+series over full histories and evaluated with NumPy, for every ticker of
+a (dates x tickers) close matrix at once:
+
+- rule_positions: indicators for the whole matrix, then the rule as array
+  comparisons (shared with utils.screener.trend_votes)
+- backtest_positions: returns, costs, equity, drawdown, hit rate and
+  turnover per ticker, all along axis 0
+- run_backtests: fans (parameter set x ticker chunk) tasks out on a process
+  pool and stacks the per-ticker metrics
+
+A position set at a bar's close earns the next bar's return, so signals
+never see the return they are scored on.
+
+Example:
+    >>> grid = parameter_grid(rules=["market_pulse", "chiefbot"], rsi_periods=[9, 14, 21])
+    >>> results = run_backtests(closes, grid)
+    >>> summarize(results)
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import BACKTEST, INDICATORS
+from utils.indicators import compact_columns, forward_fill, macd, rsi_wilder
+from utils.logger import get_logger
+from utils.screener import trend_votes
+
+logger = get_logger(__name__)
+
+RULES = ("market_pulse", "chiefbot")
+METRIC_COLUMNS = [
+    "bars",
+    "total_return",
+    "cagr",
+    "volatility",
+    "sharpe",
+    "max_drawdown",
+    "hit_rate",
+    "exposure",
+    "turnover",
+    "trades",
+    "buy_hold_return",
+]
+
+
+class BacktestParams(NamedTuple):
+    """One parameter set: the rule, its indicator periods and the trading assumptions."""
+
+    rule: str = "market_pulse"
+    rsi_period: int = INDICATORS["RSI_PERIOD"]
+    macd_fast: int = INDICATORS["MACD_FAST"]
+    macd_slow: int = INDICATORS["MACD_SLOW"]
+    macd_signal: int = INDICATORS["MACD_SIGNAL"]
+    allow_short: bool = BACKTEST["ALLOW_SHORT"]
+    cost_bps: float = BACKTEST["COST_BPS"]
+
+
+def parameter_grid(
+    rules: Sequence[str] = ("market_pulse",),
+    rsi_periods: Sequence[int] = (INDICATORS["RSI_PERIOD"],),
+    macd_periods: Sequence[Tuple[int, int, int]] = (
+        (INDICATORS["MACD_FAST"], INDICATORS["MACD_SLOW"], INDICATORS["MACD_SIGNAL"]),
+    ),
+    allow_short: Sequence[bool] = (BACKTEST["ALLOW_SHORT"],),
+    cost_bps: Sequence[float] = (BACKTEST["COST_BPS"],),
+) -> List[BacktestParams]:
+    """
+    Every combination of the given rules and parameters.
+
+    Raises:
+        ValueError: If a rule is unknown
+    """
+    unknown = [rule for rule in rules if rule not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown rule(s) {unknown}. Available: {list(RULES)}")
+    return [
+        BacktestParams(rule, rsi, fast, slow, signal, short, cost)
+        for rule, rsi, (fast, slow, signal), short, cost in itertools.product(
+            rules, rsi_periods, macd_periods, allow_short, cost_bps
+        )
+    ]
+
+
+def rule_positions(closes: np.ndarray, params: BacktestParams) -> np.ndarray:
+    """
+    Position (+1 long, 0 flat, -1 short) each rule takes at every bar's close.
+
+    market_pulse: Bullish -> long, Bearish -> short (or flat), Neutral -> flat.
+    chiefbot: the technical votes of the ChiefBot score (RSI < 35 +1,
+    RSI > 65 -1, MACD above/below signal +1/-1); a positive total is long,
+    a negative one short (or flat) and HOLD is flat. News sentiment has no
+    history, so it is left out.
+
+    Args:
+        closes: (bars x tickers) closing prices
+        params: Rule and indicator periods
+
+    Returns:
+        Float array shaped like ``closes``; flat until the indicators are
+        defined. Indicators run on each column's own bars, and rows where a
+        ticker has no close carry its last position
+
+    Raises:
+        ValueError: If the rule is unknown
+    """
+    return _positions(_signals(closes, params), params)
+
+
+def _signals(closes: np.ndarray, params: BacktestParams) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    RSI, MACD and signal line for the parameter set's periods.
+
+    Computed on each column's own bars (see compact_columns); rows where a
+    ticker has no close are NaN.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    compacted, rows = compact_columns(closes)
+    rsi = rsi_wilder(compacted, params.rsi_period)
+    macd_line, signal_line = macd(compacted, params.macd_fast, params.macd_slow, params.macd_signal)
+    if compacted is closes:
+        return rsi, macd_line, signal_line
+    signals = []
+    for values in (rsi, macd_line, signal_line):
+        restored = np.full_like(values, np.nan)
+        np.put_along_axis(restored, rows, values, axis=0)
+        restored[np.isnan(closes)] = np.nan
+        signals.append(restored)
+    return tuple(signals)
+
+
+def _positions(signals: Tuple[np.ndarray, np.ndarray, np.ndarray], params: BacktestParams) -> np.ndarray:
+    rsi, macd_line, signal_line = signals
+    if params.rule == "market_pulse":
+        score = trend_votes(rsi, macd_line, signal_line)
+        positions = (score > 0.3).astype(np.float64) - (score < -0.3)
+    elif params.rule == "chiefbot":
+        with np.errstate(invalid="ignore"):
+            score = (
+                (rsi < 35).astype(np.int8)
+                - (rsi > 65)
+                + np.where(macd_line > signal_line, 1, -1)
+            )
+        positions = np.sign(score).astype(np.float64)
+    else:
+        raise ValueError(f"Unknown rule '{params.rule}'. Available: {list(RULES)}")
+
+    if not params.allow_short:
+        np.maximum(positions, 0.0, out=positions)
+    # Rows without indicators: a ticker not trading keeps its position,
+    # and before the indicators exist it is flat
+    undefined = np.isnan(rsi) | np.isnan(signal_line)
+    if (undefined[1:] <= undefined[:-1]).all():
+        positions[undefined] = 0.0  # only the warm-up: no gaps to carry over
+    else:
+        positions[undefined] = np.nan
+        positions = np.nan_to_num(forward_fill(positions), nan=0.0)
+    return positions
+
+
+def backtest_positions(
+    closes: np.ndarray,
+    positions: np.ndarray,
+    cost_bps: float = BACKTEST["COST_BPS"],
+    bars_per_year: int = BACKTEST["BARS_PER_YEAR"],
+) -> Dict[str, np.ndarray]:
+    """
+    Performance of position series, one column per ticker.
+
+    The position held over bar t -> t+1 is the one set at bar t's close;
+    each change of position costs ``cost_bps`` per unit traded. Rows where
+    a ticker has no close (e.g., weekends in a panel with crypto, or before
+    a listing) are skipped, so each column is evaluated on its own bars.
+
+    Args:
+        closes: (bars x tickers) closing prices
+        positions: Positions shaped like ``closes``
+        cost_bps: Cost per unit of position change, in basis points
+        bars_per_year: Bars per year for annualization
+
+    Returns:
+        Dict mapping each of METRIC_COLUMNS to a per-ticker array
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    positions = np.asarray(positions, dtype=np.float64)
+    compacted, rows = compact_columns(closes)
+    if compacted is not closes:
+        # Rows without a close (now the leading padding) hold nothing
+        positions = np.take_along_axis(positions, rows, axis=0)
+        closes = compacted
+        positions = np.where(np.isnan(closes), 0.0, positions)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = closes[1:] / closes[:-1] - 1.0
+    traded = ~np.isnan(returns)
+    returns = np.where(traded, returns, 0.0)
+
+    held = positions[:-1]
+    changes = np.abs(np.diff(positions, axis=0, prepend=0.0))[:-1]
+    strategy = held * returns - changes * (cost_bps / 1e4)
+    equity = np.cumprod(1.0 + strategy, axis=0)
+    peak = np.maximum.accumulate(equity, axis=0)
+
+    bars = traded.sum(axis=0)
+    years = np.maximum(bars, 1) / bars_per_year
+    active = (held != 0) & traded
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = strategy.sum(axis=0) / np.maximum(bars, 1)
+        std = np.sqrt(((strategy - mean) ** 2 * traded).sum(axis=0) / np.maximum(bars - 1, 1))
+        final = equity[-1] if len(equity) else np.ones(closes.shape[1:])
+        return {
+            "bars": bars,
+            "total_return": final - 1.0,
+            "cagr": final ** (1.0 / years) - 1.0,
+            "volatility": std * np.sqrt(bars_per_year),
+            "sharpe": np.where(std > 0, mean / std * np.sqrt(bars_per_year), np.nan),
+            "max_drawdown": (equity / peak - 1.0).min(axis=0, initial=0.0),
+            "hit_rate": ((strategy > 0) & active).sum(axis=0) / active.sum(axis=0),
+            "exposure": active.sum(axis=0) / np.maximum(bars, 1),
+            "turnover": changes.sum(axis=0) / years,
+            "trades": ((changes > 0) & (held != 0)).sum(axis=0),
+            "buy_hold_return": np.prod(1.0 + returns, axis=0) - 1.0,
+        }
+
+
+def _indicator_key(params: BacktestParams) -> Tuple[int, int, int, int]:
+    return params.rsi_period, params.macd_fast, params.macd_slow, params.macd_signal
+
+
+def _run_task(task: Tuple[List[BacktestParams], np.ndarray, List[str]]) -> List[pd.DataFrame]:
+    """
+    Backtest parameter sets that share indicator periods on one chunk of
+    tickers (runs in a worker process); the indicators are computed once.
+    Returns one frame per parameter set, in the group's order.
+    """
+    group, closes, tickers = task
+    signals = _signals(closes, group[0])
+    frames = []
+    for params in group:
+        metrics = backtest_positions(
+            closes, _positions(signals, params), params.cost_bps, BACKTEST["BARS_PER_YEAR"]
+        )
+        frame = pd.DataFrame(metrics, index=pd.Index(tickers, name="Ticker"), columns=METRIC_COLUMNS)
+        for name, value in params._asdict().items():
+            frame[name] = value
+        frames.append(frame)
+    return frames
+
+
+def run_backtests(
+    closes: pd.DataFrame,
+    params: Optional[Sequence[BacktestParams]] = None,
+    workers: Optional[int] = None,
+    tickers_per_task: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Backtest every parameter set on every ticker, fanned out on a process pool.
+
+    Work is split into (indicator periods x ticker chunk) tasks: parameter
+    sets that differ only in rule, shorting or costs share one indicator
+    pass, and each task is vectorized over its (bars x tickers) block. With
+    one worker (or a single task) everything runs in-process.
+
+    Args:
+        closes: DataFrame of closing prices indexed by date, one column per ticker
+        params: Parameter sets (default: the Market Pulse rule with config periods)
+        workers: Worker processes (default BACKTEST["WORKERS"])
+        tickers_per_task: Tickers per task (default BACKTEST["TICKERS_PER_TASK"])
+
+    Returns:
+        DataFrame with one row per (parameter set, ticker): the
+        BacktestParams fields, Ticker and METRIC_COLUMNS
+
+    Example:
+        >>> closes = get_stock_data_batch(tickers, period="10y", as_panel=True)["Close"].unstack(0)
+        >>> results = run_backtests(closes, parameter_grid(rules=RULES))
+    """
+    params = list(params) if params is not None else [BacktestParams()]
+    workers = BACKTEST["WORKERS"] if workers is None else workers
+    step = tickers_per_task or BACKTEST["TICKERS_PER_TASK"]
+
+    # Each ticker on its own bars (mixed calendars, listings); results are per column
+    values, _ = compact_columns(closes.to_numpy(dtype=np.float64))
+    tickers = [str(ticker) for ticker in closes.columns]
+    groups: Dict[Tuple[int, int, int, int], List[int]] = {}
+    for i, param in enumerate(params):
+        groups.setdefault(_indicator_key(param), []).append(i)
+    chunks = [(group, start) for group in groups.values() for start in range(0, len(tickers), step)]
+    tasks = [
+        ([params[i] for i in group], values[:, start:start + step], tickers[start:start + step])
+        for group, start in chunks
+    ]
+    if not tasks:
+        return pd.DataFrame(columns=list(BacktestParams._fields) + ["Ticker"] + METRIC_COLUMNS)
+
+    logger.info(
+        f"Backtesting {len(params)} parameter sets on {len(tickers)} tickers "
+        f"({len(tasks)} tasks, {min(workers, len(tasks))} workers)"
+    )
+    if workers <= 1 or len(tasks) == 1:
+        outputs = [_run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            outputs = list(executor.map(_run_task, tasks))
+
+    # One block per parameter set in the order given, tickers in column order
+    by_param: Dict[int, List[pd.DataFrame]] = {}
+    for (group, _), frames in zip(chunks, outputs):
+        for i, frame in zip(group, frames):
+            by_param.setdefault(i, []).append(frame)
+    results = pd.concat([frame for i in range(len(params)) for frame in by_param[i]]).reset_index()
+    return results[list(BacktestParams._fields) + ["Ticker"] + METRIC_COLUMNS]
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate run_backtests output per parameter set.
+
+    Returns:
+        DataFrame indexed by the BacktestParams fields with ticker count,
+        ticker-years, median/mean Sharpe, mean total and buy-and-hold return,
+        mean hit rate, mean max drawdown and mean turnover, best Sharpe first
+    """
+    ticker_years = results["bars"] / BACKTEST["BARS_PER_YEAR"]
+    summary = results.assign(ticker_years=ticker_years).groupby(list(BacktestParams._fields)).agg(
+        tickers=("Ticker", "count"),
+        ticker_years=("ticker_years", "sum"),
+        median_sharpe=("sharpe", "median"),
+        mean_sharpe=("sharpe", "mean"),
+        mean_return=("total_return", "mean"),
+        mean_buy_hold=("buy_hold_return", "mean"),
+        hit_rate=("hit_rate", "mean"),
+        max_drawdown=("max_drawdown", "mean"),
+        turnover=("turnover", "mean"),
+    )
+    return summary.sort_values("median_sharpe", ascending=False)
@@ -4,6 +4,8 @@ Centralizes all magic numbers and configuration parameters
 for easier maintenance and updates.
 """
 
+import os
+
 # Market Data Configuration
 BASE_PRICES = {
     "BTC": 95000,  # Bitcoin price as of Nov 2025
@@ -28,7 +30,33 @@ INDICATORS = {
     "MACD_SLOW": 26,      # MACD slow EMA
     "MACD_SIGNAL": 9,     # MACD signal line
     "MA_SHORT": 7,        # Short-term moving average
-    "MA_LONG": 30         # Long-term moving average
+    "MA_LONG": 30,        # Long-term moving average
+    "MA_TREND": 20,       # Trend moving average (MA20)
+    "MA_TREND_LONG": 50,  # Long trend moving average (MA50)
+    "VOLATILITY_WINDOW": 7  # Bars per annualized volatility window
+}
+
+# Process-wide cache of computed indicator columns (utils/indicator_cache.py)
+INDICATOR_CACHE = {
+    "MAX_ENTRIES": int(os.getenv("INDICATOR_CACHE_MAX_ENTRIES", "256")),
+    "MAX_BYTES": int(os.getenv("INDICATOR_CACHE_MAX_MB", "128")) * 1024 * 1024,
+    # Longer tails are recomputed in one vectorized pass instead of bar by bar
+    "MAX_INCREMENTAL_BARS": 500,
+}
+
+# Default parameter grids for batched indicator sweeps (utils/indicator_sweeps.py)
+INDICATOR_SWEEPS = {
+    "RSI_PERIODS": list(range(5, 31)),
+    "MA_WINDOWS": [5, 7, 10, 20, 30, 50, 100, 200],
+    "MA_SHORT_WINDOWS": [5, 7, 10, 15, 20],
+    "MA_LONG_WINDOWS": [20, 30, 50, 100, 200],
+}
+
+# Pivot-based support/resistance levels (utils/support_resistance.py)
+SUPPORT_RESISTANCE = {
+    "PIVOT_WIDTH": 5,  # Bars on each side a pivot must dominate (fractal width)
+    "TOLERANCE": 0.015,  # Pivots within 1.5% of each other form one level
+    "TOP_K": 6,  # Levels drawn on the Market Pulse chart
 }
 
 # Chart Configuration
@@ -36,7 +64,22 @@ CHART_CONFIG = {
     "HEIGHT": 900,
     "TEMPLATE": "plotly_dark",
     "ROW_HEIGHTS": [0.5, 0.25, 0.25],  # Price, RSI, MACD
-    "VERTICAL_SPACING": 0.05
+    "VERTICAL_SPACING": 0.05,
+    # Points per trace sent to the browser; longer ranges are downsampled
+    "MAX_POINTS": int(os.getenv("CHART_MAX_POINTS", "1500")),
+    "WEBGL_MIN_POINTS": 1000,  # Lines switch to WebGL (Scattergl) above this
+    "CACHED_FIGURES": 32,  # Built Market Pulse figures kept across reruns
+}
+
+# Correlated multi-asset simulator (utils/market_simulator.py); annualized figures
+MARKET_SIMULATOR = {
+    "START": "2015-01-02",
+    "FACTORS": 4,  # Market factor plus sector-like factors
+    "MARKET_VOL": 0.18,
+    "FACTOR_VOL": 0.08,
+    "IDIO_VOL_RANGE": (0.15, 0.45),
+    "ANNUAL_DRIFT_RANGE": (-0.02, 0.15),
+    "CHUNK_BARS": 256,  # Bars per generated chunk / Parquet row group
 }
 
 # Volume Configuration
@@ -48,3 +91,74 @@ VOLUME_RANGE = {
 # Asset Categories
 CRYPTO_ASSETS = ["BTC", "ETH"]
 STOCK_ASSETS = ["AAPL", "TSLA"]
+
+# Persistent Price Cache Configuration
+PRICE_CACHE = {
+    "ENABLED": os.getenv("PRICE_CACHE_ENABLED", "true").lower() == "true",
+    "DIR": os.getenv(
+        "PRICE_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "enterprise-hub", "prices"),
+    ),
+    "MAX_AGE_SECONDS": int(os.getenv("DATA_CACHE_TTL", "300")),  # Freshness window
+    # Serve stale entries immediately and refresh them in the background
+    "STALE_WHILE_REVALIDATE": os.getenv("PRICE_CACHE_STALE_WHILE_REVALIDATE", "false").lower()
+    == "true",
+    "MAX_STALE_SECONDS": int(os.getenv("PRICE_CACHE_MAX_STALE_SECONDS", "86400")),
+}
+
+# Grouped multi-ticker download settings
+BATCH_DOWNLOAD = {
+    "CHUNK_SIZE": 100,  # Tickers per grouped yfinance request
+    "THREADS": 8,       # yfinance worker threads per grouped request
+}
+
+# Combined fundamentals loader settings
+FUNDAMENTALS = {
+    "MAX_WORKERS": 5,     # Concurrent requests per ticker (info, 3 statements, news)
+    "TTL_SECONDS": 300,   # How long a combined load serves the individual getters
+}
+
+# Market Data Provider Configuration
+MARKET_DATA = {
+    "PROVIDER": os.getenv("MARKET_DATA_PROVIDER", "yfinance"),  # yfinance | replay
+    "REPLAY_DIR": os.getenv("MARKET_DATA_REPLAY_DIR", "fixtures/market_data"),
+    "REPLAY_LATENCY_MS": float(os.getenv("MARKET_DATA_REPLAY_LATENCY_MS", "0")),
+}
+
+# Local ticker universe used to validate symbols before any network request
+TICKER_UNIVERSE = {
+    "PATH": os.getenv(
+        "TICKER_UNIVERSE_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "ticker_universe.csv"),
+    ),
+    # Reject symbols missing from the universe (use with a complete listing file)
+    "STRICT": os.getenv("TICKER_UNIVERSE_STRICT", "false").lower() == "true",
+    "NEGATIVE_TTL_SECONDS": 900,  # Remember tickers that returned no data
+    "CONFIRM_PERIOD": "1mo",  # Daily window re-checked before a ticker is remembered as empty
+}
+
+# Intraday streaming (rolling in-memory bar buffers)
+STREAMING = {
+    "INTERVALS": ["1m", "5m"],
+    "SEED_PERIOD": {"1m": "5d", "5m": "1mo"},  # History loaded when a stream starts
+    "CAPACITY": 2000,  # Bars kept per (ticker, interval)
+    "POLL_SECONDS": float(os.getenv("STREAMING_POLL_SECONDS", "15")),
+    "IDLE_SECONDS": 600,  # Stop polling after this long without reads
+    "DISPLAY_BARS": 390,  # Bars shown by Market Pulse (one regular session of 1m bars)
+}
+
+# Universe technical screener (utils/screener.py)
+SCREENER = {
+    "PERIOD": "6mo",  # History loaded per symbol; enough to warm up MACD/RSI
+    "EXCHANGES": ["NASDAQ", "NYSE", "NYSE Arca"],  # Default universe: listed stocks and ETFs
+    "CROSS_LOOKBACK": 3,  # Bars in which a MACD/signal cross counts as fresh
+}
+
+# Signal backtester (utils/backtest.py)
+BACKTEST = {
+    "COST_BPS": 5.0,  # Cost per unit of position change, in basis points
+    "ALLOW_SHORT": False,  # Bearish signals go short instead of flat
+    "BARS_PER_YEAR": 252,
+    "WORKERS": int(os.getenv("BACKTEST_WORKERS", str(os.cpu_count() or 1))),
+    "TICKERS_PER_TASK": 256,  # Tickers per process-pool task
+}
@@ -4,14 +4,72 @@ Provides functions for generating realistic OHLCV market data
 with proper validation and reproducible random seeds.
 """
 
-import pandas as pd
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Union
+
 import numpy as np
-import random
-from datetime import datetime, timedelta
-from typing import Optional
+import pandas as pd
 
 from utils.config import BASE_PRICES, VOLATILITY, VOLUME_RANGE
 from utils.indicators import add_all_indicators
+from utils.market_validation import LEGACY_RULES, validate_ohlcv
+
+SeedLike = Union[None, int, np.random.Generator]
+
+
+def simulate_ohlcv(
+    base_prices,
+    volatilities,
+    bars: int,
+    seed: SeedLike = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate OHLCV bars for many assets at once.
+
+    Every random draw (daily moves, high/low spreads, volumes) is made in one
+    call on a private ``numpy.random.Generator``; closes are the cumulative
+    product of the moves and each open is the previous close. Global random
+    state is never touched.
+
+    Args:
+        base_prices: Starting price per asset (scalar or 1-D array)
+        volatilities: Maximum absolute daily move per asset (e.g., 0.02)
+        bars: Number of bars per asset
+        seed: Seed or Generator for reproducibility (None for random)
+
+    Returns:
+        Dict of Open, High, Low, Close and Volume arrays shaped
+        (bars x assets); prices are rounded to cents
+
+    Example:
+        >>> arrays = simulate_ohlcv([185, 245], [0.02, 0.035], bars=2520, seed=7)
+        >>> arrays["Close"].shape
+        (2520, 2)
+    """
+    rng = np.random.default_rng(seed)
+    base = np.atleast_1d(np.asarray(base_prices, dtype=np.float64))
+    vol = np.broadcast_to(np.asarray(volatilities, dtype=np.float64), base.shape)
+    shape = (bars, len(base))
+
+    # Operate in place: at thousands of assets x years these arrays are large
+    close = rng.uniform(-vol, vol, size=shape)
+    close += 1
+    np.cumprod(close, axis=0, out=close)
+    close *= base
+    open_ = np.empty_like(close)
+    open_[0] = base
+    open_[1:] = close[:-1]
+
+    high = np.maximum(open_, close)
+    high *= rng.uniform(1.0, 1.02, size=shape)
+    low = np.minimum(open_, close)
+    low *= rng.uniform(0.98, 1.0, size=shape)
+    volume = rng.uniform(VOLUME_RANGE["MIN"], VOLUME_RANGE["MAX"], size=shape)
+
+    prices = {"Open": open_, "High": high, "Low": low, "Close": close}
+    for values in prices.values():
+        np.round(values, 2, out=values)
+    return {**prices, "Volume": volume.astype(np.int64)}
 
 
 def generate_market_data(symbol: str, 
@@ -38,50 +96,11 @@ def generate_market_data(symbol: str,
     if days < 30:
         raise ValueError(f"Need at least 30 days for proper indicator calculation. Got {days}")
     
-    # Set random seed for reproducibility
-    if seed is not None:
-        np.random.seed(seed)
-        random.seed(seed)
-    
-    # Generate date range
-    dates = [datetime.now() - timedelta(days=x) for x in range(days)]
-    dates.reverse()
-    
-    # Get asset-specific parameters
-    base_price = BASE_PRICES[symbol]
-    volatility = VOLATILITY[symbol]
+    arrays = simulate_ohlcv(BASE_PRICES[symbol], VOLATILITY[symbol], days, seed)
     
-    # Generate price data
-    data = []
-    current_price = base_price
-    
-    for i in range(days):
-        open_price = current_price
-        
-        # Daily price movement
-        daily_change = random.uniform(-volatility, volatility)
-        close_price = open_price * (1 + daily_change)
-        
-        # High/Low with realistic spread
-        high_price = max(open_price, close_price) * random.uniform(1.0, 1.02)
-        low_price = min(open_price, close_price) * random.uniform(0.98, 1.0)
-        
-        # Volume
-        volume = random.uniform(VOLUME_RANGE["MIN"], VOLUME_RANGE["MAX"])
-        
-        data.append({
-            'Date': dates[i],
-            'Open': round(open_price, 2),
-            'High': round(high_price, 2),
-            'Low': round(low_price, 2),
-            'Close': round(close_price, 2),
-            'Volume': int(volume)
-        })
-        
-        current_price = close_price
-    
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    # Create DataFrame (one row per day, ending now)
+    df = pd.DataFrame({name: values[:, 0] for name, values in arrays.items()})
+    df.insert(0, 'Date', pd.date_range(end=datetime.now(), periods=days, freq="D"))
     
     # Calculate returns
     df['Returns'] = df['Close'].pct_change()
@@ -92,6 +111,52 @@ def generate_market_data(symbol: str,
     return df
 
 
+def generate_ohlcv_panel(
+    symbols: Union[int, Sequence[str]],
+    days: int = 252,
+    seed: SeedLike = 42,
+    freq: str = "B",
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Generate a synthetic OHLCV panel for many symbols, e.g. for load tests.
+
+    Symbols from BASE_PRICES keep their configured price and volatility;
+    others get a random starting price (10-500) and volatility (1-4%).
+
+    Args:
+        symbols: Symbol names, or a count to generate SYM0000, SYM0001, ...
+        days: Number of bars per symbol
+        seed: Seed or Generator for reproducibility (None for random)
+        freq: Bar frequency for the date index
+        end: Timestamp of the last bar (default now)
+
+    Returns:
+        DataFrame indexed by (Ticker, Date) with Open, High, Low, Close and
+        Volume, the layout of get_stock_data_batch(..., as_panel=True)
+
+    Example:
+        >>> panel = generate_ohlcv_panel(2000, days=2520, seed=1)
+        >>> indicators = compute_panel_indicators(panel)
+    """
+    if isinstance(symbols, int):
+        symbols = [f"SYM{i:04d}" for i in range(symbols)]
+    symbols = list(symbols)
+
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(10, 500, len(symbols))
+    vol = rng.uniform(0.01, 0.04, len(symbols))
+    for i, symbol in enumerate(symbols):
+        if symbol in BASE_PRICES:
+            base[i], vol[i] = BASE_PRICES[symbol], VOLATILITY[symbol]
+
+    arrays = simulate_ohlcv(base, vol, days, rng)
+    dates = pd.date_range(end=end or datetime.now(), periods=days, freq=freq, name="Date")
+    index = pd.MultiIndex.from_product([symbols, dates], names=["Ticker", "Date"])
+    # (bars x symbols) -> one ticker-major column per field
+    return pd.DataFrame({name: values.T.ravel() for name, values in arrays.items()}, index=index)
+
+
 def validate_market_data(df: pd.DataFrame) -> bool:
     """
     Validate market data integrity.
@@ -112,22 +177,6 @@ def validate_market_data(df: pd.DataFrame) -> bool:
         missing = [col for col in required_cols if col not in df.columns]
         raise ValueError(f"Missing required columns: {missing}")
     
-    # Check OHLC relationships
-    invalid_high = (df['High'] < df['Low']) | (df['High'] < df['Open']) | (df['High'] < df['Close'])
-    if invalid_high.any():
-        raise ValueError("High price must be >= all other prices")
-    
-    invalid_low = (df['Low'] > df['High']) | (df['Low'] > df['Open']) | (df['Low'] > df['Close'])
-    if invalid_low.any():
-        raise ValueError("Low price must be <= all other prices")
-    
-    # Check for negative prices
-    price_cols = ['Open', 'High', 'Low', 'Close']
-    if (df[price_cols] <= 0).any().any():
-        raise ValueError("Prices must be positive")
-    
-    # Check for negative volume
-    if (df['Volume'] < 0).any():
-        raise ValueError("Volume must be non-negative")
-    
+    # OHLC relationships, positive prices and non-negative volume
+    validate_ohlcv(df, check_order=False).raise_if_invalid(LEGACY_RULES)
     return True
@@ -1,37 +1,69 @@
 """
 Data loading and processing utilities for market data.
 
-This module handles fetching stock data from Yahoo Finance and
-calculating technical indicators for analysis.
+This module handles fetching stock data (from Yahoo Finance by default, see
+utils.market_data for pluggable providers) and calculating technical
+indicators for analysis. Price history is backed by a
+persistent on-disk cache (see utils.price_cache) so restarts and new worker
+processes read from local files instead of the network.
 """
 
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import ta
-import yfinance as yf
 
+from utils.config import BATCH_DOWNLOAD, FUNDAMENTALS, PRICE_CACHE, TICKER_UNIVERSE
 from utils.exceptions import DataFetchError, DataProcessingError, InvalidTickerError
+from utils.indicator_cache import get_indicator_cache
+from utils.indicators import add_panel_indicators, evaluate_indicators
 from utils.logger import get_logger
+from utils.market_data import get_provider
+from utils.market_validation import OHLC_COLUMNS, validate_ohlcv
+from utils.price_cache import (
+    CacheEntry,
+    PriceCache,
+    align_timestamp,
+    get_price_cache,
+    period_start,
+    slice_from,
+)
+from utils.single_flight import SingleFlight
+from utils.streaming import get_bar_stream
+from utils.ticker_universe import is_valid_ticker, mark_invalid, validate_ticker
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Columns produced by compute_indicators
+INDICATOR_COLUMNS = ["MA20", "RSI", "MACD", "Signal"]
+
+# Price columns stored as float32 by compact_ohlcv
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+
+# Coalesces concurrent identical fetches across Streamlit sessions
+_inflight = SingleFlight()
+
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def get_stock_data(
     ticker: str,
     period: str = "1y",
-    interval: str = "1d"
+    interval: str = "1d",
+    compact: bool = False
 ) -> Optional[pd.DataFrame]:
     """
-    Fetch stock data from Yahoo Finance with caching.
+    Fetch stock data from the market data provider (Yahoo Finance by default) with caching.
     
     Args:
         ticker: Stock ticker symbol (e.g., 'AAPL', 'SPY')
         period: Time period for data (e.g., '1mo', '6mo', '1y', '5y')
         interval: Data interval (e.g., '1d', '1wk', '1mo')
+        compact: Return a memory-compact frame (see compact_ohlcv)
     
     Returns:
         DataFrame containing OHLCV data, or None if fetch fails
@@ -45,59 +77,483 @@ def get_stock_data(
         >>> if df is not None:
         ...     print(df.head())
     """
-    # Validate ticker
-    if not ticker or not ticker.strip():
-        logger.error("Empty ticker symbol provided")
-        raise InvalidTickerError(ticker or "", "Ticker symbol cannot be empty")
-    
-    ticker = ticker.strip().upper()
-    logger.info(f"Fetching data for {ticker} (period={period}, interval={interval})")
-    
+    # Validate ticker locally before spending an upstream request
+    ticker = validate_ticker(ticker)
+
+    # Concurrent sessions asking for the same key share one fetch
+    df = _inflight.do(
+        ("prices", ticker, period, interval), _load_stock_data, ticker, period, interval
+    )
+    df = compact_ohlcv(df) if compact else df
+    # Lets compute_indicators share cached indicators for this ticker across pages
+    df.attrs.update(ticker=ticker, interval=interval)
+    return df
+
+
+def _load_stock_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """Load price history through the disk cache, downloading what is missing."""
+    cache = get_price_cache()
     try:
-        # Fetch data from Yahoo Finance
-        df = yf.download(
+        start = period_start(period)
+    except ValueError:
+        # Unknown period strings bypass the cache and go straight to yfinance
+        cache, start = None, None
+
+    entry = cache.read(ticker, interval) if cache is not None else None
+    if entry is not None and not entry.frame.empty:
+        return _refresh_cached_history(cache, entry, ticker, period, start, interval)
+
+    logger.info(f"Fetching data for {ticker} (period={period}, interval={interval})")
+    df = _download(ticker, interval, period=period)
+
+    # Check if data was returned
+    if df.empty:
+        logger.warning(f"No data returned for ticker: {ticker}")
+        if _confirmed_no_data(ticker):
+            mark_invalid(ticker)
+        raise InvalidTickerError(
             ticker,
-            period=period,
-            interval=interval,
-            progress=False,
-            show_errors=False
+            f"No data available for '{ticker}'. Please check ticker symbol."
         )
-        
-        # Check if data was returned
-        if df.empty:
-            logger.warning(f"No data returned for ticker: {ticker}")
-            raise InvalidTickerError(
-                ticker,
-                f"No data available for '{ticker}'. Please check ticker symbol."
-            )
-        
-        logger.info(f"Successfully fetched {len(df)} rows for {ticker}")
+
+    logger.info(f"Successfully fetched {len(df)} rows for {ticker}")
+    if cache is not None:
+        _persist(cache, ticker, interval, df, start)
+    return df
+
+
+def _refresh_cached_history(
+    cache: PriceCache,
+    entry: CacheEntry,
+    ticker: str,
+    period: str,
+    start: Optional[pd.Timestamp],
+    interval: str,
+) -> pd.DataFrame:
+    """
+    Bring a cached history up to date by downloading only what is missing.
+
+    A stale entry only fetches bars from its last stored timestamp onwards
+    (re-fetching that bar, which may still have been forming). History before
+    the cached range is backfilled only when a longer period is requested.
+    If the incremental download fails, the cached rows are served as-is.
+
+    With stale-while-revalidate enabled, a stale entry that covers the period
+    is served immediately and the tail refresh runs in the background.
+    """
+    fresh = entry.is_fresh(PRICE_CACHE["MAX_AGE_SECONDS"])
+    covered = entry.covers(start)
+    if fresh and covered:
+        df = entry.slice(start)
+        logger.info(f"Loaded {len(df)} rows for {ticker} from disk cache")
         return df
-        
-    except InvalidTickerError:
-        # Re-raise ticker errors as-is
-        raise
-        
+
+    if covered and _can_serve_stale(entry):
+        _inflight.submit(("refresh", ticker, interval), _revalidate, cache, ticker, interval)
+        logger.info(f"Serving stale cached data for {ticker} while revalidating")
+        return entry.slice(start)
+
+    frame = entry.frame
+    parts = []
+    try:
+        if not covered:
+            if start is None:
+                logger.info(f"Backfilling full history for {ticker} ({interval})")
+                parts.append(_download(ticker, interval, period=period))
+            else:
+                first = align_timestamp(start, frame.index)
+                logger.info(f"Backfilling {ticker} ({interval}) from {first} to {frame.index[0]}")
+                parts.append(_download(ticker, interval, start=first, end=frame.index[0]))
+        if not fresh:
+            logger.info(f"Fetching {ticker} ({interval}) bars after {frame.index[-1]}")
+            parts.append(_download(ticker, interval, start=frame.index[-1]))
+    except DataFetchError as e:
+        if not covered:
+            raise
+        logger.warning(f"Serving stale cached data for {ticker}: {e}")
+        return entry.slice(start)
+
+    new_rows = pd.concat([part for part in parts if not part.empty] or [frame.iloc[:0]])
+    logger.info(f"Merged {len(new_rows)} new rows into cached history for {ticker}")
+    covered_start = entry.covered_start if covered else start
+    merged = _persist(cache, ticker, interval, new_rows, covered_start)
+    if merged is None:
+        merged = pd.concat([frame, new_rows])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    return slice_from(merged, start)
+
+
+def _can_serve_stale(entry: CacheEntry) -> bool:
+    """Return True if a stale entry may be served while it is refreshed."""
+    if not PRICE_CACHE["STALE_WHILE_REVALIDATE"]:
+        return False
+    return entry.is_fresh(PRICE_CACHE["MAX_STALE_SECONDS"])
+
+
+def _revalidate(cache: PriceCache, ticker: str, interval: str) -> None:
+    """Background tail refresh for stale-while-revalidate."""
+    entry = cache.read(ticker, interval)
+    if entry is None or entry.frame.empty or entry.is_fresh(PRICE_CACHE["MAX_AGE_SECONDS"]):
+        # Another worker process refreshed it in the meantime
+        return
+    tail = _download(ticker, interval, start=entry.frame.index[-1])
+    _persist(cache, ticker, interval, tail, entry.covered_start)
+    logger.info(f"Revalidated cached history for {ticker} ({interval})")
+
+
+def _download(
+    ticker: str,
+    interval: str,
+    period: Optional[str] = None,
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Download bars from the market data provider for a period or a [start, end) range.
+
+    Raises:
+        DataFetchError: If the request fails
+    """
+    try:
+        df = get_provider().download(
+            ticker, interval=interval, period=period, start=start, end=end
+        )
     except Exception as e:
         logger.error(f"Error fetching data for {ticker}: {str(e)}")
         raise DataFetchError(
             f"Failed to fetch data for '{ticker}': {str(e)}"
         ) from e
+    return _flatten_columns(df)
+
+
+def _confirmed_no_data(ticker: str) -> bool:
+    """
+    Re-check an empty response before the ticker is remembered as invalid.
+
+    yfinance also returns empty frames on rate limits and transient errors,
+    so only a second, independent request for recent daily bars that comes
+    back empty confirms the ticker has no data.
+    """
+    try:
+        df = _download(ticker, "1d", period=TICKER_UNIVERSE["CONFIRM_PERIOD"])
+    except DataFetchError:
+        return False
+    if not df.empty:
+        logger.info(f"{ticker} has recent data; not remembering it as invalid")
+    return df.empty
+
+
+def _report_invalid_bars(ticker: str, interval: str, df: pd.DataFrame) -> None:
+    """Log provider bars that break OHLC/volume invariants; they are still stored."""
+    if df.empty or not set(OHLC_COLUMNS).issubset(df.columns):
+        return
+    report = validate_ohlcv(df)
+    if not report.ok:
+        failures = {rule: count for rule, count in report.counts.items() if count}
+        logger.warning(f"{ticker} ({interval}): {len(df)} fetched bars fail validation: {failures}")
+
+
+def _persist(
+    cache: PriceCache,
+    ticker: str,
+    interval: str,
+    df: pd.DataFrame,
+    covered_start: Optional[pd.Timestamp],
+) -> Optional[pd.DataFrame]:
+    """Merge rows into the disk cache, returning the merged frame (None on failure)."""
+    _report_invalid_bars(ticker, interval, df)
+    try:
+        return cache.merge(ticker, interval, df, covered_start=covered_start)
+    except Exception as e:
+        # A broken cache must never take down a successful fetch
+        logger.warning(f"Could not persist {ticker} to disk cache: {e}")
+        return None
+
+
+def compact_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert an OHLCV frame to a compact representation.
+
+    Columns are flattened, price columns are stored as float32, Volume as
+    uint32 (or int64 when values exceed the uint32 range) and the index as a
+    timezone-naive DatetimeIndex in exchange-local time. This roughly halves
+    the memory held per ticker and the pickling cost inside st.cache_data.
+    float32 keeps about 7 significant digits, which is ample for display and
+    indicators but not for exact accounting.
+
+    Args:
+        df: OHLCV DataFrame as returned by get_stock_data
+
+    Returns:
+        New compact DataFrame (the input is not modified)
+    """
+    if df is None or df.empty:
+        return df
+
+    df = _flatten_columns(df)
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if name in PRICE_COLUMNS:
+            columns[name] = values.to_numpy(dtype=np.float32)
+        elif name == "Volume":
+            volume = values.fillna(0).to_numpy()
+            fits = volume.min() >= 0 and volume.max() <= np.iinfo(np.uint32).max
+            columns[name] = volume.astype(np.uint32 if fits else np.int64)
+        else:
+            columns[name] = values.to_numpy()
+
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(index, name=df.index.name, freq=None))
+
+
+def _flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the ticker level from yfinance MultiIndex columns without copying data."""
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis(df.columns.get_level_values(0), axis=1, copy=False)
+    return df
+
+
+def get_intraday_bars(ticker: str, interval: str = "1m", bars: Optional[int] = None) -> pd.DataFrame:
+    """
+    Return the latest intraday bars from the process-wide streaming buffer.
+
+    The first call for a (ticker, interval) seeds an in-memory ring buffer and
+    starts a background poller; later calls (e.g., Streamlit reruns) read a
+    zero-copy view of the newest bars without re-downloading the window.
+
+    Args:
+        ticker: Stock ticker symbol
+        interval: Streaming interval ('1m' or '5m')
+        bars: Number of most recent bars to return (all buffered bars by default)
+
+    Returns:
+        Read-only OHLCV DataFrame view; copy it before modifying
+
+    Raises:
+        InvalidTickerError: If ticker symbol is invalid
+        DataFetchError: If the stream cannot be started
+
+    Example:
+        >>> df = get_intraday_bars("AAPL", interval="1m", bars=120)
+    """
+    ticker = validate_ticker(ticker)
+    try:
+        stream = get_bar_stream(ticker, interval)
+    except ValueError as e:
+        raise DataFetchError(str(e)) from e
+    except Exception as e:
+        logger.error(f"Failed to start bar stream for {ticker}: {e}", exc_info=True)
+        raise DataFetchError(f"Failed to stream {ticker}: {str(e)}") from e
+
+    df = stream.frame(bars)
+    if df.empty:
+        if _confirmed_no_data(ticker):
+            mark_invalid(ticker)
+        raise InvalidTickerError(ticker, "No intraday data returned")
+    df.attrs.update(ticker=ticker, interval=interval)
+    return df
 
 
 @st.cache_data(ttl=300)
-def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
+def get_stock_data_batch(
+    tickers: List[str],
+    period: str = "1y",
+    interval: str = "1d",
+    as_panel: bool = False,
+    compact: bool = False,
+) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    Fetch price history for many tickers with grouped provider requests.
+
+    Tickers already fresh in the disk cache are read locally. The remaining
+    symbols are downloaded in grouped requests (one per chunk of
+    ``BATCH_DOWNLOAD["CHUNK_SIZE"]`` tickers): stale symbols fetch only the
+    bars after their last cached timestamp, uncached symbols fetch the full
+    period. Every downloaded frame is written back to the per-ticker cache.
+
+    Args:
+        tickers: Stock ticker symbols
+        period: Time period for data (e.g., '1mo', '6mo', '1y', '5y')
+        interval: Data interval (e.g., '1d', '1wk', '1mo')
+        as_panel: Return one frame with a (Ticker, Date) MultiIndex instead
+            of a dict
+        compact: Return memory-compact frames (see compact_ohlcv)
+
+    Returns:
+        Dict mapping ticker to OHLCV DataFrame (invalid tickers and tickers
+        without data are omitted), or a stacked panel DataFrame when ``as_panel`` is True
+
+    Raises:
+        DataFetchError: If a grouped download fails and no cached data can
+            stand in for it
+
+    Example:
+        >>> frames = get_stock_data_batch(["AAPL", "MSFT", "NVDA"], period="6mo")
+        >>> frames["AAPL"]["Close"].tail()
+    """
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    rejected = [symbol for symbol in symbols if not is_valid_ticker(symbol)]
+    if rejected:
+        logger.warning(f"Skipping invalid tickers: {', '.join(rejected)}")
+        symbols = [symbol for symbol in symbols if symbol not in rejected]
+    results = _inflight.do(
+        ("batch", tuple(symbols), period, interval),
+        _load_stock_data_batch,
+        symbols,
+        period,
+        interval,
+    )
+    if compact:
+        results = {symbol: compact_ohlcv(df) for symbol, df in results.items()}
+    if as_panel:
+        if not results:
+            return pd.DataFrame()
+        return pd.concat(results, names=["Ticker"])
+    return results
+
+
+def _load_stock_data_batch(
+    symbols: List[str], period: str, interval: str
+) -> Dict[str, pd.DataFrame]:
+    """Load many tickers through the disk cache with grouped downloads."""
+    cache = get_price_cache()
+    try:
+        start = period_start(period)
+    except ValueError:
+        cache, start = None, None
+
+    results: Dict[str, pd.DataFrame] = {}
+    stale: Dict[str, CacheEntry] = {}
+    missing: List[str] = []
+
+    for symbol in symbols:
+        entry = cache.read(symbol, interval) if cache is not None else None
+        if entry is None or entry.frame.empty or not entry.covers(start):
+            missing.append(symbol)
+        elif entry.is_fresh(PRICE_CACHE["MAX_AGE_SECONDS"]):
+            results[symbol] = entry.slice(start)
+        else:
+            stale[symbol] = entry
+
+    logger.info(
+        f"Batch load of {len(symbols)} tickers: {len(results)} cached, "
+        f"{len(stale)} stale, {len(missing)} to download"
+    )
+
+    # Stale symbols: one grouped request from the oldest last-stored bar
+    if stale:
+        tail_start = min(entry.frame.index[-1] for entry in stale.values())
+        try:
+            tails = _download_batch(list(stale), interval, start=tail_start)
+        except DataFetchError as e:
+            logger.warning(f"Serving stale cached data for {len(stale)} tickers: {e}")
+            tails = {}
+        for symbol, entry in stale.items():
+            tail = tails.get(symbol)
+            merged = None
+            if tail is not None and cache is not None:
+                merged = _persist(cache, symbol, interval, tail, entry.covered_start)
+            results[symbol] = slice_from(merged if merged is not None else entry.frame, start)
+
+    # Uncached symbols: one grouped request for the full period
+    if missing:
+        frames = _download_batch(missing, interval, period=period)
+        for symbol in missing:
+            df = frames.get(symbol)
+            if df is None:
+                # Not negative-cached: a grouped response can omit a valid ticker
+                logger.warning(f"No data returned for ticker: {symbol}")
+                continue
+            if cache is not None:
+                _persist(cache, symbol, interval, df, start)
+            results[symbol] = df
+
+    return {symbol: results[symbol] for symbol in symbols if symbol in results}
+
+
+def _download_batch(
+    tickers: List[str],
+    interval: str,
+    period: Optional[str] = None,
+    start: Optional[pd.Timestamp] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Download several tickers in grouped requests and split them per ticker.
+
+    Raises:
+        DataFetchError: If a grouped request fails
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    chunk_size = BATCH_DOWNLOAD["CHUNK_SIZE"]
+    for i in range(0, len(tickers), chunk_size):
+        chunk = tickers[i:i + chunk_size]
+        try:
+            df = get_provider().download(
+                chunk,
+                interval=interval,
+                period=period,
+                start=start,
+                group_by="ticker",
+                threads=BATCH_DOWNLOAD["THREADS"],
+            )
+        except Exception as e:
+            logger.error(f"Error fetching batch of {len(chunk)} tickers: {str(e)}")
+            raise DataFetchError(
+                f"Failed to fetch data for {len(chunk)} tickers: {str(e)}"
+            ) from e
+        frames.update(_split_batch(df, chunk))
+    return frames
+
+
+def _split_batch(df: pd.DataFrame, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """Split a grouped yfinance frame into per-ticker frames, dropping empty ones."""
+    if df is None or df.empty:
+        return {}
+    if not isinstance(df.columns, pd.MultiIndex):
+        # yfinance returns flat columns when only one ticker is requested
+        return {tickers[0]: df} if len(tickers) == 1 else {}
+
+    frames = {}
+    available = set(df.columns.get_level_values(0))
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        frame = df[ticker].dropna(how="all")
+        if not frame.empty:
+            frames[ticker] = frame
+    return frames
+
+
+def calculate_indicators(
+    df: pd.DataFrame,
+    indicators: Optional[Sequence[str]] = None,
+    ticker: Optional[str] = None,
+    interval: Optional[str] = None,
+) -> pd.DataFrame:
     """
     Calculate technical indicators for stock data.
     
-    Adds the following indicators to the DataFrame:
+    Returns a new DataFrame with the following indicators joined to the
+    price columns (the input frame is never modified):
     - MA20: 20-period Simple Moving Average
     - RSI: Relative Strength Index (14-period)
     - MACD: Moving Average Convergence Divergence
     - Signal: MACD Signal Line
     
+    Pass ``indicators`` to compute a different selection; only those and the
+    intermediates they share are computed (see
+    utils.indicators.available_indicators). Callers that only need the
+    indicator columns should use compute_indicators and join lazily.
+    
     Args:
         df: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
+        indicators: Indicator names to add (default INDICATOR_COLUMNS)
+        ticker: Ticker the prices belong to, for the shared indicator cache
+            (default ``df.attrs["ticker"]``, set by get_stock_data)
+        interval: Bar interval of the prices (default ``df.attrs["interval"]``)
     
     Returns:
         DataFrame with added technical indicators
@@ -113,37 +569,164 @@ def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         logger.warning("Empty DataFrame provided to calculate_indicators")
         return df
+
+    prices = _flatten_columns(df)
+    return prices.join(compute_indicators(df, indicators, ticker, interval))
+
+
+def compute_indicators(
+    df: pd.DataFrame,
+    indicators: Optional[Sequence[str]] = None,
+    ticker: Optional[str] = None,
+    interval: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Compute indicator columns for a price frame without touching the frame.
     
-    logger.info(f"Calculating indicators for {len(df)} rows")
+    Frames from get_stock_data and get_intraday_bars carry their ticker and
+    interval (``df.attrs``), so their indicators go through the process-wide
+    IndicatorCache: every page and session asking for the same ticker shares
+    one computation, and a history that only gained bars is extended
+    incrementally. Other frames are cached by price_fingerprint and the
+    requested names, skipping Streamlit's full-frame hashing.
     
-    try:
-        # Handle MultiIndex columns from yfinance
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-        
-        # Validate required columns
-        required_columns = ['Close', 'Open', 'High', 'Low', 'Volume']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
+    Args:
+        df: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
+        indicators: Indicator names to compute (default INDICATOR_COLUMNS:
+            MA20, RSI, MACD and Signal)
+        ticker: Ticker the prices belong to (default ``df.attrs["ticker"]``)
+        interval: Bar interval of the prices (default ``df.attrs["interval"]``
+            or '1d')
+    
+    Returns:
+        DataFrame indexed like ``df`` holding only the requested indicators
+    
+    Raises:
+        DataProcessingError: If required columns are missing or the
+            calculation fails
+    
+    Example:
+        >>> prices = get_stock_data("AAPL")
+        >>> indicators = compute_indicators(prices)
+        >>> prices[["Close"]].join(indicators[["RSI"]]).tail()
+    """
+    names = tuple(INDICATOR_COLUMNS if indicators is None else indicators)
+    prices = _flatten_columns(df)
+
+    # Validate required columns
+    required_columns = ['Close', 'Open', 'High', 'Low', 'Volume']
+    missing_columns = [col for col in required_columns if col not in prices.columns]
+    if missing_columns:
+        raise DataProcessingError(
+            f"Missing required columns: {missing_columns}"
+        )
+    if prices.empty:
+        return pd.DataFrame(index=prices.index, columns=list(names), dtype=float)
+
+    ticker = ticker or df.attrs.get("ticker")
+    if ticker:
+        interval = interval or df.attrs.get("interval", "1d")
+        try:
+            return get_indicator_cache().get(ticker, interval, prices, names)
+        except Exception as e:
+            logger.error(f"Error calculating indicators for {ticker}: {str(e)}")
             raise DataProcessingError(
-                f"Missing required columns: {missing_columns}"
+                f"Failed to calculate technical indicators: {str(e)}"
+            ) from e
+
+    return _cached_indicator_frame(price_fingerprint(prices), names, prices)
+
+
+def compute_panel_indicators(
+    prices: Union[Dict[str, pd.DataFrame], pd.DataFrame],
+    indicators: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Compute indicators for many tickers in one vectorized pass.
+    
+    Accepts either output of get_stock_data_batch, pivots the closes into a
+    (dates x tickers) matrix and runs every indicator across all columns at
+    once instead of one pandas pipeline per ticker.
+    
+    Args:
+        prices: Dict of ticker -> OHLCV frame, or a panel indexed by
+            (Ticker, Date) as returned with ``as_panel=True``
+        indicators: Indicator names to compute (default MA7, MA20, MA30,
+            RSI, MACD, Signal and Volatility)
+    
+    Returns:
+        DataFrame indexed by (Ticker, Date) with Close and the indicators
+    
+    Raises:
+        DataProcessingError: If the prices have no Close column
+    
+    Example:
+        >>> frames = get_stock_data_batch(["AAPL", "MSFT", "NVDA"], period="1y")
+        >>> panel = compute_panel_indicators(frames)
+        >>> panel.groupby(level="Ticker")["RSI"].last()
+    """
+    if isinstance(prices, dict):
+        if not prices:
+            return pd.DataFrame()
+        try:
+            closes = pd.concat(
+                {ticker: _flatten_columns(df)["Close"] for ticker, df in prices.items()}, axis=1
             )
+        except KeyError as e:
+            raise DataProcessingError("Missing required columns: ['Close']") from e
+    else:
+        if prices.empty:
+            return pd.DataFrame()
+        if "Close" not in prices.columns:
+            raise DataProcessingError("Missing required columns: ['Close']")
+        closes = prices["Close"].unstack(level=0)
+
+    closes = closes.sort_index()
+    logger.info(f"Calculating panel indicators for {closes.shape[1]} tickers x {len(closes)} rows")
+    return add_panel_indicators(closes, names=indicators)
+
+
+def price_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cheap content key for a price frame.
+    
+    Combines the row count, first and last timestamps, the last close and a
+    checksum of the Close column. This costs one vectorized pass instead of
+    hashing every cell of the frame.
+    
+    Args:
+        df: DataFrame with a Close column
+    
+    Returns:
+        Hashable tuple identifying the price history
+    """
+    close = df["Close"].to_numpy()
+    return (
+        len(df),
+        str(df.index[0]),
+        str(df.index[-1]),
+        float(close[-1]),
+        float(np.nansum(close)),
+    )
+
+
+@st.cache_data(ttl=300)
+def _cached_indicator_frame(
+    fingerprint: tuple, names: Tuple[str, ...], _prices: pd.DataFrame
+) -> pd.DataFrame:
+    """Compute the requested indicator columns; ``_prices`` is excluded from hashing."""
+    logger.info(f"Calculating {', '.join(names)} for {len(_prices)} rows")
+
+    try:
+        close = _prices['Close'].to_numpy(dtype=np.float64)
+        indicators = pd.DataFrame(
+            evaluate_indicators({'Close': close}, names),
+            index=_prices.index,
+            columns=list(names),
+        )
         
-        # Calculate Moving Average (20-period)
-        df['MA20'] = ta.trend.sma_indicator(df['Close'], window=20)
-        logger.debug("Calculated MA20")
-        
-        # Calculate RSI (14-period)
-        df['RSI'] = ta.momentum.rsi(df['Close'], window=14)
-        logger.debug("Calculated RSI")
-        
-        # Calculate MACD
-        df['MACD'] = ta.trend.macd(df['Close'])
-        df['Signal'] = ta.trend.macd_signal(df['Close'])
-        logger.debug("Calculated MACD and Signal")
-        
-        logger.info("Successfully calculated all indicators")
-        return df
+        logger.info("Successfully calculated indicators")
+        return indicators
         
     except Exception as e:
         logger.error(f"Error calculating indicators: {str(e)}")
@@ -171,7 +754,10 @@ def get_company_info(ticker: str) -> dict:
         
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
+        recent = _recent_fundamentals(ticker)
+        if recent is not None:
+            return recent["info"]
+        stock = get_provider().ticker(ticker)
         info = stock.info
         return info
     except Exception as e:
@@ -195,7 +781,10 @@ def get_financials(ticker: str) -> dict:
         
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
+        recent = _recent_fundamentals(ticker)
+        if recent is not None:
+            return recent["financials"]
+        stock = get_provider().ticker(ticker)
         
         return {
             'balance_sheet': stock.balance_sheet,
@@ -223,7 +812,10 @@ def get_news(ticker: str) -> list:
         
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
+        recent = _recent_fundamentals(ticker)
+        if recent is not None:
+            return recent["news"]
+        stock = get_provider().ticker(ticker)
         return stock.news
     except Exception as e:
         logger.error(f"Error fetching news for {ticker}: {str(e)}")
@@ -231,4 +823,99 @@ def get_news(ticker: str) -> list:
         return []
 
 
+# Fundamentals fetched by get_fundamentals, shared with the individual getters
+# so a combined load also satisfies later get_company_info/get_financials/get_news
+# calls without another round trip. Maps ticker -> (fetched_at, payload).
+_fundamentals_store: Dict[str, Tuple[float, dict]] = {}
+_fundamentals_lock = threading.Lock()
+
+
+def _recent_fundamentals(ticker: str) -> Optional[dict]:
+    """Return fundamentals loaded by get_fundamentals within the TTL, if any."""
+    with _fundamentals_lock:
+        cached = _fundamentals_store.get(ticker)
+    if cached is None:
+        return None
+    fetched_at, payload = cached
+    if time.time() - fetched_at > FUNDAMENTALS["TTL_SECONDS"]:
+        return None
+    return payload
+
+
+@st.cache_data(ttl=300)
+def get_fundamentals(ticker: str) -> dict:
+    """
+    Fetch company info, financial statements and news in one concurrent load.
+
+    All requests share one provider ticker handle (and, for yfinance, one HTTP
+    session) and run on a thread pool, so the load takes as long as the slowest request. The result
+    also primes get_company_info, get_financials and get_news for the TTL.
+
+    Args:
+        ticker: Stock symbol (e.g., "AAPL")
+
+    Returns:
+        Dictionary with 'info' (dict), 'financials' (dict of DataFrames for
+        balance_sheet, income_stmt, cashflow) and 'news' (list)
+
+    Raises:
+        DataFetchError: If company info or financial statements cannot be fetched
+
+    Example:
+        >>> data = get_fundamentals("AAPL")
+        >>> data["info"].get("sector")
+    """
+    if not ticker:
+        return {}
+
+    ticker = ticker.strip().upper()
+    recent = _recent_fundamentals(ticker)
+    if recent is not None:
+        return recent
+    return _inflight.do(("fundamentals", ticker), _load_fundamentals, ticker)
+
+
+def _load_fundamentals(ticker: str) -> dict:
+    """Fetch fundamentals concurrently and store them for the individual getters."""
+    logger.info(f"Fetching fundamentals for {ticker}")
+    stock = get_provider().ticker(ticker)
+    attributes = {
+        "info": "info",
+        "balance_sheet": "balance_sheet",
+        "income_stmt": "financials",
+        "cashflow": "cashflow",
+        "news": "news",
+    }
+
+    with ThreadPoolExecutor(max_workers=FUNDAMENTALS["MAX_WORKERS"]) as executor:
+        futures = {
+            key: executor.submit(getattr, stock, attribute)
+            for key, attribute in attributes.items()
+        }
+
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            if key == "news":
+                # Return empty list instead of raising to allow partial app loading
+                logger.error(f"Error fetching news for {ticker}: {str(e)}")
+                results[key] = []
+                continue
+            logger.error(f"Error fetching {key} for {ticker}: {str(e)}")
+            raise DataFetchError(f"Failed to fetch fundamentals: {str(e)}") from e
+
+    payload = {
+        "info": results["info"],
+        "financials": {
+            "balance_sheet": results["balance_sheet"],
+            "income_stmt": results["income_stmt"],
+            "cashflow": results["cashflow"],
+        },
+        "news": results["news"],
+    }
+    with _fundamentals_lock:
+        _fundamentals_store[ticker] = (time.time(), payload)
+    return payload
 
@@ -0,0 +1,133 @@
+"""
+Downsampling of long price histories for charts.
+
+Plotly ships every point of every trace to the browser, so multi-year or
+intraday histories cost megabytes of JSON per rerun. These helpers cap a
+trace at a fixed number of points while keeping its visual shape:
+
+- lttb_indices / downsample_line: Largest-Triangle-Three-Buckets for line
+  traces; keeps the point of each bucket that spans the largest triangle
+  with its neighbours, so peaks and troughs survive
+- aggregate_ohlcv: OHLC bucket aggregation for candles and volume (first
+  open, highest high, lowest low, last close, summed volume), so no wick
+  or volume is lost
+
+Both run in time proportional to the output size (plus one vectorized pass
+over the input), so payload and render time stay flat as history grows.
+
+Example:
+    >>> bars = aggregate_ohlcv(df, 1500)
+    >>> ma20 = downsample_line(df["MA20"], 1500)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Positions of the points kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; the rest are split into
+    ``n_out - 2`` equal buckets and one point is chosen per bucket.
+
+    Args:
+        x: Increasing x positions (float or int), without NaN
+        y: Values at ``x``, without NaN
+        n_out: Number of points to keep (at least 3)
+
+    Returns:
+        Increasing int array of positions into ``x``/``y`` (all of them if
+        ``len(y) <= n_out``)
+
+    Raises:
+        ValueError: If n_out < 3
+    """
+    if n_out < 3:
+        raise ValueError(f"n_out must be at least 3, got {n_out}")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    # Bucket i holds points bounds[i]..bounds[i + 1] - 1 (first/last point excluded)
+    bounds = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    # The third triangle vertex is the mean of the following bucket (the last
+    # point for the final bucket), precomputed for all buckets from prefix sums
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    next_lo = bounds[1:]
+    next_hi = np.append(bounds[2:], n)
+    sizes = next_hi - next_lo
+    mean_x = (cx[next_hi] - cx[next_lo]) / sizes
+    mean_y = (cy[next_hi] - cy[next_lo]) / sizes
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        ax, ay = x[anchor], y[anchor]
+        area = np.abs((ax - mean_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (mean_y[i] - ay))
+        anchor = lo + int(np.argmax(area))
+        out[i + 1] = anchor
+    return out
+
+
+def downsample_line(series: pd.Series, n_out: int) -> pd.Series:
+    """
+    Downsample a line trace with LTTB, skipping missing values.
+
+    Bars are spaced by position rather than timestamp, matching how the
+    chart reads (overnight and weekend gaps do not widen buckets).
+
+    Args:
+        series: Values indexed by timestamp (NaN, e.g. indicator warm-up, is dropped)
+        n_out: Maximum points to keep
+
+    Returns:
+        Subset of ``series`` with at most ``n_out`` points, in order
+    """
+    values = series.to_numpy(dtype=np.float64)
+    positions = np.flatnonzero(~np.isnan(values))
+    if len(positions) <= n_out:
+        return series.iloc[positions]
+    keep = lttb_indices(positions, values[positions], n_out)
+    return series.iloc[positions[keep]]
+
+
+def aggregate_ohlcv(df: pd.DataFrame, n_out: int) -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars into at most ``n_out`` equal-count buckets.
+
+    Args:
+        df: DataFrame with Open, High, Low, Close and Volume columns
+        n_out: Maximum number of bars to return
+
+    Returns:
+        DataFrame indexed by each bucket's first timestamp with the bucket's
+        first Open, max High, min Low, last Close and total Volume (``df``
+        itself if it already has at most ``n_out`` rows)
+
+    Raises:
+        ValueError: If n_out < 1
+    """
+    if n_out < 1:
+        raise ValueError(f"n_out must be at least 1, got {n_out}")
+    n = len(df)
+    if n <= n_out:
+        return df
+
+    starts = np.floor(np.linspace(0, n, n_out, endpoint=False)).astype(np.int64)
+    ends = np.append(starts[1:], n) - 1
+    return pd.DataFrame(
+        {
+            "Open": df["Open"].to_numpy()[starts],
+            "High": np.fmax.reduceat(df["High"].to_numpy(dtype=np.float64), starts),
+            "Low": np.fmin.reduceat(df["Low"].to_numpy(dtype=np.float64), starts),
+            "Close": df["Close"].to_numpy()[ends],
+            "Volume": np.add.reduceat(np.nan_to_num(df["Volume"].to_numpy(dtype=np.float64)), starts),
+        },
+        index=df.index[starts],
+    )
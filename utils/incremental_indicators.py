@@ -0,0 +1,397 @@
+"""
+Incremental (O(1) per bar) indicator state for streaming updates.
+
+Each indicator keeps just enough state to absorb one new bar in constant
+time, can be seeded from history with the vectorized kernels in
+utils.indicators, and produces the same values as those kernels:
+
+- RunningEMA: exponential moving average (pandas adjust=False semantics)
+- RollingWindow: windowed mean/std over a ring buffer
+- WilderRSI: RSI with Wilder smoothing
+- RunningMACD: MACD line and signal line
+- IndicatorState: the full set shown by the dashboards
+
+Streaming feeds often revise the newest (still forming) bar; every
+indicator supports ``revise()`` to replace its latest update in O(1).
+
+Example:
+    >>> state = IndicatorState().seed(history["Close"])
+    >>> for close in live_closes:
+    ...     latest = state.update(close)
+    >>> latest["RSI"], latest["MACD"]
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.config import INDICATORS
+from utils.indicators import ema, forward_fill
+
+_NAN = float("nan")
+
+
+class RunningEMA:
+    """
+    Exponential moving average updated one value at a time.
+
+    Missing values (NaN) are skipped with the same gap weighting as
+    ``pd.Series.ewm(adjust=False)``.
+    """
+
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None, min_periods: int = 0):
+        if alpha is None:
+            if span is None:
+                raise ValueError("Either span or alpha must be provided")
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = alpha
+        self.min_periods = max(min_periods, 1)
+        self._weighted = _NAN
+        self._old_wt = 1.0
+        self._nobs = 0
+        self._undo: Optional[Tuple[float, float, int]] = None
+
+    @property
+    def value(self) -> float:
+        """Current average, or NaN during warm-up."""
+        return self._weighted if self._nobs >= self.min_periods else _NAN
+
+    def seed(self, values) -> "RunningEMA":
+        """
+        Initialise the state from history in one vectorized pass.
+
+        The last value goes through update(), so it can be revised right away.
+        """
+        x = np.asarray(values, dtype=np.float64)
+        self._seed(x[:-1])
+        if len(x):
+            self.update(x[-1])
+        return self
+
+    def _seed(self, x: np.ndarray) -> None:
+        valid = ~np.isnan(x)
+        self._nobs = int(valid.sum())
+        self._undo = None
+        if self._nobs == 0:
+            self._weighted, self._old_wt = _NAN, 1.0
+            return
+        self._weighted = float(ema(x, alpha=self.alpha)[-1])
+        # Each missing value after the last observation decays the old weight
+        trailing_gaps = len(x) - 1 - int(np.flatnonzero(valid)[-1])
+        self._old_wt = (1.0 - self.alpha) ** trailing_gaps
+
+    def update(self, x: float) -> float:
+        """Absorb one new value and return the updated average."""
+        self._undo = (self._weighted, self._old_wt, self._nobs)
+        observed = x == x
+        if self._weighted == self._weighted:
+            self._old_wt *= 1.0 - self.alpha
+            if observed:
+                if self._weighted != x:
+                    self._weighted = (self._old_wt * self._weighted + self.alpha * x) / (
+                        self._old_wt + self.alpha
+                    )
+                self._old_wt = 1.0
+        elif observed:
+            self._weighted = x
+        self._nobs += observed
+        return self.value
+
+    def revise(self, x: float) -> float:
+        """Replace the most recent update with ``x``."""
+        if self._undo is None:
+            return self.update(x)
+        self._weighted, self._old_wt, self._nobs = self._undo
+        return self.update(x)
+
+
+class RollingWindow:
+    """
+    Mean and sample standard deviation over the last ``window`` values.
+
+    Values live in a ring buffer; the mean and sum of squared deviations are
+    maintained with Welford add/remove steps and recomputed exactly once per
+    ``window`` updates to keep rounding drift bounded. NaNs are skipped and
+    a window needs ``min_periods`` valid values (default ``window``).
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        self.window = window
+        self.min_periods = window if min_periods is None else max(min_periods, 1)
+        self._ring = np.full(window, np.nan)
+        self._pos = 0
+        self._filled = 0
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._since_rebuild = 0
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._nobs >= self.min_periods else _NAN
+
+    @property
+    def std(self) -> float:
+        if self._nobs < max(self.min_periods, 2):
+            return _NAN
+        return math.sqrt(max(self._ssqdm, 0.0) / (self._nobs - 1))
+
+    def seed(self, values) -> "RollingWindow":
+        """Initialise the window from the tail of a history."""
+        tail = np.asarray(values, dtype=np.float64)[-self.window:]
+        self._ring[:] = np.nan
+        self._ring[: len(tail)] = tail
+        self._filled = len(tail)
+        self._pos = len(tail) % self.window
+        self._rebuild()
+        return self
+
+    def update(self, x: float) -> float:
+        """Push one value (evicting the oldest once full) and return the mean."""
+        if self._filled == self.window:
+            self._remove(self._ring[self._pos])
+        else:
+            self._filled += 1
+        self._ring[self._pos] = x
+        self._pos = (self._pos + 1) % self.window
+        self._add(x)
+
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.window:
+            self._rebuild()
+        return self.mean
+
+    def revise(self, x: float) -> float:
+        """Replace the newest value with ``x``."""
+        if self._filled == 0:
+            return self.update(x)
+        newest = (self._pos - 1) % self.window
+        self._remove(self._ring[newest])
+        self._ring[newest] = x
+        self._add(x)
+        return self.mean
+
+    def _add(self, x: float) -> None:
+        if x != x:
+            return
+        self._nobs += 1
+        delta = x - self._mean
+        self._mean += delta / self._nobs
+        self._ssqdm += delta * (x - self._mean)
+
+    def _remove(self, x: float) -> None:
+        if x != x:
+            return
+        self._nobs -= 1
+        if self._nobs == 0:
+            self._mean = self._ssqdm = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._nobs
+        self._ssqdm -= delta * (x - self._mean)
+
+    def _rebuild(self) -> None:
+        values = self._ring[~np.isnan(self._ring)]
+        self._nobs = len(values)
+        self._mean = float(values.mean()) if self._nobs else 0.0
+        self._ssqdm = float(((values - self._mean) ** 2).sum()) if self._nobs else 0.0
+        self._since_rebuild = 0
+
+
+class WilderRSI:
+    """Relative Strength Index with Wilder smoothing, one close at a time."""
+
+    def __init__(self, period: Optional[int] = None):
+        self.period = INDICATORS["RSI_PERIOD"] if period is None else period
+        self._gains = RunningEMA(alpha=1.0 / self.period, min_periods=self.period)
+        self._losses = RunningEMA(alpha=1.0 / self.period, min_periods=self.period)
+        self._prev_close = _NAN
+        self._undo_close = _NAN
+
+    @property
+    def value(self) -> float:
+        avg_gain, avg_loss = self._gains.value, self._losses.value
+        if avg_loss != avg_loss:
+            return _NAN
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def seed(self, closes) -> "WilderRSI":
+        """Initialise the state from a close history (the last close via update())."""
+        x = np.asarray(closes, dtype=np.float64)
+        if len(x) == 0:
+            return self
+        head = x[:-1]
+        diff = np.concatenate([[np.nan], np.diff(head)])[: len(head)]
+        with np.errstate(invalid="ignore"):
+            self._gains.seed(np.where(diff > 0, diff, 0.0))
+            self._losses.seed(np.where(diff < 0, -diff, 0.0))
+        self._prev_close = float(head[-1]) if len(head) else _NAN
+        self.update(x[-1])
+        return self
+
+    def _step(self, close: float, revise: bool) -> float:
+        diff = close - self._prev_close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        if revise:
+            self._gains.revise(gain)
+            self._losses.revise(loss)
+        else:
+            self._gains.update(gain)
+            self._losses.update(loss)
+        return self.value
+
+    def update(self, close: float) -> float:
+        """Absorb a new close and return the updated RSI."""
+        self._undo_close = self._prev_close
+        value = self._step(close, revise=False)
+        self._prev_close = close
+        return value
+
+    def revise(self, close: float) -> float:
+        """Replace the most recent close."""
+        self._prev_close = self._undo_close
+        value = self._step(close, revise=True)
+        self._prev_close = close
+        return value
+
+
+class RunningMACD:
+    """MACD line and signal line updated one close at a time."""
+
+    def __init__(self, fast: Optional[int] = None, slow: Optional[int] = None, signal: Optional[int] = None):
+        fast = INDICATORS["MACD_FAST"] if fast is None else fast
+        slow = INDICATORS["MACD_SLOW"] if slow is None else slow
+        signal = INDICATORS["MACD_SIGNAL"] if signal is None else signal
+        self._fast = RunningEMA(span=fast, min_periods=fast)
+        self._slow = RunningEMA(span=slow, min_periods=slow)
+        self._signal = RunningEMA(span=signal, min_periods=signal)
+
+    @property
+    def value(self) -> Tuple[float, float]:
+        """Current (macd, signal) pair."""
+        return self._fast.value - self._slow.value, self._signal.value
+
+    def seed(self, closes) -> "RunningMACD":
+        """Initialise the state from a close history (the last close via update())."""
+        x = np.asarray(closes, dtype=np.float64)
+        if len(x) == 0:
+            return self
+        head = x[:-1]
+        fast = ema(head, alpha=self._fast.alpha, min_periods=self._fast.min_periods)
+        slow = ema(head, alpha=self._slow.alpha, min_periods=self._slow.min_periods)
+        self._fast.seed(head)
+        self._slow.seed(head)
+        self._signal.seed(fast - slow)
+        self.update(x[-1])
+        return self
+
+    def update(self, close: float) -> Tuple[float, float]:
+        """Absorb a new close and return (macd, signal)."""
+        line = self._fast.update(close) - self._slow.update(close)
+        return line, self._signal.update(line)
+
+    def revise(self, close: float) -> Tuple[float, float]:
+        """Replace the most recent close."""
+        line = self._fast.revise(close) - self._slow.revise(close)
+        return line, self._signal.revise(line)
+
+
+class IndicatorState:
+    """
+    Incremental version of the dashboard indicator set.
+
+    Tracks MA20, RSI, MACD and Signal (as in compute_indicators) plus MA7,
+    MA30 and annualized 7-bar volatility (as in add_all_indicators).
+    """
+
+    def __init__(self):
+        self._ma20 = RollingWindow(INDICATORS["MA_TREND"])
+        self._ma_short = RollingWindow(INDICATORS["MA_SHORT"])
+        self._ma_long = RollingWindow(INDICATORS["MA_LONG"])
+        self._rsi = WilderRSI()
+        self._macd = RunningMACD()
+        self._returns = RollingWindow(INDICATORS["VOLATILITY_WINDOW"])
+        self._prev_close = _NAN
+        self._undo_close = _NAN
+        self.bars = 0
+
+    def seed(self, closes) -> "IndicatorState":
+        """
+        Initialise every indicator from a close history.
+
+        The last close goes through update(), so it can be revised right away
+        (e.g., a stream whose first poll repeats the newest seeded bar).
+        """
+        x = np.asarray(closes, dtype=np.float64)
+        head = x[:-1]
+        for window in (self._ma20, self._ma_short, self._ma_long):
+            window.seed(head)
+        self._rsi.seed(head)
+        self._macd.seed(head)
+        self._prev_close = self._undo_close = _NAN
+        if len(head):
+            # Returns like pct_change(): missing closes carry the last one forward
+            padded = forward_fill(head)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                returns = padded[1:] / padded[:-1] - 1
+            self._returns.seed(np.concatenate([[np.nan], returns]))
+            self._prev_close = float(padded[-1])
+        else:
+            self._returns.seed(head)
+        self.bars = len(head)
+        if len(x):
+            self.update(x[-1])
+        return self
+
+    def update(self, close: float) -> Dict[str, float]:
+        """Absorb one new close and return the latest indicator values."""
+        self._undo_close = self._prev_close
+        self._returns.update(_pct_change(close, self._prev_close))
+        for window in (self._ma20, self._ma_short, self._ma_long):
+            window.update(close)
+        self._rsi.update(close)
+        self._macd.update(close)
+        if close == close:
+            self._prev_close = close
+        self.bars += 1
+        return self.values()
+
+    def revise(self, close: float) -> Dict[str, float]:
+        """Replace the most recent close and return the latest indicator values."""
+        if self.bars == 0:
+            return self.update(close)
+        self._returns.revise(_pct_change(close, self._undo_close))
+        for window in (self._ma20, self._ma_short, self._ma_long):
+            window.revise(close)
+        self._rsi.revise(close)
+        self._macd.revise(close)
+        self._prev_close = close if close == close else self._undo_close
+        return self.values()
+
+    def values(self) -> Dict[str, float]:
+        """Return the latest value of every tracked indicator."""
+        macd_line, signal_line = self._macd.value
+        return {
+            "MA20": self._ma20.mean,
+            "RSI": self._rsi.value,
+            "MACD": macd_line,
+            "Signal": signal_line,
+            "MA7": self._ma_short.mean,
+            "MA30": self._ma_long.mean,
+            "Volatility": self._returns.std * math.sqrt(365) * 100,
+        }
+
+
+def _pct_change(close: float, prev_close: float) -> float:
+    """One-bar return; a missing close counts as unchanged, like pct_change()."""
+    if close != close:
+        return 0.0 if prev_close == prev_close else _NAN
+    if prev_close != prev_close or prev_close == 0:
+        return _NAN
+    return close / prev_close - 1
@@ -0,0 +1,239 @@
+"""
+Process-wide cache of computed indicator columns.
+
+Market Pulse, Smart Forecast and the Multi-Agent TechBot all compute
+indicators for the tickers they show. IndicatorCache keeps one entry per
+(ticker, interval, indicator parameters), valid for the history ending at
+its last bar, so every page and session reuses the same arrays:
+
+- Same history: cached columns are served; newly requested indicators are
+  computed once and added to the entry
+- Same history plus new bars (or a revised last bar): the tail is extended
+  bar by bar with utils.incremental_indicators instead of recomputing
+- Anything else (e.g., the history start moved): recomputed in one
+  vectorized pass
+
+Entries are evicted least-recently-used once MAX_ENTRIES or MAX_BYTES
+(config.INDICATOR_CACHE) is exceeded.
+
+Example:
+    >>> cache = get_indicator_cache()
+    >>> indicators = cache.get("AAPL", "1d", prices, ["RSI", "MACD", "Signal"])
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import INDICATOR_CACHE, INDICATORS
+from utils.incremental_indicators import IndicatorState
+from utils.indicators import evaluate_indicators
+from utils.logger import get_logger
+from utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+# Columns IndicatorState can extend one bar at a time
+INCREMENTAL_COLUMNS = frozenset(IndicatorState().values())
+
+
+class _CacheEntry:
+    """Indicator columns for one price history, plus the state to extend it."""
+
+    def __init__(
+        self,
+        index: pd.Index,
+        close: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        state: Optional[IndicatorState] = None,
+    ):
+        self.index = index
+        self.close = close
+        self.columns = columns
+        self.state = state
+        self.fingerprint = _fingerprint(index, close)
+        self.nbytes = (
+            index.memory_usage() + close.nbytes + sum(a.nbytes for a in columns.values())
+        )
+
+    def frame(self, names: Sequence[str], index: pd.Index) -> pd.DataFrame:
+        """Return the requested columns as a new frame on the caller's index."""
+        return pd.DataFrame({name: self.columns[name] for name in names}, index=index)
+
+
+def _fingerprint(index: pd.Index, close: np.ndarray) -> Tuple:
+    """Cheap identity of a price history (same parts as data_loader.price_fingerprint)."""
+    if len(index) == 0:
+        return (0,)
+    return (len(index), index[0], index[-1], float(close[-1]), float(np.nansum(close)))
+
+
+def _params_key() -> Tuple:
+    """Current indicator parameters; changing config.INDICATORS starts new entries."""
+    return tuple(sorted(INDICATORS.items()))
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator columns keyed by (ticker, interval, parameters).
+
+    Thread-safe; concurrent requests for the same history and indicators
+    share one computation.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_incremental_bars: Optional[int] = None,
+    ):
+        self.max_entries = INDICATOR_CACHE["MAX_ENTRIES"] if max_entries is None else max_entries
+        self.max_bytes = INDICATOR_CACHE["MAX_BYTES"] if max_bytes is None else max_bytes
+        self.max_incremental_bars = (
+            INDICATOR_CACHE["MAX_INCREMENTAL_BARS"]
+            if max_incremental_bars is None
+            else max_incremental_bars
+        )
+        self._entries: "OrderedDict[Tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = SingleFlight()
+        self.nbytes = 0
+        self.stats = {"hits": 0, "extensions": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def get(
+        self, ticker: str, interval: str, prices: pd.DataFrame, names: Sequence[str]
+    ) -> pd.DataFrame:
+        """
+        Return indicator columns for a price history, computing only what is missing.
+
+        Args:
+            ticker: Ticker symbol the prices belong to
+            interval: Bar interval of the prices (e.g., '1d', '1m')
+            prices: DataFrame with a Close column, oldest bar first
+            names: Indicator names (see utils.indicators.available_indicators)
+
+        Returns:
+            New DataFrame indexed like ``prices`` holding the requested columns
+
+        Raises:
+            ValueError: If an indicator name is unknown
+        """
+        names = tuple(names)
+        key = (ticker.strip().upper(), interval, _params_key())
+        close = prices["Close"].to_numpy(dtype=np.float64, copy=True)
+        index = prices.index
+        flight_key = key + (_fingerprint(index, close), names)
+        entry = self._inflight.do(flight_key, self._resolve, key, index, close, names)
+        return entry.frame(names, index)
+
+    def _resolve(
+        self, key: Tuple, index: pd.Index, close: np.ndarray, names: Tuple[str, ...]
+    ) -> _CacheEntry:
+        state = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            if entry is not None and entry.fingerprint == _fingerprint(index, close):
+                self.stats["hits"] += 1
+                if all(name in entry.columns for name in names):
+                    return entry
+                action = "add"
+                state, entry.state = entry.state, None
+            elif entry is not None and self._extends(entry, index, close):
+                self.stats["extensions"] += 1
+                action = "extend"
+                # The state moves to the extended entry; this one is never extended again
+                state, entry.state = entry.state, None
+            else:
+                self.stats["misses"] += 1
+                action = "compute"
+
+        if action == "add":
+            columns = dict(entry.columns)
+            missing = [name for name in names if name not in columns]
+            columns.update(evaluate_indicators({"Close": close}, missing))
+            updated = _CacheEntry(entry.index, entry.close, columns, state)
+        elif action == "extend":
+            updated = self._extend(entry, state, index, close, names)
+        else:
+            logger.info(f"Calculating {', '.join(names)} for {key[0]} ({key[1]}, {len(close)} rows)")
+            updated = _CacheEntry(index, close, evaluate_indicators({"Close": close}, names))
+        self._store(key, updated)
+        return updated
+
+    def _extends(self, entry: _CacheEntry, index: pd.Index, close: np.ndarray) -> bool:
+        """True if the history is the cached one plus new bars (last cached bar may be revised)."""
+        cached = len(entry.index)
+        tail = len(index) - cached + 1
+        if cached == 0 or tail < 1 or tail > self.max_incremental_bars:
+            return False
+        if not INCREMENTAL_COLUMNS.issuperset(entry.columns):
+            return False
+        return index[:cached].equals(entry.index) and np.array_equal(
+            close[: cached - 1], entry.close[: cached - 1], equal_nan=True
+        )
+
+    def _extend(
+        self,
+        entry: _CacheEntry,
+        state: Optional[IndicatorState],
+        index: pd.Index,
+        close: np.ndarray,
+        names: Tuple[str, ...],
+    ) -> _CacheEntry:
+        """Bring an entry up to date by feeding only the new bars to an IndicatorState."""
+        cached = len(entry.index)
+        if state is None:
+            state = IndicatorState().seed(entry.close)
+        rows = [state.revise(close[cached - 1])]
+        rows.extend(state.update(value) for value in close[cached:].tolist())
+        columns = {
+            name: np.concatenate([values[: cached - 1], [row[name] for row in rows]])
+            for name, values in entry.columns.items()
+        }
+        missing = [name for name in names if name not in columns]
+        if missing:
+            columns.update(evaluate_indicators({"Close": close}, missing))
+        logger.debug(f"Extended cached indicators by {len(rows)} bars")
+        return _CacheEntry(index, close, columns, state)
+
+    def _store(self, key: Tuple, entry: _CacheEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self.nbytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+
+_cache: Optional[IndicatorCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Return the process-wide indicator cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IndicatorCache()
+    return _cache
@@ -0,0 +1,194 @@
+"""
+Indicator parameter sweeps computed in batch.
+
+config.INDICATORS fixes one RSI period, one MACD triple and one MA pair.
+The functions here evaluate a whole indicator family over a parameter grid
+in one call, sharing the expensive work across the grid:
+
+- sma_grid: every window from one prefix sum, gathered with broadcasting
+- rsi_grid: price changes and gains/losses computed once for all periods
+- ma_crossover_grid: every (short, long) spread from one sma_grid
+
+Grids are stacked on a new leading axis, so a 1-D series yields a
+(params x time) array and a (time x tickers) matrix yields
+(params x time x tickers). Defaults come from config.INDICATOR_SWEEPS.
+
+Example:
+    >>> periods, rsi = rsi_grid(close)
+    >>> pd.DataFrame(rsi.T, index=close.index, columns=periods).tail()
+"""
+
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.config import INDICATOR_SWEEPS
+from utils.indicators import (
+    as_float_array,
+    ema,
+    gains_losses,
+    prefix_sums,
+    price_changes,
+    rsi_from_averages,
+)
+
+
+def _as_windows(windows: Sequence[int], name: str) -> np.ndarray:
+    """Validate a parameter grid and return it as a 1-D int array."""
+    grid = np.asarray(windows, dtype=np.int64).ravel()
+    if grid.size == 0:
+        raise ValueError(f"{name} must not be empty")
+    if (grid < 1).any():
+        raise ValueError(f"{name} must be positive, got {grid.tolist()}")
+    return grid
+
+
+def _expand(mask: np.ndarray, ndim: int) -> np.ndarray:
+    """Append trailing axes so a (params x time) array broadcasts against ndim."""
+    return mask.reshape(mask.shape + (1,) * (ndim - mask.ndim))
+
+
+def sma_grid(
+    values, windows: Optional[Sequence[int]] = None, min_periods: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simple moving averages for many windows from a single prefix sum.
+
+    Each window total is ``S[t] - S[t - w]`` for the shared prefix sum ``S``;
+    the lagged sums for every window are gathered in one broadcast index, so
+    the cost is one cumulative sum plus one vectorized pass per output value.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        windows: Window lengths (default INDICATOR_SWEEPS["MA_WINDOWS"])
+        min_periods: Minimum valid observations per window (default: the
+            window length)
+
+    Returns:
+        Tuple of (windows, averages) with averages shaped
+        ``(len(windows),) + values.shape``; identical to sma() per window
+
+    Raises:
+        ValueError: If the grid is empty or holds non-positive windows
+    """
+    grid = _as_windows(INDICATOR_SWEEPS["MA_WINDOWS"] if windows is None else windows, "windows")
+    prefix = prefix_sums(values)
+    n = prefix.sums.shape[0]
+    if n == 0:
+        return grid, np.empty((len(grid),) + prefix.sums.shape)
+
+    rows = np.arange(n)
+    lag = rows[None, :] - grid[:, None]
+    has_lag = _expand(lag >= 0, prefix.sums.ndim + 1)
+    lag = np.maximum(lag, 0)
+
+    sums = prefix.sums[None] - np.where(has_lag, prefix.sums[lag], 0.0)
+    if prefix.valid_counts is None:
+        counts = _expand(np.minimum(rows[None, :] + 1, grid[:, None]), sums.ndim)
+    else:
+        counts = prefix.valid_counts[None] - np.where(has_lag, prefix.valid_counts[lag], 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = sums / counts
+    out += prefix.ref
+    minp = grid if min_periods is None else np.full_like(grid, max(min_periods, 1))
+    out[np.broadcast_to(counts < _expand(minp, sums.ndim), out.shape)] = np.nan
+    return grid, out
+
+
+def rsi_grid(
+    values, periods: Optional[Sequence[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Wilder RSI for many periods, sharing price changes and gains/losses.
+
+    Only the final smoothing pass depends on the period, and it runs as one
+    vectorized filter per period over all series at once.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array of closing prices
+        periods: RSI periods (default INDICATOR_SWEEPS["RSI_PERIODS"])
+
+    Returns:
+        Tuple of (periods, rsi) with rsi shaped ``(len(periods),) + values.shape``;
+        identical to rsi_wilder() per period
+
+    Raises:
+        ValueError: If the grid is empty or holds non-positive periods
+    """
+    grid = _as_windows(INDICATOR_SWEEPS["RSI_PERIODS"] if periods is None else periods, "periods")
+    x = as_float_array(values)
+    out = np.empty((len(grid),) + x.shape)
+    if x.shape[0] == 0:
+        return grid, out
+
+    moves = gains_losses(x, price_changes(x))
+    for i, period in enumerate(grid.tolist()):
+        smoothed = ema(moves, alpha=1.0 / period, min_periods=period)
+        out[i] = rsi_from_averages(smoothed)
+    return grid, out
+
+
+class CrossoverGrid(NamedTuple):
+    """Moving-average spreads for every (short, long) window pair."""
+
+    short_windows: np.ndarray
+    long_windows: np.ndarray
+    # (short x long x time[ x series]) short MA minus long MA; NaN where short >= long
+    spread: np.ndarray
+
+    def positions(self) -> np.ndarray:
+        """1.0 while the short MA is above the long MA, 0.0 below, NaN when undefined."""
+        with np.errstate(invalid="ignore"):
+            return np.where(np.isnan(self.spread), np.nan, (self.spread > 0).astype(np.float64))
+
+    def crossings(self) -> np.ndarray:
+        """+1 on the bar the short MA crosses above the long MA, -1 below, else 0."""
+        positions = self.positions()
+        out = np.zeros_like(positions)
+        # The bar both averages first exist on is not a crossing
+        out[:, :, 1:] = np.nan_to_num(np.diff(positions, axis=2))
+        return out
+
+
+def ma_crossover_grid(
+    values,
+    short_windows: Optional[Sequence[int]] = None,
+    long_windows: Optional[Sequence[int]] = None,
+) -> CrossoverGrid:
+    """
+    Moving-average crossover spreads for every (short, long) pair at once.
+
+    The averages for the union of both grids come from one sma_grid() call
+    and the pairwise spreads are a single broadcast subtraction.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array of closing prices
+        short_windows: Short MA windows (default INDICATOR_SWEEPS["MA_SHORT_WINDOWS"])
+        long_windows: Long MA windows (default INDICATOR_SWEEPS["MA_LONG_WINDOWS"])
+
+    Returns:
+        CrossoverGrid; pairs with short >= long are NaN
+
+    Raises:
+        ValueError: If either grid is empty or holds non-positive windows
+
+    Example:
+        >>> grid = ma_crossover_grid(close, [5, 10], [20, 50])
+        >>> grid.crossings()[1, 0, -1]  # MA10 vs MA20 on the last bar
+    """
+    short = _as_windows(
+        INDICATOR_SWEEPS["MA_SHORT_WINDOWS"] if short_windows is None else short_windows,
+        "short_windows",
+    )
+    long = _as_windows(
+        INDICATOR_SWEEPS["MA_LONG_WINDOWS"] if long_windows is None else long_windows,
+        "long_windows",
+    )
+    windows, inverse = np.unique(np.concatenate([short, long]), return_inverse=True)
+    _, averages = sma_grid(values, windows)
+
+    spread = averages[inverse[: len(short)], None] - averages[None, inverse[len(short):]]
+    invalid = _expand(short[:, None] >= long[None, :], spread.ndim)
+    spread[np.broadcast_to(invalid, spread.shape)] = np.nan
+    return CrossoverGrid(short, long, spread)
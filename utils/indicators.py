@@ -2,16 +2,881 @@
 
 Provides functions for calculating RSI, MACD, Moving Averages,
 and other technical indicators with proper error handling.
+
+All indicators are built on a small NumPy engine (sma, ema, rsi_wilder,
+macd) that works on contiguous float arrays along axis 0, so the same
+kernels serve single series and (dates x tickers) matrices. Rolling
+kernels (rolling_mean/std/min/max/argmax/quantile) replace pandas
+``.rolling()``: sums come from prefix sums, extremes from O(n) block scans
+and order statistics from ``sliding_window_view``; all skip NaNs like
+pandas. Named
+indicators are registered in a dependency graph (see evaluate_indicators)
+so callers compute only what they display. The pandas helpers below and
+utils.data_loader.compute_indicators are thin wrappers around it and
+produce identical values. For bar-by-bar updates use the
+O(1) state objects in utils.incremental_indicators.
 """
 
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
 from utils.config import INDICATORS
 
 
+def as_float_array(values) -> np.ndarray:
+    """Return values (list, Series, array) as a float64 ndarray, without copying if already one."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _first_valid_values(x: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """First non-NaN value along axis 0 (0.0 for all-NaN columns), broadcastable to x."""
+    first = np.argmax(valid, axis=0)
+    if x.ndim == 1:
+        seed = x[first]
+    else:
+        seed = np.take_along_axis(x, first[None, ...], axis=0)
+    return np.where(np.isnan(seed), 0.0, seed)
+
+
+def _trailing(cumulative: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window totals along axis 0 from a prefix sum (left untouched)."""
+    out = cumulative.copy()
+    out[window:] -= cumulative[:-window]
+    return out
+
+
+def _window_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums along axis 0 from one prefix sum."""
+    return _trailing(np.cumsum(values, axis=0), window)
+
+
+def _window_counts(valid: np.ndarray, window: int, has_nan: bool) -> np.ndarray:
+    """Number of valid values in each trailing window, broadcastable to ``valid``."""
+    if has_nan:
+        return _window_sum(valid.astype(np.float64), window)
+    counts = np.minimum(np.arange(1, valid.shape[0] + 1, dtype=np.float64), window)
+    return counts.reshape((-1,) + (1,) * (valid.ndim - 1))
+
+
+def _centred(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+    """
+    Shift each series by its first valid value and zero out NaNs.
+
+    Centring keeps long prefix sums precise. Returns (centred, ref, valid, has_nan).
+    """
+    nan_mask = np.isnan(x)
+    has_nan = bool(nan_mask.any())
+    valid = ~nan_mask
+    ref = _first_valid_values(x, valid)
+    centred = np.where(valid, x - ref, 0.0) if has_nan else x - ref
+    return centred, ref, valid, has_nan
+
+
+class PrefixSums(NamedTuple):
+    """Prefix sums of a centred series, shared by every moving average over it."""
+
+    sums: np.ndarray
+    ref: np.ndarray
+    valid_counts: Optional[np.ndarray]  # None when the series has no NaNs
+
+
+def prefix_sums(values) -> PrefixSums:
+    """
+    Build the prefix sums that sma_from_prefix() slices into any window.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+
+    Returns:
+        PrefixSums for ``values``
+    """
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return PrefixSums(x.copy(), np.zeros(x.shape[1:]), None)
+    centred, ref, valid, has_nan = _centred(x)
+    valid_counts = np.cumsum(valid, axis=0, dtype=np.float64) if has_nan else None
+    return PrefixSums(np.cumsum(centred, axis=0), ref, valid_counts)
+
+
+def sma_from_prefix(
+    prefix: PrefixSums, window: int, min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Simple moving average of any window from precomputed prefix sums.
+
+    Args:
+        prefix: Output of prefix_sums()
+        window: Window length in rows
+        min_periods: Minimum valid observations per window (default ``window``)
+
+    Returns:
+        Array shaped like the original values
+    """
+    minp = window if min_periods is None else max(min_periods, 1)
+    if prefix.sums.shape[0] == 0:
+        return prefix.sums.copy()
+
+    if prefix.valid_counts is None:
+        counts = np.minimum(np.arange(1, prefix.sums.shape[0] + 1, dtype=np.float64), window)
+        counts = counts.reshape((-1,) + (1,) * (prefix.sums.ndim - 1))
+    else:
+        counts = _trailing(prefix.valid_counts, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = _trailing(prefix.sums, window) / counts
+    out += prefix.ref
+    out[np.broadcast_to(counts < minp, out.shape)] = np.nan
+    return out
+
+
+def sma(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Simple moving average via prefix sums, O(n) regardless of window.
+
+    Matches ``pd.Series.rolling(window, min_periods).mean()``: NaNs are
+    skipped and a window needs ``min_periods`` valid values (default
+    ``window``).
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        min_periods: Minimum valid observations per window
+
+    Returns:
+        Array shaped like ``values``
+    """
+    return sma_from_prefix(prefix_sums(values), window, min_periods)
+
+
+def rolling_std(
+    values, window: int, min_periods: Optional[int] = None, ddof: int = 1
+) -> np.ndarray:
+    """
+    Rolling standard deviation via prefix sums of values and squares.
+
+    Matches ``pd.Series.rolling(window, min_periods).std(ddof=ddof)``.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        min_periods: Minimum valid observations per window (default ``window``)
+        ddof: Delta degrees of freedom
+
+    Returns:
+        Array shaped like ``values``
+    """
+    x = as_float_array(values)
+    minp = window if min_periods is None else max(min_periods, 1)
+    if x.shape[0] == 0:
+        return x.copy()
+
+    centred, _, valid, has_nan = _centred(x)
+    counts = _window_counts(valid, window, has_nan)
+    sums = _window_sum(centred, window)
+    squares = _window_sum(centred * centred, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = (squares - sums * sums / counts) / (counts - ddof)
+    out = np.sqrt(np.maximum(var, 0.0))
+    out[np.broadcast_to((counts < minp) | (counts <= ddof), out.shape)] = np.nan
+    return out
+
+
+# Sliding-window kernels (min/max/argmax/quantile) process at most this many
+# window elements per chunk to bound the temporary sorted/compared copies
+_CHUNK_ELEMENTS = 1 << 22
+
+
+def rolling_mean(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """Rolling mean; alias of sma() for the rolling_* kernel family."""
+    return sma(values, window, min_periods)
+
+
+def _rolling_extreme(x: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """
+    NaN-skipping rolling max/min in O(n) using block prefix and suffix scans.
+
+    Splits axis 0 into blocks of ``window`` rows; every trailing window spans
+    the tail of one block and the head of the next, so it is the ``ufunc`` of
+    one suffix-scan and one prefix-scan value (van Herk/Gil-Werman).
+    ``ufunc`` is np.fmax or np.fmin, which ignore NaN.
+    """
+    n = x.shape[0]
+    blocks = -(-n // window)
+    padded = np.full((blocks * window,) + x.shape[1:], np.nan)
+    padded[:n] = x
+    padded = padded.reshape((blocks, window) + x.shape[1:])
+
+    prefix = ufunc.accumulate(padded, axis=1).reshape((-1,) + x.shape[1:])[:n]
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape((-1,) + x.shape[1:])
+    out = prefix.copy()
+    if window <= n:
+        out[window - 1:] = ufunc(suffix[: n - window + 1], prefix[window - 1:])
+    return out
+
+
+def _masked_by_count(
+    out: np.ndarray, x: np.ndarray, window: int, min_periods: Optional[int]
+) -> np.ndarray:
+    """NaN out windows with fewer than ``min_periods`` (default ``window``) valid values."""
+    minp = window if min_periods is None else max(min_periods, 1)
+    valid = ~np.isnan(x)
+    counts = _window_counts(valid, window, not valid.all())
+    out[np.broadcast_to(counts < minp, out.shape)] = np.nan
+    return out
+
+
+def rolling_max(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Rolling maximum in O(n) regardless of window.
+
+    Matches ``pd.Series.rolling(window, min_periods).max()``: NaNs are
+    skipped and a window needs ``min_periods`` valid values (default
+    ``window``).
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        min_periods: Minimum valid observations per window
+
+    Returns:
+        Array shaped like ``values``
+    """
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return x.copy()
+    return _masked_by_count(_rolling_extreme(x, window, np.fmax), x, window, min_periods)
+
+
+def rolling_min(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Rolling minimum in O(n) regardless of window.
+
+    Matches ``pd.Series.rolling(window, min_periods).min()``.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        min_periods: Minimum valid observations per window (default ``window``)
+
+    Returns:
+        Array shaped like ``values``
+    """
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return x.copy()
+    return _masked_by_count(_rolling_extreme(x, window, np.fmin), x, window, min_periods)
+
+
+def rolling_windows(values, window: int) -> np.ndarray:
+    """
+    Read-only view of the trailing window ending at every row.
+
+    The first ``window - 1`` windows are left-padded with NaN, so row ``t``
+    of the result holds ``values[t - window + 1 : t + 1]`` on a new last
+    axis. Use it to express custom (including multi-output) window kernels
+    without a Python loop; the view itself costs no extra memory beyond the
+    padding.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+
+    Returns:
+        Array shaped ``values.shape + (window,)``
+
+    Example:
+        >>> windows = rolling_windows(close, 20)
+        >>> ranges = np.nanmax(windows, axis=-1) - np.nanmin(windows, axis=-1)
+    """
+    x = as_float_array(values)
+    padded = np.concatenate([np.full((window - 1,) + x.shape[1:], np.nan), x])
+    return sliding_window_view(padded, window, axis=0)
+
+
+def _row_chunks(x: np.ndarray, window: int):
+    """Yield row slices sized so each chunk holds about _CHUNK_ELEMENTS window values."""
+    width = window * int(np.prod(x.shape[1:], dtype=np.int64))
+    step = max(1, _CHUNK_ELEMENTS // max(width, 1))
+    for start in range(0, x.shape[0], step):
+        yield slice(start, min(start + step, x.shape[0]))
+
+
+def rolling_argmax(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Position of the maximum inside each trailing window.
+
+    Matches ``pd.Series.rolling(window, min_periods).apply(np.nanargmax)``:
+    0 is the oldest value in the window (ties resolve to the oldest), so
+    ``window - 1 - result`` is the number of bars since the high. Windows
+    with fewer than ``min_periods`` valid values are NaN.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        min_periods: Minimum valid observations per window (default ``window``)
+
+    Returns:
+        Float array shaped like ``values``
+    """
+    return _rolling_arg_extreme(values, window, min_periods, np.fmax)
+
+
+def rolling_argmin(values, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """Position of the minimum inside each trailing window; see rolling_argmax()."""
+    return _rolling_arg_extreme(values, window, min_periods, np.fmin)
+
+
+def _rolling_arg_extreme(
+    values, window: int, min_periods: Optional[int], ufunc: np.ufunc
+) -> np.ndarray:
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return x.copy()
+
+    extreme = _rolling_extreme(x, window, ufunc)
+    windows = rolling_windows(x, window)
+    out = np.empty_like(x)
+    for rows in _row_chunks(x, window):
+        out[rows] = np.argmax(windows[rows] == extreme[rows][..., None], axis=-1)
+
+    # Partial windows at the start hold fewer than ``window`` real values
+    head = min(window - 1, x.shape[0])
+    offset = np.arange(window - 1, window - 1 - head, -1, dtype=np.float64)
+    out[:head] -= offset.reshape((-1,) + (1,) * (x.ndim - 1))
+    out[np.isnan(extreme)] = np.nan
+    return _masked_by_count(out, x, window, min_periods)
+
+
+def rolling_quantile(
+    values, window: int, q: float, min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Rolling quantile with linear interpolation.
+
+    Matches ``pd.Series.rolling(window, min_periods).quantile(q)``: each
+    window is sorted once (NaNs sort last and are excluded), then the
+    quantile is interpolated between the two nearest valid order statistics.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array
+        window: Window length in rows
+        q: Quantile in [0, 1] (0.5 is the rolling median)
+        min_periods: Minimum valid observations per window (default ``window``)
+
+    Returns:
+        Array shaped like ``values``
+
+    Raises:
+        ValueError: If q is outside [0, 1]
+    """
+    if not 0.0 <= q <= 1.0:
+        raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return x.copy()
+
+    windows = rolling_windows(x, window)
+    out = np.empty_like(x)
+    for rows in _row_chunks(x, window):
+        ordered = np.sort(windows[rows], axis=-1)
+        valid = (~np.isnan(ordered)).sum(axis=-1)
+        position = q * np.maximum(valid - 1, 0)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, np.maximum(valid - 1, 0))
+        low_value = np.take_along_axis(ordered, low[..., None], axis=-1)[..., 0]
+        high_value = np.take_along_axis(ordered, high[..., None], axis=-1)[..., 0]
+        out[rows] = low_value + (high_value - low_value) * (position - low)
+    return _masked_by_count(out, x, window, min_periods)
+
+
+def ema(
+    values,
+    span: Optional[float] = None,
+    alpha: Optional[float] = None,
+    min_periods: int = 0,
+) -> np.ndarray:
+    """
+    Exponential moving average in a single recursive pass.
+
+    Matches ``pd.Series.ewm(span=..., adjust=False, min_periods=...).mean()``:
+    the average starts at the first valid value and is NaN until
+    ``min_periods`` valid values have been seen. Series without interior
+    gaps run through one ``scipy.signal.lfilter`` call; series with gaps
+    fall back to pandas' gap-weighting recursion.
+
+    Args:
+        values: Array with time along axis 0 (1-D, or 2-D time x series)
+        span: EMA span (alpha = 2 / (span + 1))
+        alpha: Smoothing factor, used instead of ``span`` (e.g., 1 / period
+            for Wilder smoothing)
+        min_periods: Minimum valid observations before emitting values
+
+    Returns:
+        Array shaped like ``values``
+    """
+    if alpha is None:
+        if span is None:
+            raise ValueError("Either span or alpha must be provided")
+        alpha = 2.0 / (span + 1.0)
+    x = as_float_array(values)
+    minp = max(min_periods, 1)
+    if x.shape[0] == 0:
+        return x.copy()
+
+    nan_mask = np.isnan(x)
+    if not nan_mask.any():
+        out, _ = lfilter([alpha], [1.0, alpha - 1.0], x, axis=0, zi=(1.0 - alpha) * x[:1])
+        out[: minp - 1] = np.nan
+        return out
+
+    valid = ~nan_mask
+    count = np.cumsum(valid, axis=0)
+    gaps = (nan_mask & (count > 0)).any(axis=0)
+
+    if np.any(gaps):
+        columns = x.reshape(x.shape[0], -1)
+        out = np.empty_like(columns)
+        for col in range(columns.shape[1]):
+            out[:, col] = _ema_with_gaps(columns[:, col], alpha)
+        out = out.reshape(x.shape)
+    else:
+        # Leading NaNs only: repeat the first valid value, which the
+        # recursion then reproduces exactly, and mask the warm-up afterwards
+        filled = np.where(valid, x, _first_valid_values(x, valid))
+        out, _ = lfilter(
+            [alpha], [1.0, alpha - 1.0], filled, axis=0, zi=(1.0 - alpha) * filled[:1]
+        )
+
+    out[count < minp] = np.nan
+    return out
+
+
+def _ema_with_gaps(x: np.ndarray, alpha: float) -> np.ndarray:
+    """pandas' adjust=False EMA recursion for a series with missing values."""
+    out = np.empty(len(x))
+    decay = 1.0 - alpha
+    weighted = np.nan
+    old_wt = 1.0
+    for i, cur in enumerate(x.tolist()):
+        if weighted == weighted:
+            old_wt *= decay
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def price_changes(values) -> np.ndarray:
+    """Bar-to-bar differences along axis 0; the first row is NaN."""
+    x = as_float_array(values)
+    diff = np.empty_like(x)
+    if x.shape[0]:
+        diff[0] = np.nan
+        np.subtract(x[1:], x[:-1], out=diff[1:])
+    return diff
+
+
+def forward_fill(values) -> np.ndarray:
+    """Carry the last non-NaN value forward along axis 0 (leading NaNs stay NaN)."""
+    x = as_float_array(values)
+    rows = np.arange(x.shape[0]).reshape((-1,) + (1,) * (x.ndim - 1))
+    positions = np.maximum.accumulate(np.where(np.isnan(x), 0, rows), axis=0)
+    return np.take_along_axis(x, positions, axis=0)
+
+
+def compact_columns(values) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Move each column's non-NaN values to the bottom, keeping their order.
+
+    A wide close matrix joined on the union of dates (e.g., stocks and
+    24/7 crypto) has NaN rows inside each ticker's history; indicators
+    would treat them as flat bars or gaps. After compaction every column
+    is its own bar sequence ending in the last row, padded with leading
+    NaN, which the kernels treat as "not started yet".
+
+    Args:
+        values: (dates x tickers) array
+
+    Returns:
+        Tuple of (compacted array, source row of every compacted cell);
+        when no column has a gap the input array itself is returned
+
+    Example:
+        >>> compacted, rows = compact_columns(wide_closes.to_numpy())
+        >>> np.put_along_axis(out, rows, panel_indicators(compacted)["RSI"], axis=0)
+    """
+    x = as_float_array(values)
+    valid = ~np.isnan(x)
+    if (valid[1:] >= valid[:-1]).all():
+        rows = np.arange(x.shape[0]).reshape((-1,) + (1,) * (x.ndim - 1))
+        return x, np.broadcast_to(rows, x.shape)
+    # Stable sort of the validity mask: missing rows first, valid rows in date order
+    rows = np.argsort(valid, axis=0, kind="stable")
+    return np.take_along_axis(x, rows, axis=0), rows
+
+
+def gains_losses(x: np.ndarray, diff: np.ndarray) -> np.ndarray:
+    """
+    Per-bar RSI gains and losses, the input to Wilder smoothing.
+
+    Args:
+        x: Closing prices along axis 0
+        diff: price_changes(x)
+
+    Returns:
+        Array shaped ``x.shape + (2,)`` with gains in ``[..., 0]`` and losses
+        in ``[..., 1]``; NaN before each series starts, 0 for flat bars
+    """
+    with np.errstate(invalid="ignore"):
+        gains = np.where(diff > 0, diff, 0.0)
+        losses = np.where(diff < 0, -diff, 0.0)
+    # Rows before a series starts (panel padding) are missing, not flat
+    leading = np.cumsum(~np.isnan(x), axis=0) == 0
+    if leading.any():
+        gains[leading] = np.nan
+        losses[leading] = np.nan
+    return np.stack([gains, losses], axis=-1)
+
+
+def rsi_from_averages(smoothed: np.ndarray) -> np.ndarray:
+    """
+    RSI from smoothed gains and losses.
+
+    Args:
+        smoothed: gains_losses() output after smoothing along axis 0
+
+    Returns:
+        RSI shaped like ``smoothed[..., 0]``; 100 where the average loss is 0
+    """
+    avg_gain, avg_loss = smoothed[..., 0], smoothed[..., 1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+    rsi[np.isnan(avg_loss)] = np.nan
+    return rsi
+
+
+def rsi_wilder(values, period: int = 14) -> np.ndarray:
+    """
+    Wilder's RSI (exponential smoothing with alpha = 1 / period).
+
+    The first ``period - 1`` rows are NaN; a window without losses is 100.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array of closing prices
+        period: RSI period
+
+    Returns:
+        Array of RSI values (0-100) shaped like ``values``
+    """
+    x = as_float_array(values)
+    if x.shape[0] == 0:
+        return x.copy()
+
+    # Smooth gains and losses together in one filter pass
+    smoothed = ema(gains_losses(x, price_changes(x)), alpha=1.0 / period, min_periods=period)
+    return rsi_from_averages(smoothed)
+
+
+def macd(
+    values,
+    fast: Optional[int] = None,
+    slow: Optional[int] = None,
+    signal: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    MACD line and signal line.
+
+    Each EMA waits for its own span of valid values, so the MACD line starts
+    at row ``slow - 1`` and the signal line ``signal - 1`` rows later.
+
+    Args:
+        values: 1-D array or 2-D (time x series) array of closing prices
+        fast: Fast EMA period (default from config)
+        slow: Slow EMA period (default from config)
+        signal: Signal line period (default from config)
+
+    Returns:
+        Tuple of (macd_line, signal_line) arrays
+    """
+    fast = INDICATORS["MACD_FAST"] if fast is None else fast
+    slow = INDICATORS["MACD_SLOW"] if slow is None else slow
+    signal = INDICATORS["MACD_SIGNAL"] if signal is None else signal
+
+    x = as_float_array(values)
+    macd_line = ema(x, span=fast, min_periods=fast) - ema(x, span=slow, min_periods=slow)
+    signal_line = ema(macd_line, span=signal, min_periods=signal)
+    return macd_line, signal_line
+
+
+# ---------------------------------------------------------------------------
+# Indicator graph
+#
+# Every indicator declares the nodes it is computed from. evaluate_indicators
+# resolves the requested names into a dependency-ordered plan, so shared
+# intermediates (price changes, the fast and slow EMAs, the close prefix sums
+# behind every moving average) are computed once per call and indicators
+# nobody asked for are never computed. Parameters are read from
+# config.INDICATORS at evaluation time.
+# ---------------------------------------------------------------------------
+
+
+class IndicatorSpec(NamedTuple):
+    """A node of the indicator graph."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., Any]
+    public: bool  # False for shared intermediates
+
+
+_REGISTRY: Dict[str, IndicatorSpec] = {}
+
+
+def register_indicator(name: str, inputs: Sequence[str], public: bool = True):
+    """
+    Decorator registering a function as an indicator graph node.
+
+    The function receives the values of ``inputs`` positionally. Inputs are
+    other registered nodes or source arrays passed to evaluate_indicators
+    (e.g., "Close").
+
+    Args:
+        name: Node name (the output column name for public indicators)
+        inputs: Names of the nodes the function consumes
+        public: False for intermediates that are not offered as columns
+
+    Example:
+        >>> @register_indicator("MA100", inputs=["close_prefix"])
+        ... def _ma100(prefix):
+        ...     return sma_from_prefix(prefix, 100)
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _REGISTRY[name] = IndicatorSpec(name, tuple(inputs), func, public)
+        return func
+
+    return decorator
+
+
+def available_indicators() -> List[str]:
+    """Return the names of all public indicators, in registration order."""
+    return [spec.name for spec in _REGISTRY.values() if spec.public]
+
+
+def indicator_plan(names: Iterable[str], sources: Iterable[str] = ("Close",)) -> List[str]:
+    """
+    Resolve requested indicators into the nodes to compute, dependencies first.
+
+    Args:
+        names: Requested indicator names
+        sources: Names supplied as inputs rather than computed
+
+    Returns:
+        Node names in evaluation order; each appears once
+
+    Raises:
+        ValueError: If a name is unknown or the graph has a cycle
+    """
+    sources = set(sources)
+    plan: List[str] = []
+    done = set(sources)
+    visiting = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        spec = _REGISTRY.get(name)
+        if spec is None:
+            raise ValueError(
+                f"Unknown indicator '{name}'. Available: {', '.join(available_indicators())}"
+            )
+        if name in visiting:
+            raise ValueError(f"Indicator graph has a cycle through '{name}'")
+        visiting.add(name)
+        for dependency in spec.inputs:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+        plan.append(name)
+
+    for name in names:
+        visit(name)
+    return plan
+
+
+def evaluate_indicators(
+    sources: Mapping[str, Any], names: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Compute only the requested indicators, sharing intermediates between them.
+
+    Args:
+        sources: Input arrays by name, e.g. ``{"Close": closes}``; 1-D or
+            2-D (time x series)
+        names: Indicators to compute
+
+    Returns:
+        Dict mapping each requested name to an array shaped like the sources
+
+    Raises:
+        ValueError: If a name is unknown
+
+    Example:
+        >>> out = evaluate_indicators({"Close": close}, ["RSI", "MACD", "Signal"])
+        >>> sorted(out)
+        ['MACD', 'RSI', 'Signal']
+    """
+    values: Dict[str, Any] = {key: as_float_array(value) for key, value in sources.items()}
+    for name in indicator_plan(names, values):
+        spec = _REGISTRY[name]
+        values[name] = spec.compute(*(values[dependency] for dependency in spec.inputs))
+    return {name: values[name] for name in names}
+
+
+@register_indicator("close_diff", inputs=["Close"], public=False)
+def _close_diff(close):
+    return price_changes(close)
+
+
+@register_indicator("close_prefix", inputs=["Close"], public=False)
+def _close_prefix(close):
+    return prefix_sums(close)
+
+
+@register_indicator("returns", inputs=["Close"], public=False)
+def _returns(close):
+    # Like pct_change(): a missing close carries the last one forward (per column)
+    padded = forward_fill(close)
+    returns = np.full_like(close, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(padded[1:], padded[:-1], out=returns[1:])
+    returns[1:] -= 1
+    return returns
+
+
+@register_indicator("avg_gain_loss", inputs=["Close", "close_diff"], public=False)
+def _avg_gain_loss(close, diff):
+    period = INDICATORS["RSI_PERIOD"]
+    if close.shape[0] == 0:
+        return np.empty(close.shape + (2,))
+    return ema(gains_losses(close, diff), alpha=1.0 / period, min_periods=period)
+
+
+@register_indicator("ema_fast", inputs=["Close"], public=False)
+def _ema_fast(close):
+    return ema(close, span=INDICATORS["MACD_FAST"], min_periods=INDICATORS["MACD_FAST"])
+
+
+@register_indicator("ema_slow", inputs=["Close"], public=False)
+def _ema_slow(close):
+    return ema(close, span=INDICATORS["MACD_SLOW"], min_periods=INDICATORS["MACD_SLOW"])
+
+
+def _register_moving_average(name: str, window_key: str) -> None:
+    register_indicator(name, inputs=["close_prefix"])(
+        lambda prefix: sma_from_prefix(prefix, INDICATORS[window_key])
+    )
+
+
+_register_moving_average("MA7", "MA_SHORT")
+_register_moving_average("MA20", "MA_TREND")
+_register_moving_average("MA30", "MA_LONG")
+_register_moving_average("MA50", "MA_TREND_LONG")
+
+
+@register_indicator("RSI", inputs=["avg_gain_loss"])
+def _rsi(smoothed):
+    return rsi_from_averages(smoothed)
+
+
+@register_indicator("MACD", inputs=["ema_fast", "ema_slow"])
+def _macd_line(fast, slow):
+    return fast - slow
+
+
+@register_indicator("Signal", inputs=["MACD"])
+def _signal_line(macd_line):
+    return ema(macd_line, span=INDICATORS["MACD_SIGNAL"], min_periods=INDICATORS["MACD_SIGNAL"])
+
+
+@register_indicator("Volatility", inputs=["returns"])
+def _volatility(returns):
+    window = INDICATORS["VOLATILITY_WINDOW"]
+    return rolling_std(returns, window) * np.sqrt(365) * 100
+
+
+PANEL_COLUMNS = ["MA7", "MA20", "MA30", "RSI", "MACD", "Signal", "Volatility"]
+
+
+def panel_indicators(
+    closes, names: Optional[Sequence[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute indicators for every column of a close matrix at once.
+
+    Args:
+        closes: 2-D array of closing prices (dates x tickers); columns with
+            shorter histories are padded with NaN
+        names: Indicators to compute (default PANEL_COLUMNS)
+
+    Returns:
+        Dict mapping each requested name to a (dates x tickers) array
+
+    Example:
+        >>> arrays = panel_indicators(wide_closes.to_numpy())
+        >>> arrays["RSI"][-1]  # latest RSI of every ticker
+    """
+    return evaluate_indicators({"Close": closes}, PANEL_COLUMNS if names is None else names)
+
+
+def add_panel_indicators(
+    closes: pd.DataFrame, dropna: bool = True, names: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Compute indicators for a wide close frame and return them stacked.
+
+    Args:
+        closes: DataFrame of closing prices indexed by date with one column
+            per ticker
+        dropna: Drop rows where the ticker has no close (e.g., before its
+            history starts)
+        names: Indicators to compute (default PANEL_COLUMNS)
+
+    Returns:
+        DataFrame indexed by (Ticker, Date) with Close and the indicators
+
+    Example:
+        >>> panel = add_panel_indicators(wide_closes)
+        >>> panel.xs("AAPL")["RSI"].tail()
+    """
+    names = list(PANEL_COLUMNS if names is None else names)
+    values = closes.to_numpy(dtype=np.float64)
+    arrays = panel_indicators(values, names)
+
+    # (dates x tickers) -> one ticker-major column per field
+    arrays["Close"] = values
+    columns = {name: arrays[name].T.ravel() for name in ["Close"] + names}
+    index = pd.MultiIndex.from_product(
+        [closes.columns, closes.index], names=["Ticker", closes.index.name or "Date"]
+    )
+    panel = pd.DataFrame(columns, index=index)
+    missing = np.isnan(columns["Close"])
+    if dropna and missing.any():
+        panel = panel[~missing]
+    return panel
+
+
 def calculate_rsi(prices: pd.Series, period: int = None) -> pd.Series:
     """
-    Calculate Relative Strength Index (RSI).
+    Calculate Relative Strength Index (RSI) with Wilder's smoothing.
+    
+    The warm-up rows are filled with a neutral 50.
     
     Args:
         prices: Series of closing prices
@@ -29,14 +894,7 @@ def calculate_rsi(prices: pd.Series, period: int = None) -> pd.Series:
     if len(prices) < period:
         raise ValueError(f"Need at least {period} data points for RSI calculation")
     
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    
-    # Prevent division by zero
-    loss = loss.replace(0, 1e-10)
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
+    rsi = pd.Series(rsi_wilder(prices.to_numpy(dtype=np.float64), period), index=prices.index)
     
     # Fill NaN values with neutral RSI
     rsi = rsi.fillna(50)
@@ -58,7 +916,7 @@ def calculate_macd(prices: pd.Series,
         signal: Signal line period (default from config)
     
     Returns:
-        Tuple of (macd_line, signal_line)
+        Tuple of (macd_line, signal_line), NaN until each EMA has warmed up
     """
     if fast is None:
         fast = INDICATORS["MACD_FAST"]
@@ -67,12 +925,12 @@ def calculate_macd(prices: pd.Series,
     if signal is None:
         signal = INDICATORS["MACD_SIGNAL"]
     
-    exp1 = prices.ewm(span=fast, adjust=False).mean()
-    exp2 = prices.ewm(span=slow, adjust=False).mean()
-    macd = exp1 - exp2
-    signal_line = macd.ewm(span=signal, adjust=False).mean()
+    macd_line, signal_line = macd(prices.to_numpy(dtype=np.float64), fast, slow, signal)
     
-    return macd, signal_line
+    return (
+        pd.Series(macd_line, index=prices.index),
+        pd.Series(signal_line, index=prices.index),
+    )
 
 
 def calculate_moving_averages(prices: pd.Series, 
@@ -94,8 +952,9 @@ def calculate_moving_averages(prices: pd.Series,
     if long_period is None:
         long_period = INDICATORS["MA_LONG"]
     
-    ma_short = prices.rolling(window=short_period).mean()
-    ma_long = prices.rolling(window=long_period).mean()
+    close = prices.to_numpy(dtype=np.float64)
+    ma_short = pd.Series(sma(close, short_period), index=prices.index)
+    ma_long = pd.Series(sma(close, long_period), index=prices.index)
     
     return ma_short, ma_long
 
@@ -111,8 +970,8 @@ def calculate_volatility(returns: pd.Series, window: int = 7) -> pd.Series:
     Returns:
         Series of annualized volatility percentages
     """
-    volatility = returns.rolling(window=window).std() * np.sqrt(365) * 100
-    return volatility
+    volatility = rolling_std(returns.to_numpy(dtype=np.float64), window) * np.sqrt(365) * 100
+    return pd.Series(volatility, index=returns.index)
 
 
 def add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
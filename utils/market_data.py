@@ -0,0 +1,342 @@
+"""
+Market data providers.
+
+``utils.data_loader`` talks to a provider instead of calling yfinance
+directly. Two providers ship with the app:
+
+- YFinanceProvider: live Yahoo Finance data (the default)
+- ReplayProvider: recorded Parquet/JSON fixtures served from disk with a
+  configurable per-request latency, for offline benchmarks and CI perf gates
+
+Select one with the MARKET_DATA_PROVIDER environment variable
+('yfinance' or 'replay') or install one programmatically with set_provider().
+"""
+
+import json
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+import requests
+import yfinance as yf
+
+from utils.config import MARKET_DATA
+from utils.exceptions import ConfigurationError
+from utils.logger import get_logger
+from utils.price_cache import align_timestamp, period_start
+
+logger = get_logger(__name__)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._\-^=]")
+
+
+class MarketDataProvider(ABC):
+    """
+    Interface for price, fundamentals and news sources.
+
+    ``download`` mirrors ``yf.download`` and ``ticker`` returns a handle
+    exposing the ``yf.Ticker`` attributes the app reads (info, balance_sheet,
+    financials, cashflow, news).
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def download(
+        self,
+        tickers: Union[str, List[str]],
+        interval: str = "1d",
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        group_by: str = "column",
+        threads: Union[bool, int] = True,
+    ) -> pd.DataFrame:
+        """Download OHLCV bars for one ticker (flat columns) or several."""
+
+    @abstractmethod
+    def ticker(self, symbol: str) -> Any:
+        """Return a handle for fundamentals and news of one ticker."""
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Live Yahoo Finance data via yfinance, sharing one HTTP session."""
+
+    name = "yfinance"
+
+    def __init__(self) -> None:
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the HTTP session shared by every ticker handle."""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def download(
+        self,
+        tickers: Union[str, List[str]],
+        interval: str = "1d",
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        group_by: str = "column",
+        threads: Union[bool, int] = True,
+    ) -> pd.DataFrame:
+        kwargs: Dict[str, Any] = {"start": start, "end": end} if period is None else {
+            "period": period
+        }
+        return yf.download(
+            tickers,
+            interval=interval,
+            group_by=group_by,
+            threads=threads,
+            progress=False,
+            show_errors=False,
+            **kwargs,
+        )
+
+    def ticker(self, symbol: str) -> Any:
+        return yf.Ticker(symbol, session=self.session)
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serve recorded fixtures from a directory, optionally with added latency.
+
+    Layout (as written by record_fixtures)::
+
+        <root>/prices/<interval>/<TICKER>.parquet
+        <root>/info/<TICKER>.json
+        <root>/news/<TICKER>.json
+        <root>/financials/<TICKER>/<statement>.parquet
+
+    Periods are measured back from the last recorded bar rather than the
+    wall clock, so a fixture set replays identically on every run. Missing
+    fixtures behave like an unknown ticker on Yahoo Finance: an empty frame,
+    an empty dict or an empty list.
+
+    Example:
+        >>> set_provider(ReplayProvider("fixtures/market_data", latency_ms=50))
+        >>> df = get_stock_data("AAPL")  # served from disk after ~50 ms
+    """
+
+    name = "replay"
+
+    def __init__(self, root: str, latency_ms: float = 0.0):
+        self.root = os.path.expanduser(root)
+        self.latency_ms = latency_ms
+
+    def _sleep(self) -> None:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000.0)
+
+    def _price_path(self, symbol: str, interval: str) -> str:
+        return os.path.join(
+            self.root, "prices", _safe_name(interval), f"{_safe_name(symbol)}.parquet"
+        )
+
+    def _load_prices(
+        self,
+        symbol: str,
+        interval: str,
+        period: Optional[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+    ) -> pd.DataFrame:
+        path = self._price_path(symbol, interval)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+
+        df = pd.read_parquet(path)
+        if df.empty:
+            return df
+        if period is not None:
+            # Replay clock: periods end at the last recorded bar
+            last = df.index[-1]
+            start = period_start(period, now=last.tz_localize(None) if last.tz else last)
+        if start is not None:
+            df = df[df.index >= align_timestamp(pd.Timestamp(start), df.index)]
+        if end is not None:
+            df = df[df.index < align_timestamp(pd.Timestamp(end), df.index)]
+        return df
+
+    def download(
+        self,
+        tickers: Union[str, List[str]],
+        interval: str = "1d",
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        group_by: str = "column",
+        threads: Union[bool, int] = True,
+    ) -> pd.DataFrame:
+        self._sleep()
+        if isinstance(tickers, str):
+            return self._load_prices(tickers.upper(), interval, period, start, end)
+
+        frames = {}
+        for symbol in tickers:
+            df = self._load_prices(symbol.upper(), interval, period, start, end)
+            if not df.empty:
+                frames[symbol.upper()] = df
+        if not frames:
+            return pd.DataFrame()
+
+        panel = pd.concat(frames, axis=1)
+        if group_by != "ticker":
+            panel = panel.swaplevel(axis=1).sort_index(axis=1)
+        return panel
+
+    def ticker(self, symbol: str) -> "ReplayTicker":
+        return ReplayTicker(self, symbol.upper())
+
+
+class ReplayTicker:
+    """``yf.Ticker`` look-alike backed by ReplayProvider fixtures."""
+
+    def __init__(self, provider: ReplayProvider, symbol: str):
+        self._provider = provider
+        self.ticker = symbol
+
+    def _read_json(self, kind: str, default: Any) -> Any:
+        self._provider._sleep()
+        path = os.path.join(self._provider.root, kind, f"{_safe_name(self.ticker)}.json")
+        if not os.path.exists(path):
+            return default
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _read_statement(self, statement: str) -> pd.DataFrame:
+        self._provider._sleep()
+        path = os.path.join(
+            self._provider.root, "financials", _safe_name(self.ticker), f"{statement}.parquet"
+        )
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+    @property
+    def info(self) -> dict:
+        return self._read_json("info", {})
+
+    @property
+    def news(self) -> list:
+        return self._read_json("news", [])
+
+    @property
+    def balance_sheet(self) -> pd.DataFrame:
+        return self._read_statement("balance_sheet")
+
+    @property
+    def financials(self) -> pd.DataFrame:
+        return self._read_statement("income_stmt")
+
+    @property
+    def cashflow(self) -> pd.DataFrame:
+        return self._read_statement("cashflow")
+
+
+def record_fixtures(
+    tickers: List[str],
+    root: str,
+    period: str = "1y",
+    interval: str = "1d",
+    source: Optional[MarketDataProvider] = None,
+) -> None:
+    """
+    Record prices, fundamentals and news from a provider for later replay.
+
+    Args:
+        tickers: Stock ticker symbols to record
+        root: Fixture directory (ReplayProvider layout)
+        period: Price history period to record
+        interval: Price interval to record
+        source: Provider to record from (defaults to YFinanceProvider)
+
+    Example:
+        >>> record_fixtures(["AAPL", "MSFT"], "fixtures/market_data", period="5y")
+    """
+    source = source or YFinanceProvider()
+    for symbol in tickers:
+        symbol = symbol.strip().upper()
+        logger.info(f"Recording fixtures for {symbol}")
+
+        prices = source.download(symbol, interval=interval, period=period)
+        if isinstance(prices.columns, pd.MultiIndex):
+            prices = prices.copy()
+            prices.columns = prices.columns.get_level_values(0)
+        price_path = ReplayProvider(root)._price_path(symbol, interval)
+        os.makedirs(os.path.dirname(price_path), exist_ok=True)
+        prices.to_parquet(price_path)
+
+        handle = source.ticker(symbol)
+        for kind, payload in (("info", handle.info), ("news", handle.news)):
+            path = os.path.join(root, kind, f"{_safe_name(symbol)}.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, default=str)
+
+        statements = {
+            "balance_sheet": handle.balance_sheet,
+            "income_stmt": handle.financials,
+            "cashflow": handle.cashflow,
+        }
+        statement_dir = os.path.join(root, "financials", _safe_name(symbol))
+        os.makedirs(statement_dir, exist_ok=True)
+        for statement, frame in statements.items():
+            frame = frame.copy()
+            frame.columns = [str(col) for col in frame.columns]
+            frame.to_parquet(os.path.join(statement_dir, f"{statement}.parquet"))
+
+
+def _safe_name(value: str) -> str:
+    return _UNSAFE_CHARS.sub("_", value)
+
+
+_provider_override: Optional[MarketDataProvider] = None
+_configured: Dict[tuple, MarketDataProvider] = {}
+
+
+def set_provider(provider: Optional[MarketDataProvider]) -> None:
+    """
+    Install a provider for the whole process, or None to restore the configured one.
+
+    Args:
+        provider: Provider instance, or None
+    """
+    global _provider_override
+    _provider_override = provider
+
+
+def get_provider() -> MarketDataProvider:
+    """
+    Return the active market data provider.
+
+    Returns:
+        The provider installed with set_provider(), otherwise the one selected
+        by MARKET_DATA["PROVIDER"]
+
+    Raises:
+        ConfigurationError: If the configured provider name is unknown
+    """
+    if _provider_override is not None:
+        return _provider_override
+
+    key = (MARKET_DATA["PROVIDER"], MARKET_DATA["REPLAY_DIR"], MARKET_DATA["REPLAY_LATENCY_MS"])
+    if key not in _configured:
+        name = MARKET_DATA["PROVIDER"].lower()
+        if name == "yfinance":
+            _configured[key] = YFinanceProvider()
+        elif name == "replay":
+            _configured[key] = ReplayProvider(
+                MARKET_DATA["REPLAY_DIR"], MARKET_DATA["REPLAY_LATENCY_MS"]
+            )
+        else:
+            raise ConfigurationError(f"Unknown market data provider: '{name}'")
+        logger.info(f"Using market data provider: {name}")
+    return _configured[key]
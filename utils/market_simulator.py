@@ -0,0 +1,279 @@
+"""
+Large-universe synthetic market simulator with correlated assets.
+
+utils.data_generator draws independent moves for a handful of symbols.
+MarketSimulator produces N correlated assets at daily or intraday
+resolution, for offline benchmarks of the indicator engine, the forecaster
+and the screeners:
+
+- Returns follow a factor model (a market factor plus sector-like factors
+  and idiosyncratic noise), or the Cholesky factor of a given covariance
+- Bars are generated in time chunks, carrying the last price forward, so
+  memory stays bounded by ``chunk_bars x assets``
+- to_parquet streams the chunks into one Parquet file (one row group per
+  chunk), so multi-GB datasets never have to fit in memory
+
+Example:
+    >>> sim = MarketSimulator(n_assets=5000, interval="1d", seed=7)
+    >>> sim.to_parquet("data/sim_5000x10y.parquet", bars=2520)
+    >>> panel = read_simulated_panel("data/sim_5000x10y.parquet", tickers=["SIM00001"])
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.config import MARKET_SIMULATOR
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Regular US session: 09:30-16:00, 390 minutes
+_SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+_SESSION_MINUTES = 390
+_BAR_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60}
+
+PANEL_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class MarketSimulator:
+    """
+    Simulate OHLCV bars for many correlated assets, chunk by chunk.
+
+    Args:
+        n_assets: Number of assets (named SIM00000, SIM00001, ...)
+        interval: '1d' or an intraday interval ('1m', '5m', '15m', '30m', '1h')
+        seed: Seed for reproducibility (None for random); global random
+            state is never touched
+        n_factors: Common factors; factor 0 is the market (default from config)
+        covariance: Optional (n_assets x n_assets) annualized covariance of
+            log returns; replaces the factor model via its Cholesky factor
+        start: First trading day (default config MARKET_SIMULATOR["START"])
+        symbols: Asset names (default SIM00000, SIM00001, ...)
+
+    Raises:
+        ValueError: If the interval is unsupported or the covariance is not
+            positive definite or does not match n_assets
+    """
+
+    def __init__(
+        self,
+        n_assets: int,
+        interval: str = "1d",
+        seed: Optional[int] = None,
+        n_factors: Optional[int] = None,
+        covariance: Optional[np.ndarray] = None,
+        start: Optional[str] = None,
+        symbols: Optional[Sequence[str]] = None,
+    ):
+        if interval != "1d" and interval not in _BAR_MINUTES:
+            raise ValueError(
+                f"Unsupported interval '{interval}'. Use '1d' or one of {list(_BAR_MINUTES)}"
+            )
+        self.n_assets = n_assets
+        self.interval = interval
+        self.symbols = list(symbols) if symbols is not None else [f"SIM{i:05d}" for i in range(n_assets)]
+        if len(self.symbols) != n_assets:
+            raise ValueError(f"Expected {n_assets} symbols, got {len(self.symbols)}")
+        self.start = pd.Timestamp(start or MARKET_SIMULATOR["START"])
+        self._first_day = self.start.normalize().to_datetime64().astype("datetime64[D]")
+        self.bars_per_day = 1 if interval == "1d" else _SESSION_MINUTES // _BAR_MINUTES[interval]
+        bars_per_year = 252 * self.bars_per_day
+
+        self._rng = np.random.default_rng(seed)
+        rng = self._rng
+        low, high = MARKET_SIMULATOR["ANNUAL_DRIFT_RANGE"]
+        drift = rng.uniform(low, high, n_assets)
+
+        if covariance is not None:
+            covariance = np.asarray(covariance, dtype=np.float64)
+            if covariance.shape != (n_assets, n_assets):
+                raise ValueError(f"Covariance must be {n_assets}x{n_assets}, got {covariance.shape}")
+            try:
+                self._cholesky = np.linalg.cholesky(covariance / bars_per_year)
+            except np.linalg.LinAlgError as e:
+                raise ValueError("Covariance matrix must be positive definite") from e
+            self._loadings = self._factor_vol = self._idio_vol = None
+            variance = np.diag(covariance)
+        else:
+            n_factors = MARKET_SIMULATOR["FACTORS"] if n_factors is None else n_factors
+            # Everyone loads on the market; sector-like factors load sparsely
+            loadings = rng.normal(0.0, 0.6, (n_assets, n_factors))
+            loadings[:, 0] = rng.normal(1.0, 0.3, n_assets)
+            factor_vol = np.full(n_factors, MARKET_SIMULATOR["FACTOR_VOL"])
+            factor_vol[0] = MARKET_SIMULATOR["MARKET_VOL"]
+            low, high = MARKET_SIMULATOR["IDIO_VOL_RANGE"]
+            idio_vol = rng.uniform(low, high, n_assets)
+
+            scale = np.sqrt(bars_per_year)
+            self._cholesky = None
+            self._loadings = loadings
+            self._factor_vol = factor_vol / scale
+            self._idio_vol = idio_vol / scale
+            variance = (loadings**2) @ (factor_vol**2) + idio_vol**2
+
+        self.annual_vol = np.sqrt(variance)
+        bar_vol = self.annual_vol / np.sqrt(bars_per_year)
+        # Ito correction keeps the expected simple return at the drift
+        self._bar_drift = drift / bars_per_year - 0.5 * bar_vol**2
+        self._bar_vol = bar_vol
+        self._log_price = np.log(rng.uniform(10, 500, n_assets))
+        self._base_volume = np.exp(rng.normal(np.log(2e6), 1.0, n_assets)) / self.bars_per_day
+        self._bars_done = 0
+
+    def correlation(self) -> np.ndarray:
+        """Correlation matrix of bar log returns implied by the model."""
+        if self._cholesky is not None:
+            cov = self._cholesky @ self._cholesky.T
+        else:
+            cov = (self._loadings * self._factor_vol**2) @ self._loadings.T
+            cov[np.diag_indices_from(cov)] += self._idio_vol**2
+        std = np.sqrt(np.diag(cov))
+        return cov / np.outer(std, std)
+
+    def _log_returns(self, bars: int) -> np.ndarray:
+        rng = self._rng
+        if self._cholesky is not None:
+            shocks = rng.standard_normal((bars, self.n_assets)) @ self._cholesky.T
+        else:
+            factors = rng.standard_normal((bars, len(self._factor_vol))) * self._factor_vol
+            shocks = factors @ self._loadings.T
+            shocks += rng.standard_normal((bars, self.n_assets)) * self._idio_vol
+        shocks += self._bar_drift
+        return shocks
+
+    def _timestamps(self, first: int, bars: int) -> pd.DatetimeIndex:
+        """Timestamps of bars ``first .. first + bars - 1`` counted from the start."""
+        positions = np.arange(first, first + bars)
+        day, slot = np.divmod(positions, self.bars_per_day)
+        # Business days (Mon-Fri, like pd.bdate_range) for this chunk only
+        days = pd.DatetimeIndex(
+            np.busday_offset(self._first_day, day, roll="forward").astype("datetime64[ns]")
+        )
+        if self.interval == "1d":
+            return days
+        step = pd.Timedelta(minutes=_BAR_MINUTES[self.interval])
+        return days + _SESSION_OPEN + slot * step
+
+    def next_chunk(self, bars: int) -> Dict[str, np.ndarray]:
+        """
+        Simulate the next ``bars`` bars for every asset.
+
+        Returns:
+            Dict with a ``Date`` index plus Open, High, Low, Close and Volume
+            arrays shaped (bars x assets)
+        """
+        rng = self._rng
+        returns = self._log_returns(bars)
+        log_close = np.cumsum(returns, axis=0)
+        log_close += self._log_price
+        log_open = np.empty_like(log_close)
+        log_open[0] = self._log_price
+        log_open[1:] = log_close[:-1]
+        # Small open gaps so Open is not always the previous Close
+        log_open += rng.normal(0.0, 0.1, log_close.shape) * self._bar_vol
+
+        close = np.exp(log_close)
+        open_ = np.exp(log_open)
+        wick = np.abs(rng.normal(0.0, 0.5, (2,) + log_close.shape)) * self._bar_vol
+        high = np.maximum(open_, close) * np.exp(wick[0])
+        low = np.minimum(open_, close) * np.exp(-wick[1])
+        # Volume rises with the size of the move
+        activity = 1.0 + 2.0 * np.abs(returns) / self._bar_vol
+        volume = self._base_volume * activity * rng.lognormal(0.0, 0.3, log_close.shape)
+
+        self._log_price = log_close[-1].copy()
+        first = self._bars_done
+        self._bars_done += bars
+        return {
+            "Date": self._timestamps(first, bars),
+            "Open": open_.astype(np.float32),
+            "High": high.astype(np.float32),
+            "Low": low.astype(np.float32),
+            "Close": close.astype(np.float32),
+            "Volume": volume.astype(np.int64),
+        }
+
+    def chunks(self, bars: int, chunk_bars: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield ``bars`` bars as long-format frames of at most ``chunk_bars`` bars each.
+
+        Args:
+            bars: Total bars per asset
+            chunk_bars: Bars per chunk (default MARKET_SIMULATOR["CHUNK_BARS"])
+
+        Yields:
+            DataFrames with Ticker, Date, Open, High, Low, Close and Volume
+            columns, ordered by date then ticker
+        """
+        chunk_bars = chunk_bars or MARKET_SIMULATOR["CHUNK_BARS"]
+        tickers = pd.Categorical(self.symbols)
+        for done in range(0, bars, chunk_bars):
+            arrays = self.next_chunk(min(chunk_bars, bars - done))
+            count = len(arrays["Date"])
+            frame = {
+                "Ticker": pd.Categorical.from_codes(
+                    np.tile(tickers.codes, count), categories=tickers.categories
+                ),
+                "Date": np.repeat(arrays["Date"].to_numpy(), self.n_assets),
+            }
+            frame.update((name, arrays[name].ravel()) for name in PANEL_FIELDS)
+            yield pd.DataFrame(frame)
+
+    def to_parquet(self, path: str, bars: int, chunk_bars: Optional[int] = None) -> int:
+        """
+        Stream ``bars`` bars per asset into a single Parquet file.
+
+        Each chunk becomes one row group, so peak memory is one chunk.
+
+        Args:
+            path: Output file path
+            bars: Total bars per asset
+            chunk_bars: Bars per chunk/row group (default from config)
+
+        Returns:
+            Number of rows written
+        """
+        rows = 0
+        writer = None
+        try:
+            for chunk in self.chunks(bars, chunk_bars):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    # Random prices do not dictionary-encode well; only tickers repeat
+                    writer = pq.ParquetWriter(
+                        path, table.schema, compression="zstd", use_dictionary=["Ticker"]
+                    )
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        logger.info(f"Wrote {rows} simulated bars ({self.n_assets} assets, {self.interval}) to {path}")
+        return rows
+
+
+def read_simulated_panel(
+    path: str, tickers: Optional[List[str]] = None, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load (part of) a simulated dataset as a (Ticker, Date) panel.
+
+    Args:
+        path: File written by MarketSimulator.to_parquet
+        tickers: Only load these tickers. Every row group holds all tickers
+            (one per time chunk), so each group is read and then filtered
+        columns: Only load these fields (default all of PANEL_FIELDS)
+
+    Returns:
+        DataFrame indexed by (Ticker, Date), the layout accepted by
+        compute_panel_indicators
+    """
+    fields = list(columns or PANEL_FIELDS)
+    filters = [("Ticker", "in", list(tickers))] if tickers else None
+    df = pd.read_parquet(path, columns=["Ticker", "Date"] + fields, filters=filters)
+    df["Ticker"] = df["Ticker"].astype(str)
+    return df.set_index(["Ticker", "Date"]).sort_index()
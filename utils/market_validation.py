@@ -0,0 +1,224 @@
+"""
+Vectorized OHLCV validation with a structured report.
+
+validate_ohlcv checks every OHLC/volume invariant in one pass over the
+price block and reports, per rule, how many rows fail and which ones,
+instead of stopping at the first failure. StreamingValidator applies it
+chunk by chunk (e.g., to MarketSimulator.chunks or an ingest loop),
+carrying row offsets and the last timestamp across chunks.
+
+Example:
+    >>> report = validate_ohlcv(prices)
+    >>> report.ok, report.counts["high_below_other"]
+    (False, 3)
+    >>> report.violations["high_below_other"]  # row positions
+    array([ 17, 240, 241])
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
+
+# Rule -> error message, in the order validate_market_data reports them
+RULES = {
+    "high_below_other": "High price must be >= all other prices",
+    "low_above_other": "Low price must be <= all other prices",
+    "non_positive_price": "Prices must be positive",
+    "negative_volume": "Volume must be non-negative",
+    "missing_price": "Prices must not be missing",
+    "unordered_timestamp": "Timestamps must be strictly increasing",
+}
+
+# Rules validate_market_data has always enforced (NaN prices and unordered
+# or repeated dates, e.g., long-format multi-ticker frames, pass it)
+LEGACY_RULES = ["high_below_other", "low_above_other", "non_positive_price", "negative_volume"]
+
+# Offending row positions kept per rule (counts are always exact)
+MAX_REPORTED_ROWS = 1000
+
+
+class ValidationReport:
+    """Per-rule failure counts and offending row positions."""
+
+    def __init__(
+        self,
+        rows: int = 0,
+        counts: Optional[Dict[str, int]] = None,
+        violations: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        self.rows = rows
+        self.counts = {rule: 0 for rule in RULES}
+        self.counts.update(counts or {})
+        self.violations = {rule: np.empty(0, dtype=np.int64) for rule in RULES}
+        self.violations.update(violations or {})
+
+    @property
+    def ok(self) -> bool:
+        """True if no rule failed."""
+        return not any(self.counts.values())
+
+    def merge(self, other: "ValidationReport", max_rows: int = MAX_REPORTED_ROWS) -> "ValidationReport":
+        """Return the combined report of two consecutive blocks."""
+        return ValidationReport(
+            self.rows + other.rows,
+            {rule: self.counts[rule] + other.counts[rule] for rule in RULES},
+            {
+                rule: np.concatenate([self.violations[rule], other.violations[rule]])[:max_rows]
+                for rule in RULES
+            },
+        )
+
+    def raise_if_invalid(self, rules: Optional[Iterable[str]] = None) -> None:
+        """
+        Raise for the first failing rule, like validate_market_data.
+
+        Args:
+            rules: Rules to enforce (default: all of RULES)
+
+        Raises:
+            ValueError: If any enforced rule failed
+        """
+        enforced = set(RULES if rules is None else rules)
+        for rule, message in RULES.items():
+            if rule in enforced and self.counts[rule]:
+                raise ValueError(f"{message} ({self.counts[rule]} rows, first at row "
+                                 f"{self.violations[rule][0]})")
+
+    def summary(self) -> pd.DataFrame:
+        """One row per rule with its failure count and first offending rows."""
+        return pd.DataFrame(
+            {
+                "rule": list(RULES),
+                "failures": [self.counts[rule] for rule in RULES],
+                "first_rows": [self.violations[rule][:5].tolist() for rule in RULES],
+            }
+        ).set_index("rule")
+
+    def __repr__(self) -> str:
+        failing = {rule: count for rule, count in self.counts.items() if count}
+        return f"ValidationReport(rows={self.rows}, failures={failing or 'none'})"
+
+
+def validate_ohlcv(
+    df: pd.DataFrame,
+    offset: int = 0,
+    previous_timestamp=None,
+    max_rows: int = MAX_REPORTED_ROWS,
+    check_order: bool = True,
+) -> ValidationReport:
+    """
+    Check every OHLC/volume invariant in one vectorized pass.
+
+    The four price columns are read as one (rows x 4) block and all rule
+    masks are filled into a single (rows x rules) matrix, so the frame is
+    scanned once regardless of how many rules there are.
+
+    Args:
+        df: Frame with Open, High, Low, Close and (optionally) Volume
+            columns; timestamps come from a Date column or a DatetimeIndex
+        offset: Position of the first row in the whole dataset (for chunks)
+        previous_timestamp: Last timestamp of the previous chunk, if any
+        max_rows: Offending row positions kept per rule
+        check_order: Require strictly increasing timestamps (disable for
+            long-format frames holding several tickers per timestamp)
+
+    Returns:
+        ValidationReport with counts and row positions (offset applied)
+
+    Raises:
+        ValueError: If price columns are missing
+    """
+    missing = [col for col in OHLC_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    block = df[OHLC_COLUMNS].to_numpy(dtype=np.float64)
+    open_, high, low, close = block.T
+    n = len(block)
+    masks = np.zeros((n, len(RULES)), dtype=bool)
+
+    with np.errstate(invalid="ignore"):
+        np.less(high, np.maximum(np.maximum(open_, low), close), out=masks[:, 0])
+        np.greater(low, np.minimum(np.minimum(open_, high), close), out=masks[:, 1])
+        np.any(block <= 0, axis=1, out=masks[:, 2])
+        if "Volume" in df.columns:
+            np.less(df["Volume"].to_numpy(dtype=np.float64), 0, out=masks[:, 3])
+        np.any(np.isnan(block), axis=1, out=masks[:, 4])
+
+    timestamps = _timestamps(df) if check_order else None
+    if timestamps is not None and n:
+        previous = np.datetime64("NaT") if previous_timestamp is None else np.datetime64(
+            pd.Timestamp(previous_timestamp).tz_localize(None), "ns"
+        )
+        prior = np.concatenate([[previous], timestamps[:-1]])
+        with np.errstate(invalid="ignore"):
+            masks[:, 5] = timestamps <= prior
+
+    counts = masks.sum(axis=0)
+    violations = {}
+    for i, rule in enumerate(RULES):
+        if counts[i]:
+            violations[rule] = np.flatnonzero(masks[:, i])[:max_rows] + offset
+    return ValidationReport(n, dict(zip(RULES, counts.tolist())), violations)
+
+
+def _timestamps(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """Naive datetime64[ns] timestamps of the rows, if the frame has any."""
+    if "Date" in df.columns:
+        values = pd.DatetimeIndex(df["Date"])
+    elif isinstance(df.index, pd.DatetimeIndex):
+        values = df.index
+    else:
+        return None
+    if values.tz is not None:
+        values = values.tz_localize(None)
+    return values.to_numpy(dtype="datetime64[ns]")
+
+
+class StreamingValidator:
+    """
+    Validate a dataset chunk by chunk with bounded memory.
+
+    Args:
+        max_rows: Offending row positions kept per rule
+        check_order: Require strictly increasing timestamps across chunks;
+            disable for long-format chunks such as MarketSimulator.chunks
+
+    Example:
+        >>> validator = StreamingValidator(check_order=False)
+        >>> for chunk in sim.chunks(bars=2520):
+        ...     validator.update(chunk)
+        >>> validator.report.ok
+    """
+
+    def __init__(self, max_rows: int = MAX_REPORTED_ROWS, check_order: bool = True):
+        self.max_rows = max_rows
+        self.check_order = check_order
+        self.report = ValidationReport()
+        self._last_timestamp = None
+
+    def update(self, chunk: pd.DataFrame) -> ValidationReport:
+        """
+        Validate the next chunk and fold it into the running report.
+
+        Returns:
+            Report for this chunk alone
+        """
+        report = validate_ohlcv(
+            chunk, self.report.rows, self._last_timestamp, self.max_rows, self.check_order
+        )
+        if self.check_order and len(chunk):
+            timestamps = _timestamps(chunk)
+            if timestamps is not None:
+                self._last_timestamp = timestamps[-1]
+        self.report = self.report.merge(report, self.max_rows)
+        return report
+
+    def validate(self, chunks: Iterable[pd.DataFrame]) -> ValidationReport:
+        """Validate every chunk of an iterable and return the combined report."""
+        for chunk in chunks:
+            self.update(chunk)
+        return self.report
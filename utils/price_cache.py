@@ -0,0 +1,308 @@
+"""
+Persistent on-disk cache for OHLCV price history.
+
+Stores one Parquet file per (ticker, interval). How much history the file
+covers and when it was last refreshed live in the file's schema metadata,
+so data and metadata are replaced together by one atomic rename and
+readers never see a mismatched pair. Read-modify-write updates (merge)
+hold a per-key file lock, so every worker process on a host can share the
+same cache directory.
+"""
+
+import contextlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: locks are per process only
+    fcntl = None
+
+from utils.config import PRICE_CACHE
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Offsets for the yfinance period strings used across the app
+_PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._\-^=]")
+
+# Schema metadata key holding the coverage metadata
+_META_KEY = b"price_cache"
+
+
+def period_start(period: str, now: Optional[pd.Timestamp] = None) -> Optional[pd.Timestamp]:
+    """
+    Convert a yfinance period string into the first timestamp it covers.
+
+    Args:
+        period: Period string (e.g., '1mo', '1y', 'ytd', 'max')
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Start timestamp (tz-naive, normalized to midnight), or None for 'max'
+
+    Raises:
+        ValueError: If the period string is not recognised
+    """
+    now = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=now.year, month=1, day=1)
+    if period not in _PERIOD_OFFSETS:
+        raise ValueError(f"Unsupported period: '{period}'")
+    return (now - _PERIOD_OFFSETS[period]).normalize()
+
+
+def align_timestamp(ts: pd.Timestamp, index: pd.Index) -> pd.Timestamp:
+    """Localize or strip a timestamp's timezone so it compares against an index."""
+    index_tz = getattr(index, "tz", None)
+    if index_tz is not None and ts.tz is None:
+        return ts.tz_localize(index_tz)
+    if index_tz is None and ts.tz is not None:
+        return ts.tz_convert(None)
+    return ts
+
+
+def slice_from(df: pd.DataFrame, start: Optional[pd.Timestamp]) -> pd.DataFrame:
+    """Return the rows of a timestamp-indexed frame on or after ``start``."""
+    if start is None:
+        return df
+    return df[df.index >= align_timestamp(start, df.index)]
+
+
+class CacheEntry(NamedTuple):
+    """A cached price frame together with its coverage metadata."""
+
+    frame: pd.DataFrame
+    covered_start: Optional[pd.Timestamp]  # None means full history ('max')
+    fetched_at: float
+
+    def covers(self, start: Optional[pd.Timestamp]) -> bool:
+        """Return True if the cached history reaches back to ``start``."""
+        if self.covered_start is None:
+            return True
+        if start is None:
+            return False
+        return self.covered_start <= start
+
+    def is_fresh(self, max_age_seconds: float) -> bool:
+        """Return True if the entry was refreshed within ``max_age_seconds``."""
+        return (time.time() - self.fetched_at) <= max_age_seconds
+
+    def slice(self, start: Optional[pd.Timestamp]) -> pd.DataFrame:
+        """Return the cached rows on or after ``start``."""
+        return slice_from(self.frame, start)
+
+
+class PriceCache:
+    """
+    Parquet-backed price store rooted at a directory.
+
+    Layout::
+
+        <root>/<interval>/<TICKER>.parquet   OHLCV rows indexed by timestamp,
+                                             coverage in the schema metadata
+        <root>/<interval>/<TICKER>.lock      lock file for merge()
+
+    Example:
+        >>> cache = PriceCache("/tmp/prices")
+        >>> cache.write("AAPL", "1d", df, covered_start=period_start("1y"))
+        >>> entry = cache.read("AAPL", "1d")
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.expanduser(root)
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._thread_locks_guard = threading.Lock()
+
+    def _paths(self, ticker: str, interval: str) -> Tuple[str, str]:
+        directory = os.path.join(self.root, _UNSAFE_CHARS.sub("_", interval))
+        name = _UNSAFE_CHARS.sub("_", ticker.upper())
+        return (
+            os.path.join(directory, f"{name}.parquet"),
+            os.path.join(directory, f"{name}.lock"),
+        )
+
+    @contextlib.contextmanager
+    def lock(self, ticker: str, interval: str) -> Iterator[None]:
+        """
+        Hold the exclusive lock for one (ticker, interval) entry.
+
+        Serializes threads in this process and, where fcntl is available,
+        other processes sharing the cache directory.
+        """
+        data_path, lock_path = self._paths(ticker, interval)
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks.setdefault(lock_path, threading.Lock())
+        with thread_lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+            with open(lock_path, "a") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def read(self, ticker: str, interval: str) -> Optional[CacheEntry]:
+        """
+        Load the cached history for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            interval: Data interval (e.g., '1d')
+
+        Returns:
+            CacheEntry, or None if nothing usable is stored
+        """
+        data_path, _ = self._paths(ticker, interval)
+        if not os.path.exists(data_path):
+            return None
+
+        try:
+            table = pq.read_table(data_path)
+            raw_meta = (table.schema.metadata or {}).get(_META_KEY)
+            if raw_meta is None:
+                raise ValueError("missing coverage metadata")
+            meta = json.loads(raw_meta)
+            frame = table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable price cache for {ticker}/{interval}: {e}")
+            return None
+
+        covered_start = meta.get("covered_start")
+        return CacheEntry(
+            frame=frame,
+            covered_start=pd.Timestamp(covered_start) if covered_start else None,
+            fetched_at=float(meta.get("fetched_at", 0.0)),
+        )
+
+    def write(
+        self,
+        ticker: str,
+        interval: str,
+        df: pd.DataFrame,
+        covered_start: Optional[pd.Timestamp],
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """
+        Atomically replace the cached history for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            interval: Data interval
+            df: OHLCV frame indexed by timestamp
+            covered_start: Earliest start the frame satisfies (None for 'max')
+            fetched_at: Refresh time as a UNIX timestamp (defaults to now)
+        """
+        data_path, _ = self._paths(ticker, interval)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        meta = {
+            "covered_start": covered_start.isoformat() if covered_start is not None else None,
+            "fetched_at": time.time() if fetched_at is None else fetched_at,
+            "rows": len(df),
+        }
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), _META_KEY: json.dumps(meta).encode()}
+        )
+        _atomic_write(data_path, lambda path: pq.write_table(table, path))
+
+    def merge(
+        self,
+        ticker: str,
+        interval: str,
+        df: pd.DataFrame,
+        covered_start: Optional[pd.Timestamp],
+    ) -> pd.DataFrame:
+        """
+        Merge freshly downloaded rows into the cached history and persist it.
+
+        Newer rows win when timestamps overlap, and the recorded coverage is
+        widened to the earlier of the existing and new starts. The read,
+        merge and write run under the entry's lock, so concurrent merges of
+        the same ticker keep each other's rows.
+
+        Returns:
+            The merged frame that was written
+        """
+        with self.lock(ticker, interval):
+            existing = self.read(ticker, interval)
+            if existing is not None and not existing.frame.empty:
+                merged = pd.concat([existing.frame, df])
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                if existing.covered_start is None or covered_start is None:
+                    covered_start = None
+                else:
+                    covered_start = min(existing.covered_start, covered_start)
+            else:
+                merged = df.sort_index()
+
+            self.write(ticker, interval, merged, covered_start)
+        return merged
+
+    def clear(self) -> None:
+        """Delete every cached file under the cache root."""
+        if not os.path.isdir(self.root):
+            return
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                # .json: sidecars written by earlier versions of the cache
+                if name.endswith((".parquet", ".json", ".lock")):
+                    os.remove(os.path.join(directory, name))
+
+
+def _atomic_write(path: str, writer: Callable[[str], None]) -> None:
+    """Write via a temporary file in the same directory, then rename over ``path``."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_caches: Dict[str, PriceCache] = {}
+
+
+def get_price_cache() -> Optional[PriceCache]:
+    """
+    Return the shared price cache for the configured directory.
+
+    Returns:
+        PriceCache instance, or None when the cache is disabled
+    """
+    if not PRICE_CACHE["ENABLED"]:
+        return None
+    root = PRICE_CACHE["DIR"]
+    if root not in _caches:
+        _caches[root] = PriceCache(root)
+    return _caches[root]
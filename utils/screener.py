@@ -0,0 +1,214 @@
+"""
+Universe technical screener built on the Market Pulse trend rules.
+
+market_pulse._predict_trend scores one ticker from its latest RSI, MACD and
+signal values. trend_scores applies exactly the same rules to whole arrays,
+and score_panel runs them over a (dates x tickers) close matrix, so a
+watchlist or index is screened with one batched download, one panel
+indicator pass and a handful of NumPy comparisons:
+
+- Trend and confidence: the Market Pulse RSI/MACD vote
+- RSI regime: Overbought (>70), Oversold (<30), Bullish (>50) or Bearish
+- MACD cross: a fresh cross of the signal line within CROSS_LOOKBACK bars,
+  otherwise whether MACD sits above or below it
+
+Example:
+    >>> table = scan_universe(["AAPL", "MSFT", "NVDA"])
+    >>> table[table["Trend"] == "Bullish"].head()
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import SCREENER
+from utils.data_loader import get_stock_data_batch
+from utils.indicators import compact_columns, panel_indicators
+from utils.logger import get_logger
+from utils.ticker_universe import get_ticker_universe
+
+logger = get_logger(__name__)
+
+SCAN_INDICATORS = ["RSI", "MACD", "Signal"]
+SCAN_COLUMNS = [
+    "Name",
+    "Sector",
+    "Close",
+    "Change %",
+    "RSI",
+    "MACD",
+    "Signal",
+    "Trend",
+    "Confidence",
+    "Score",
+    "RSI Regime",
+    "MACD Cross",
+]
+
+
+def trend_votes(rsi, macd, signal) -> np.ndarray:
+    """
+    Averaged RSI/MACD vote of market_pulse._predict_trend, in [-1, 1].
+
+    Above 0.3 is Bullish and below -0.3 Bearish (see trend_scores).
+    """
+    rsi = np.asarray(rsi, dtype=np.float64)
+    diff = np.asarray(macd, dtype=np.float64) - np.asarray(signal, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        rsi_vote = np.select([rsi > 70, rsi < 30, rsi > 50], [-1.0, 1.0, 0.5], default=-0.5)
+        macd_vote = np.select([diff > 1, diff > 0, diff < -1], [1.0, 0.5, -1.0], default=-0.5)
+    return (rsi_vote + macd_vote) / 2
+
+
+def trend_scores(rsi, macd, signal) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized market_pulse._predict_trend.
+
+    Args:
+        rsi: Array of latest RSI values
+        macd: Array of latest MACD values
+        signal: Array of latest signal-line values
+
+    Returns:
+        Tuple of (trend, confidence, score) arrays: "Bullish"/"Bearish"/
+        "Neutral", 0-100 confidence, and the averaged RSI/MACD vote in [-1, 1]
+    """
+    score = trend_votes(rsi, macd, signal)
+    trend = np.select([score > 0.3, score < -0.3], ["Bullish", "Bearish"], default="Neutral")
+    confidence = np.where(trend == "Neutral", 50.0, np.minimum(np.abs(score) * 100, 100))
+    return trend, confidence, score
+
+
+def rsi_regimes(rsi) -> np.ndarray:
+    """Overbought (>70), Oversold (<30), Bullish (>50) or Bearish, per value."""
+    rsi = np.asarray(rsi, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [rsi > 70, rsi < 30, rsi > 50], ["Overbought", "Oversold", "Bullish"], default="Bearish"
+        )
+
+
+def macd_cross_status(
+    macd: np.ndarray, signal: np.ndarray, lookback: Optional[int] = None
+) -> np.ndarray:
+    """
+    MACD/signal cross status from the last ``lookback + 1`` rows of each column.
+
+    Args:
+        macd: (bars x tickers) MACD values, most recent row last
+        signal: Signal-line values shaped like ``macd``
+        lookback: Bars in which a cross counts as fresh (default
+            SCREENER["CROSS_LOOKBACK"])
+
+    Returns:
+        Per-ticker "Bullish cross", "Bearish cross", "Above signal" or "Below signal"
+    """
+    lookback = SCREENER["CROSS_LOOKBACK"] if lookback is None else lookback
+    diff = (macd - signal)[-(lookback + 1):]
+    valid = ~np.isnan(diff)
+    with np.errstate(invalid="ignore"):
+        above = diff > 0
+    now = above[-1]
+    # A fresh cross: the side changed between two defined bars inside the window
+    flips = (above[1:] != above[:-1]) & valid[1:] & valid[:-1]
+    changed = flips.any(axis=0)
+    return np.select(
+        [changed & now, changed & ~now, now],
+        ["Bullish cross", "Bearish cross", "Above signal"],
+        default="Below signal",
+    )
+
+
+def score_panel(closes: pd.DataFrame, lookback: Optional[int] = None) -> pd.DataFrame:
+    """
+    Screen a wide close frame with the Market Pulse trend rules.
+
+    Indicators run on each ticker's own bars (see compact_columns), so a
+    watchlist mixing trading calendars (stocks and 24/7 crypto, holidays,
+    halts) scores every ticker exactly as Market Pulse scores it alone.
+
+    Args:
+        closes: DataFrame of closing prices indexed by date, one column per ticker
+        lookback: Bars in which a MACD cross counts as fresh (default
+            SCREENER["CROSS_LOOKBACK"])
+
+    Returns:
+        DataFrame indexed by Ticker with SCAN_COLUMNS (Name and Sector from
+        the ticker universe), ranked most bullish first. Tickers without
+        enough history for RSI and MACD are left out
+    """
+    lookback = SCREENER["CROSS_LOOKBACK"] if lookback is None else lookback
+    if closes.size == 0:
+        return pd.DataFrame(columns=SCAN_COLUMNS).rename_axis("Ticker")
+    # Every column's latest bar lands in the last row
+    values, _ = compact_columns(closes.to_numpy(dtype=np.float64))
+    arrays = panel_indicators(values, SCAN_INDICATORS)
+
+    latest = {name: arrays[name][-1] for name in SCAN_INDICATORS}
+    close = values[-1]
+    previous = values[-2] if len(values) > 1 else np.full_like(close, np.nan)
+
+    trend, confidence, score = trend_scores(latest["RSI"], latest["MACD"], latest["Signal"])
+    cross = macd_cross_status(arrays["MACD"], arrays["Signal"], lookback)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        change = (close / previous - 1) * 100
+
+    universe = get_ticker_universe()
+    info = [universe.get(str(ticker)) for ticker in closes.columns]
+    table = pd.DataFrame(
+        {
+            "Name": [i.name if i else "" for i in info],
+            "Sector": [i.sector if i else "" for i in info],
+            "Close": close,
+            "Change %": change,
+            "RSI": latest["RSI"],
+            "MACD": latest["MACD"],
+            "Signal": latest["Signal"],
+            "Trend": trend,
+            "Confidence": confidence,
+            "Score": score,
+            "RSI Regime": rsi_regimes(latest["RSI"]),
+            "MACD Cross": cross,
+        },
+        index=pd.Index(closes.columns, name="Ticker"),
+    )
+
+    ready = ~np.isnan(close) & ~np.isnan(latest["RSI"]) & ~np.isnan(latest["Signal"])
+    if not ready.all():
+        skipped = list(closes.columns[~ready])
+        logger.info(f"Screener skipped {len(skipped)} tickers without enough history: {skipped[:10]}")
+    return table[ready].sort_values(["Score", "Confidence", "RSI"], ascending=[False, False, True])
+
+
+def scan_universe(
+    tickers: Optional[Sequence[str]] = None,
+    period: Optional[str] = None,
+    interval: str = "1d",
+) -> pd.DataFrame:
+    """
+    Load a watchlist in batch and rank it with score_panel.
+
+    Args:
+        tickers: Symbols to screen (default: universe symbols listed on
+            SCREENER["EXCHANGES"])
+        period: History to load (default SCREENER["PERIOD"])
+        interval: Bar interval
+
+    Returns:
+        Ranked screener table (see score_panel); empty if no data was found
+
+    Raises:
+        DataFetchError: If a grouped download fails with no cached fallback
+
+    Example:
+        >>> scan_universe(["AAPL", "MSFT", "NVDA", "AMD"]).head(3)
+    """
+    if tickers is None:
+        tickers = get_ticker_universe().symbols(SCREENER["EXCHANGES"])
+    frames = get_stock_data_batch(list(tickers), period=period or SCREENER["PERIOD"], interval=interval)
+    if not frames:
+        return score_panel(pd.DataFrame())
+    closes = pd.concat({ticker: df["Close"] for ticker, df in frames.items()}, axis=1)
+    logger.info(f"Screening {closes.shape[1]} tickers over {closes.shape[0]} bars")
+    return score_panel(closes)
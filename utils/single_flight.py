@@ -0,0 +1,124 @@
+"""
+Request coalescing for concurrent identical fetches.
+
+When several Streamlit sessions miss the cache for the same key at once,
+SingleFlight lets the first caller run the fetch while every other caller
+waits for and shares its result (or exception), so upstream sees one
+request per key instead of one per session.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Call:
+    """State of one in-flight call shared by its waiters."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time and share its outcome.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> df = flight.do(("AAPL", "1y", "1d"), fetch_prices, "AAPL")
+    """
+
+    def __init__(self, max_background_workers: int = 2):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._background: Dict[Hashable, Future] = {}
+        self._max_background_workers = max_background_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``fn(*args, **kwargs)`` unless a call for ``key`` is already running.
+
+        Args:
+            key: Identity of the request (e.g., (ticker, period, interval))
+            fn: Function performing the fetch
+
+        Returns:
+            The result of the single shared call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            logger.debug(f"Joining in-flight request for {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug(f"Shared result for {key} with {call.waiters} waiters")
+            call.done.set()
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Run ``fn`` in the background unless a background call for ``key`` is pending.
+
+        Used for stale-while-revalidate refreshes: callers return cached data
+        immediately and at most one refresh per key is queued.
+
+        Returns:
+            Future for the (possibly already pending) background call
+        """
+        with self._lock:
+            pending = self._background.get(key)
+            if pending is not None and not pending.done():
+                return pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_background_workers,
+                    thread_name_prefix="single-flight",
+                )
+            future = self._executor.submit(self.do, key, fn, *args, **kwargs)
+            self._background[key] = future
+
+        def _forget(done: Future) -> None:
+            with self._lock:
+                if self._background.get(key) is done:
+                    del self._background[key]
+            if done.exception() is not None:
+                logger.warning(f"Background refresh for {key} failed: {done.exception()}")
+
+        future.add_done_callback(_forget)
+        return future
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True if a foreground or background call for ``key`` is running."""
+        with self._lock:
+            pending = self._background.get(key)
+            return key in self._calls or (pending is not None and not pending.done())
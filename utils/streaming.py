@@ -0,0 +1,363 @@
+"""
+Intraday streaming bar ingestion.
+
+Keeps a rolling in-memory window of the latest bars per (ticker, interval)
+so near-real-time dashboards can rerun without re-downloading the whole
+intraday window. New bars come from a pluggable BarSource: a polling loop
+against the market data provider, or a replay of recorded bars.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import STREAMING
+from utils.incremental_indicators import IndicatorState
+from utils.logger import get_logger
+from utils.market_data import get_provider
+from utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+OHLCV_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+
+class BarRingBuffer:
+    """
+    Fixed-capacity ring buffer of OHLCV bars with zero-copy reads.
+
+    Every bar is written twice, at ``pos`` and ``pos + capacity`` of a
+    double-length array, so the latest ``n <= capacity`` bars always form one
+    contiguous slice and can be returned as a view without copying.
+
+    Views are read-only. A view of ``n`` bars stays unchanged for the next
+    ``capacity - n`` appended bars (only an in-place update of the forming
+    newest bar shows through), so a full-window read is returned as a copy.
+
+    Example:
+        >>> buffer = BarRingBuffer(capacity=390)
+        >>> buffer.extend(history_df)
+        >>> index, values = buffer.latest(60)
+    """
+
+    def __init__(self, capacity: int, columns: Sequence[str] = OHLCV_COLUMNS):
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1")
+        self.capacity = capacity
+        self.columns = list(columns)
+        self._values = np.full((2 * capacity, len(self.columns)), np.nan)
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._pos = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """Timestamp of the newest bar, or None when empty."""
+        if self._count == 0:
+            return None
+        return pd.Timestamp(self._times[self._pos + self.capacity - 1])
+
+    def append(self, timestamp: pd.Timestamp, values: Sequence[float]) -> bool:
+        """
+        Append one bar, or replace the newest bar if it has the same timestamp.
+
+        Bars older than the newest stored bar are ignored.
+
+        Returns:
+            True if the buffer changed
+        """
+        ts = _to_naive_ns(timestamp)
+        with self._lock:
+            if self._count:
+                newest = self._pos - 1 if self._pos else self.capacity - 1
+                last_ts = self._times[newest]
+                if ts < last_ts:
+                    return False
+                if ts == last_ts:
+                    # The newest bar was still forming: overwrite it in place
+                    self._write(newest, ts, values)
+                    return True
+            self._write(self._pos, ts, values)
+            self._pos = (self._pos + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            return True
+
+    def _write(self, slot: int, ts: int, values: Sequence[float]) -> None:
+        self._values[slot] = values
+        self._values[slot + self.capacity] = values
+        self._times[slot] = ts
+        self._times[slot + self.capacity] = ts
+
+    def extend(self, df: pd.DataFrame) -> int:
+        """
+        Append every row of an OHLCV frame in timestamp order.
+
+        Returns:
+            Number of bars appended or updated
+        """
+        if df is None or df.empty:
+            return 0
+        values = df[self.columns].to_numpy(dtype=np.float64)
+        changed = 0
+        for ts, row in zip(df.index, values):
+            changed += self.append(ts, row)
+        return changed
+
+    def latest(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return views of the newest ``n`` bars (all stored bars by default).
+
+        Reads of fewer than ``capacity`` bars are zero-copy. A full-window read
+        is copied, because the next append overwrites its first row.
+
+        Returns:
+            Tuple of (datetime64[ns] timestamps, values array of shape (n, columns))
+        """
+        with self._lock:
+            n = self._count if n is None else max(0, min(n, self._count))
+            end = self._pos + self.capacity
+            times = self._times[end - n:end].view("M8[ns]")
+            values = self._values[end - n:end]
+            if n == self.capacity:
+                times, values = times.copy(), values.copy()
+        times.flags.writeable = False
+        values = values.view()
+        values.flags.writeable = False
+        return times, values
+
+    def frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Return the newest ``n`` bars as a DataFrame backed by the buffer views."""
+        times, values = self.latest(n)
+        return pd.DataFrame(
+            values, index=pd.DatetimeIndex(times, name="Datetime"), columns=self.columns, copy=False
+        )
+
+
+class BarSource(ABC):
+    """Source of new bars for a BarStream."""
+
+    @abstractmethod
+    def poll(self, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        """Return bars at or after ``since`` (all available bars when None)."""
+
+
+class PollingBarSource(BarSource):
+    """Poll the market data provider for bars after the newest stored one."""
+
+    def __init__(self, ticker: str, interval: str):
+        self.ticker = ticker
+        self.interval = interval
+
+    def poll(self, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        provider = get_provider()
+        if since is None:
+            df = provider.download(
+                self.ticker, interval=self.interval, period=STREAMING["SEED_PERIOD"][self.interval]
+            )
+        else:
+            df = provider.download(self.ticker, interval=self.interval, start=since)
+        if isinstance(df.columns, pd.MultiIndex):
+            df = df.set_axis(df.columns.get_level_values(0), axis=1, copy=False)
+        return df
+
+
+class ReplayBarSource(BarSource):
+    """
+    Replay recorded bars, releasing ``bars_per_poll`` new bars on each poll.
+
+    Useful for demos, load tests and deterministic streaming tests.
+    """
+
+    def __init__(self, bars: pd.DataFrame, bars_per_poll: int = 1, seed_bars: int = 0):
+        self._bars = bars
+        self._bars_per_poll = bars_per_poll
+        self._cursor = seed_bars
+
+    def poll(self, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        if since is None:
+            return self._bars.iloc[:self._cursor]
+        self._cursor = min(self._cursor + self._bars_per_poll, len(self._bars))
+        return self._bars.iloc[:self._cursor][self._bars.index[:self._cursor] >= _align(since, self._bars.index)]
+
+
+class BarStream:
+    """
+    Keep a ring buffer up to date from a BarSource on a background thread.
+
+    The stream stops itself after ``STREAMING["IDLE_SECONDS"]`` without reads,
+    so abandoned dashboard sessions do not keep polling. It also keeps an
+    IndicatorState in step with the buffer, so the latest indicator values
+    cost O(1) per ingested bar instead of a pass over the whole window.
+
+    Example:
+        >>> stream = BarStream("AAPL", "1m", PollingBarSource("AAPL", "1m"))
+        >>> stream.start()
+        >>> df = stream.frame(120)
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        interval: str,
+        source: BarSource,
+        capacity: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+    ):
+        self.ticker = ticker
+        self.interval = interval
+        self.source = source
+        self.buffer = BarRingBuffer(capacity or STREAMING["CAPACITY"])
+        self.poll_seconds = STREAMING["POLL_SECONDS"] if poll_seconds is None else poll_seconds
+        self.indicators = IndicatorState()
+        self._ingest_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_read = time.time()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll_once(self) -> int:
+        """Fetch new bars from the source into the buffer once."""
+        df = self.source.poll(self.buffer.last_timestamp)
+        if df is None or df.empty:
+            return 0
+        with self._ingest_lock:
+            changed = self._ingest(df)
+        if changed:
+            logger.debug(f"Stream {self.ticker}/{self.interval}: {changed} bars ingested")
+        return changed
+
+    def _ingest(self, df: pd.DataFrame) -> int:
+        if len(self.buffer) == 0:
+            changed = self.buffer.extend(df)
+            self.indicators.seed(df["Close"].to_numpy(dtype=np.float64))
+            return changed
+
+        changed = 0
+        values = df[self.buffer.columns].to_numpy(dtype=np.float64)
+        close_col = self.buffer.columns.index("Close")
+        for ts, row in zip(df.index, values):
+            last = self.buffer.last_timestamp
+            if not self.buffer.append(ts, row):
+                continue
+            changed += 1
+            if _to_naive_ns(ts) == last.value:
+                self.indicators.revise(row[close_col])
+            else:
+                self.indicators.update(row[close_col])
+        return changed
+
+    def latest_indicators(self) -> Dict[str, float]:
+        """Return the indicator values as of the newest buffered bar."""
+        self._last_read = time.time()
+        with self._ingest_lock:
+            return self.indicators.values()
+
+    def start(self) -> "BarStream":
+        """Seed the buffer and start the background polling thread."""
+        if self.running:
+            return self
+        self.poll_once()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"bar-stream-{self.ticker}-{self.interval}", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Started bar stream for {self.ticker} ({self.interval})")
+        return self
+
+    def stop(self) -> None:
+        """Stop the background polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            if time.time() - self._last_read > STREAMING["IDLE_SECONDS"]:
+                logger.info(f"Stopping idle bar stream for {self.ticker} ({self.interval})")
+                break
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"Bar stream poll failed for {self.ticker}: {e}")
+
+    def frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Return the newest ``n`` bars as a read-only DataFrame (see BarRingBuffer.latest)."""
+        self._last_read = time.time()
+        return self.buffer.frame(n)
+
+
+_streams: Dict[Tuple[str, str], BarStream] = {}
+_streams_lock = threading.Lock()
+_starting = SingleFlight()
+
+
+def get_bar_stream(ticker: str, interval: str, source: Optional[BarSource] = None) -> BarStream:
+    """
+    Return the running stream for (ticker, interval), starting one if needed.
+
+    Args:
+        ticker: Stock ticker symbol
+        interval: Intraday interval listed in STREAMING["INTERVALS"]
+        source: Bar source (defaults to polling the market data provider)
+
+    Returns:
+        BarStream shared by every session in the process (stopped and not
+        shared if its seed load returned no bars)
+
+    Raises:
+        ValueError: If the interval is not a streaming interval
+    """
+    if interval not in STREAMING["INTERVALS"]:
+        raise ValueError(f"Streaming is only available for {STREAMING['INTERVALS']}")
+
+    key = (ticker.upper(), interval)
+    with _streams_lock:
+        stream = _streams.get(key)
+    if stream is not None and stream.running:
+        return stream
+    # The seed load runs outside the registry lock; sessions asking for the
+    # same key at once share one start
+    return _starting.do(key, _start_stream, key, source)
+
+
+def _start_stream(key: Tuple[str, str], source: Optional[BarSource]) -> BarStream:
+    with _streams_lock:
+        stream = _streams.get(key)
+    if stream is not None and stream.running:
+        return stream
+
+    ticker, interval = key
+    stream = BarStream(ticker, interval, source or PollingBarSource(ticker, interval))
+    stream.start()
+    if len(stream.buffer) == 0:
+        # Nothing to stream (e.g., unknown ticker): don't keep polling it
+        stream.stop()
+        return stream
+    with _streams_lock:
+        _streams[key] = stream
+    return stream
+
+
+def _to_naive_ns(timestamp: pd.Timestamp) -> int:
+    """Convert a timestamp to tz-naive (exchange-local) nanoseconds."""
+    ts = pd.Timestamp(timestamp)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.value
+
+
+def _align(ts: pd.Timestamp, index: pd.Index) -> pd.Timestamp:
+    tz = getattr(index, "tz", None)
+    return ts.tz_localize(tz) if tz is not None and ts.tz is None else ts
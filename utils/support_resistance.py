@@ -0,0 +1,218 @@
+"""
+Multi-level support/resistance detection from price pivots.
+
+A pivot high is a bar whose High dominates the ``width`` bars on each side
+(a fractal); a pivot low is the mirror image on Low. Pivots whose prices
+lie within a relative tolerance are clustered into one price level, and
+each level is scored by how often price turned there (touches), weighted
+by the volume traded on those turns.
+
+Pivots come from the O(n) rolling max/min kernels in utils.indicators and
+clustering is one sort of the pivot prices plus a binary search per level,
+so a whole history costs O(n + p log p) for p pivots. That is cheap enough
+for chart annotations and for scanning a ticker universe.
+
+Example:
+    >>> levels = find_levels(df)
+    >>> support, resistance = nearest_levels(levels, df["Close"].iloc[-1])
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import SUPPORT_RESISTANCE
+from utils.indicators import rolling_max, rolling_min
+
+LEVEL_COLUMNS = ["level", "kind", "touches", "volume", "strength", "first_touch", "last_touch"]
+
+
+class Pivots(NamedTuple):
+    """Boolean masks of confirmed pivot highs and lows, aligned with the bars."""
+
+    highs: np.ndarray
+    lows: np.ndarray
+
+
+def _centred_pivots(values: np.ndarray, width: int, rolling) -> np.ndarray:
+    """
+    Mask of bars that are the extreme of the ``2 * width + 1`` bars centred on them.
+
+    Equivalent to a centred rolling argmax (argmin) landing on the middle
+    bar, ties resolving to the oldest bar, but built from two O(n) rolling
+    extremes: the bar must equal the centred extreme and strictly beat the
+    ``width`` bars before it.
+    """
+    n = len(values)
+    out = np.zeros(n, dtype=bool)
+    span = 2 * width + 1
+    if n < span:
+        return out
+    centre = rolling(values, span)[span - 1:]          # extreme of bars t-w .. t+w
+    before = rolling(values, width)[width - 1: n - width - 1]  # extreme of bars t-w .. t-1
+    middle = values[width: n - width]
+    with np.errstate(invalid="ignore"):
+        if rolling is rolling_max:
+            out[width: n - width] = (middle == centre) & (middle > before)
+        else:
+            out[width: n - width] = (middle == centre) & (middle < before)
+    return out
+
+
+def find_pivots(high, low, width: Optional[int] = None) -> Pivots:
+    """
+    Detect fractal pivot highs and lows.
+
+    Only confirmed pivots are returned: the last ``width`` bars cannot be
+    pivots yet because their right-hand side has not traded.
+
+    Args:
+        high: 1-D array of High prices
+        low: 1-D array of Low prices
+        width: Bars on each side a pivot must dominate (default
+            SUPPORT_RESISTANCE["PIVOT_WIDTH"])
+
+    Returns:
+        Pivots with boolean masks shaped like the input
+
+    Raises:
+        ValueError: If width < 1
+    """
+    width = SUPPORT_RESISTANCE["PIVOT_WIDTH"] if width is None else width
+    if width < 1:
+        raise ValueError(f"width must be at least 1, got {width}")
+    return Pivots(
+        _centred_pivots(np.asarray(high, dtype=np.float64), width, rolling_max),
+        _centred_pivots(np.asarray(low, dtype=np.float64), width, rolling_min),
+    )
+
+
+def cluster_levels(
+    prices, volumes, positions, tolerance: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group pivot prices into levels within a relative tolerance.
+
+    Prices are sorted once and cut greedily: a level holds every pivot up
+    to ``tolerance`` above its lowest one, so a dense run of pivots never
+    chains into one wide level. Each cut is a binary search (one per
+    level) and per-level aggregates are segment reductions over the
+    sorted order.
+
+    Args:
+        prices: Pivot prices
+        volumes: Volume traded on each pivot bar
+        positions: Bar position of each pivot
+        tolerance: Relative width of a level above its lowest pivot
+            (default SUPPORT_RESISTANCE["TOLERANCE"])
+
+    Returns:
+        Tuple of per-level arrays (level, touches, volume, strength,
+        first_position, last_position); level is the volume-weighted mean
+        price and strength the touch count weighted by relative volume
+    """
+    tolerance = SUPPORT_RESISTANCE["TOLERANCE"] if tolerance is None else tolerance
+    prices = np.asarray(prices, dtype=np.float64)
+    volumes = np.nan_to_num(np.asarray(volumes, dtype=np.float64))
+    positions = np.asarray(positions, dtype=np.int64)
+    if len(prices) == 0:
+        empty = np.empty(0)
+        return empty, empty.astype(np.int64), empty, empty, empty.astype(np.int64), empty.astype(np.int64)
+
+    order = np.argsort(prices, kind="stable")
+    prices, volumes, positions = prices[order], volumes[order], positions[order]
+    cuts = [0]
+    while True:
+        cut = int(np.searchsorted(prices, prices[cuts[-1]] * (1.0 + tolerance), side="right"))
+        if cut >= len(prices):
+            break
+        cuts.append(cut)
+    starts = np.asarray(cuts)
+
+    touches = np.diff(np.r_[starts, len(prices)])
+    volume = np.add.reduceat(volumes, starts)
+    # Without volume every pivot weighs 1, so strength falls back to touches
+    weights = volumes / volumes.mean() if volumes.any() else np.ones_like(volumes)
+    strength = np.add.reduceat(weights, starts)
+    level = np.add.reduceat(prices * weights, starts) / strength
+    first = np.minimum.reduceat(positions, starts)
+    last = np.maximum.reduceat(positions, starts)
+    return level, touches, volume, strength, first, last
+
+
+def find_levels(
+    df: pd.DataFrame,
+    top_k: Optional[int] = None,
+    width: Optional[int] = None,
+    tolerance: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Strongest support/resistance levels over a whole price history.
+
+    Args:
+        df: DataFrame with High, Low, Close and (optionally) Volume columns
+        top_k: Number of levels to return (default SUPPORT_RESISTANCE["TOP_K"];
+            0 returns all)
+        width: Pivot fractal width (default SUPPORT_RESISTANCE["PIVOT_WIDTH"])
+        tolerance: Relative clustering tolerance (default
+            SUPPORT_RESISTANCE["TOLERANCE"])
+
+    Returns:
+        DataFrame with LEVEL_COLUMNS, strongest first. ``kind`` is
+        "support" below the last close and "resistance" at or above it;
+        first_touch/last_touch are index labels of the pivots
+
+    Raises:
+        ValueError: If width < 1
+    """
+    top_k = SUPPORT_RESISTANCE["TOP_K"] if top_k is None else top_k
+    pivots = find_pivots(df["High"], df["Low"], width)
+    high_at, low_at = np.flatnonzero(pivots.highs), np.flatnonzero(pivots.lows)
+    positions = np.concatenate([high_at, low_at])
+    prices = np.concatenate([df["High"].to_numpy()[high_at], df["Low"].to_numpy()[low_at]])
+    if "Volume" in df.columns:
+        volumes = df["Volume"].to_numpy(dtype=np.float64)[positions]
+    else:
+        volumes = np.zeros(len(positions))
+
+    level, touches, volume, strength, first, last = cluster_levels(
+        prices, volumes, positions, tolerance
+    )
+    # Strongest first; more recent levels win ties
+    order = np.lexsort((-last, -strength))
+    if top_k:
+        order = order[:top_k]
+
+    close = float(df["Close"].iloc[-1]) if len(df) else np.nan
+    return pd.DataFrame(
+        {
+            "level": level[order],
+            "kind": np.where(level[order] < close, "support", "resistance"),
+            "touches": touches[order],
+            "volume": volume[order],
+            "strength": strength[order],
+            "first_touch": df.index[first[order]],
+            "last_touch": df.index[last[order]],
+        },
+        columns=LEVEL_COLUMNS,
+    )
+
+
+def nearest_levels(levels: pd.DataFrame, price: float) -> Tuple[float, float]:
+    """
+    Closest level below and at-or-above a price.
+
+    Args:
+        levels: Output of find_levels
+        price: Reference price (usually the last close)
+
+    Returns:
+        Tuple of (support, resistance); NaN where no level exists on that side
+    """
+    values = levels["level"].to_numpy()
+    below = values[values < price]
+    above = values[values >= price]
+    support = below.max() if len(below) else np.nan
+    resistance = above.min() if len(above) else np.nan
+    return float(support), float(resistance)
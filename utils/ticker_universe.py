@@ -0,0 +1,249 @@
+"""
+Local ticker universe for fast symbol validation and lookup.
+
+Loads a symbol index (symbol -> name, exchange, sector) from a CSV file once
+per process, so bad tickers can be rejected before any upstream request:
+
+- Malformed symbols are always rejected
+- Symbols that recently returned no data are remembered and rejected
+- In strict mode, symbols missing from the universe are rejected
+
+The bundled data/ticker_universe.csv lists common US stocks, ETFs, indices
+and crypto pairs. Point TICKER_UNIVERSE_PATH at a complete exchange listing
+(same columns) before enabling TICKER_UNIVERSE_STRICT.
+"""
+
+import bisect
+import csv
+import difflib
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from utils.config import TICKER_UNIVERSE
+from utils.exceptions import InvalidTickerError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Yahoo Finance symbols: AAPL, BRK-B, VOD.L, ^GSPC, EURUSD=X, GC=F
+_SYMBOL_PATTERN = re.compile(r"^\^?[A-Z0-9][A-Z0-9.\-=]{0,19}$")
+
+
+class TickerInfo(NamedTuple):
+    """One entry of the ticker universe."""
+
+    symbol: str
+    name: str
+    exchange: str
+    sector: str
+
+
+class TickerUniverse:
+    """
+    In-memory symbol index with O(1) membership and prefix/fuzzy search.
+
+    Example:
+        >>> universe = TickerUniverse.from_csv("data/ticker_universe.csv")
+        >>> "AAPL" in universe
+        True
+        >>> [info.symbol for info in universe.search("micro", limit=3)]
+        ['AMD', 'MSFT', 'MU']
+    """
+
+    def __init__(self, records: Iterable[TickerInfo]):
+        self._by_symbol: Dict[str, TickerInfo] = {}
+        for record in records:
+            self._by_symbol[record.symbol.upper()] = record
+        self._symbols = sorted(self._by_symbol)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "TickerUniverse":
+        """
+        Load a universe from a CSV file with symbol, name, exchange and sector columns.
+
+        Args:
+            path: Path to the CSV file
+
+        Returns:
+            TickerUniverse (empty if the file does not exist)
+        """
+        if not os.path.exists(path):
+            logger.warning(f"Ticker universe file not found: {path}")
+            return cls([])
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            records = [
+                TickerInfo(
+                    symbol=row["symbol"].strip().upper(),
+                    name=(row.get("name") or "").strip(),
+                    exchange=(row.get("exchange") or "").strip(),
+                    sector=(row.get("sector") or "").strip(),
+                )
+                for row in csv.DictReader(f)
+                if row.get("symbol")
+            ]
+        logger.info(f"Loaded {len(records)} symbols from {path}")
+        return cls(records)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._by_symbol
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def get(self, symbol: str) -> Optional[TickerInfo]:
+        """Return the entry for a symbol, or None if it is not in the universe."""
+        return self._by_symbol.get(symbol.upper())
+
+    def symbols(
+        self, exchanges: Optional[Iterable[str]] = None, sector: Optional[str] = None
+    ) -> List[str]:
+        """Sorted symbols, optionally limited to some exchanges and/or one sector."""
+        exchanges = None if exchanges is None else set(exchanges)
+        return [
+            symbol
+            for symbol in self._symbols
+            if (exchanges is None or self._by_symbol[symbol].exchange in exchanges)
+            and (sector is None or self._by_symbol[symbol].sector == sector)
+        ]
+
+    def search(self, query: str, limit: int = 10) -> List[TickerInfo]:
+        """
+        Find symbols by symbol prefix, then by company name, then by fuzzy match.
+
+        Args:
+            query: Partial symbol or company name (case-insensitive)
+            limit: Maximum number of results
+
+        Returns:
+            Matching entries, best matches first
+        """
+        query = query.strip()
+        if not query or limit <= 0:
+            return []
+
+        matches: List[str] = []
+        prefix = query.upper()
+        start = bisect.bisect_left(self._symbols, prefix)
+        for symbol in self._symbols[start:]:
+            if not symbol.startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(symbol)
+
+        if len(matches) < limit:
+            needle = query.lower()
+            for symbol in self._symbols:
+                if symbol not in matches and needle in self._by_symbol[symbol].name.lower():
+                    matches.append(symbol)
+                    if len(matches) >= limit:
+                        break
+
+        if len(matches) < limit:
+            for symbol in self.suggest(prefix, limit=limit):
+                if symbol not in matches:
+                    matches.append(symbol)
+
+        return [self._by_symbol[symbol] for symbol in matches[:limit]]
+
+    def suggest(self, symbol: str, limit: int = 3) -> List[str]:
+        """Return the symbols closest to a (possibly misspelled) symbol."""
+        return difflib.get_close_matches(symbol.upper(), self._symbols, n=limit, cutoff=0.6)
+
+
+_universes: Dict[str, TickerUniverse] = {}
+_universe_lock = threading.Lock()
+
+_rejected: Dict[str, float] = {}
+_rejected_lock = threading.Lock()
+
+
+def get_ticker_universe() -> TickerUniverse:
+    """Return the configured ticker universe, loading it on first use."""
+    path = TICKER_UNIVERSE["PATH"]
+    universe = _universes.get(path)
+    if universe is None:
+        with _universe_lock:
+            universe = _universes.get(path)
+            if universe is None:
+                universe = TickerUniverse.from_csv(path)
+                _universes[path] = universe
+    return universe
+
+
+def mark_invalid(ticker: str) -> None:
+    """Remember that a ticker returned no data so it is rejected locally for a while."""
+    with _rejected_lock:
+        _rejected[ticker.strip().upper()] = time.time() + TICKER_UNIVERSE["NEGATIVE_TTL_SECONDS"]
+
+
+def clear_rejected() -> None:
+    """Forget every ticker recorded with mark_invalid()."""
+    with _rejected_lock:
+        _rejected.clear()
+
+
+def _recently_rejected(symbol: str) -> bool:
+    expires_at = _rejected.get(symbol)
+    if expires_at is None:
+        return False
+    if expires_at < time.time():
+        with _rejected_lock:
+            _rejected.pop(symbol, None)
+        return False
+    return True
+
+
+def validate_ticker(ticker: str) -> str:
+    """
+    Normalize a ticker symbol and reject it if it cannot be valid, without network I/O.
+
+    Args:
+        ticker: Ticker symbol as entered by the user
+
+    Returns:
+        Normalized (stripped, upper-case) symbol
+
+    Raises:
+        InvalidTickerError: If the symbol is empty, malformed, recently returned
+            no data, or (in strict mode) is missing from the universe
+
+    Example:
+        >>> validate_ticker(" aapl ")
+        'AAPL'
+    """
+    if not ticker or not ticker.strip():
+        raise InvalidTickerError(ticker or "", "Ticker symbol cannot be empty")
+
+    symbol = ticker.strip().upper()
+    if not _SYMBOL_PATTERN.match(symbol):
+        raise InvalidTickerError(symbol, f"Invalid ticker symbol format: '{symbol}'")
+
+    universe = get_ticker_universe()
+    if symbol in universe:
+        return symbol
+
+    if _recently_rejected(symbol):
+        raise InvalidTickerError(symbol, _unknown_message(symbol, universe, "returned no data"))
+    if TICKER_UNIVERSE["STRICT"] and len(universe):
+        raise InvalidTickerError(symbol, _unknown_message(symbol, universe, "is not a known symbol"))
+    return symbol
+
+
+def is_valid_ticker(ticker: str) -> bool:
+    """Return True if validate_ticker() accepts the ticker."""
+    try:
+        validate_ticker(ticker)
+        return True
+    except InvalidTickerError:
+        return False
+
+
+def _unknown_message(symbol: str, universe: TickerUniverse, reason: str) -> str:
+    message = f"Ticker '{symbol}' {reason}"
+    suggestions = universe.suggest(symbol)
+    if suggestions:
+        message += f". Did you mean {', '.join(suggestions)}?"
+    return message